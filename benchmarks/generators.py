@@ -0,0 +1,145 @@
+# benchmarks/generators.py
+
+"""
+Générateurs de graphes synthétiques pour les benchmarks.
+
+Chaque générateur reçoit un nombre d'arêtes visé et renvoie un tuple (n, src, dst) :
+le nombre de sommets (identifiants 0..n-1) et les deux tableaux d'extrémités des arêtes,
+au même format que loader.read_edge_arrays. Les tirages sont reproductibles (graine fixe).
+"""
+
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, les générateurs produisent des tableaux du module array
+    np = None
+
+
+def _arrays(src, dst):
+    if np is not None:
+        return np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+    return array("q", src), array("q", dst)
+
+
+def path_graph(num_edges, seed=0):
+    """
+    Chemin 0 - 1 - ... - num_edges : le pire cas pour la profondeur de l'arbre DFS.
+    """
+    n = num_edges + 1
+    if np is not None:
+        src = np.arange(num_edges, dtype=np.int64)
+        return n, src, src + 1
+    return n, array("q", range(num_edges)), array("q", range(1, n))
+
+
+def grid_graph(num_edges, seed=0):
+    """
+    Grille carrée k x k (environ 2k² arêtes) : aucun point d'articulation.
+    """
+    k = max(2, int((num_edges / 2) ** 0.5))
+    n = k * k
+    if np is not None:
+        ids = np.arange(n, dtype=np.int64).reshape(k, k)
+        src = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+        dst = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+        return n, src, dst
+    src, dst = array("q"), array("q")
+    for r in range(k):
+        for c in range(k):
+            v = r * k + c
+            if c + 1 < k:
+                src.append(v)
+                dst.append(v + 1)
+            if r + 1 < k:
+                src.append(v)
+                dst.append(v + k)
+    return n, src, dst
+
+
+def tree_graph(num_edges, seed=0):
+    """
+    Arbre aléatoire récursif : chaque sommet v > 0 est relié à un sommet tiré dans 0..v-1.
+    Tous les sommets internes sont des points d'articulation.
+    """
+    n = num_edges + 1
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        dst = np.arange(1, n, dtype=np.int64)
+        src = (rng.random(num_edges) * dst).astype(np.int64)
+        return n, src, dst
+    rng = random.Random(seed)
+    return n, array("q", (rng.randrange(v) for v in range(1, n))), array("q", range(1, n))
+
+
+def barabasi_albert_graph(num_edges, seed=0, m=3):
+    """
+    Graphe de Barabási–Albert (attachement préférentiel) : chaque nouveau sommet est relié
+    à m sommets distincts tirés proportionnellement à leur degré.
+    """
+    rng = random.Random(seed)
+    n = max(m + 1, num_edges // m + 1)
+    src, dst = [], []
+    # Liste des extrémités d'arêtes : un tirage uniforme suit la loi des degrés
+    repeated = list(range(m))
+    for v in range(m, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(repeated) if len(repeated) > m else rng.randrange(v))
+        for t in targets:
+            src.append(v)
+            dst.append(t)
+            repeated.append(t)
+        repeated.extend([v] * m)
+    return (n,) + _arrays(src, dst)
+
+
+def caida_like_graph(num_edges, seed=0):
+    """
+    Topologie proche des graphes d'AS de CAIDA : un cœur dense à attachement préférentiel
+    (environ 20 % des sommets) et une périphérie de sommets de degré 1 ou 2, accrochés au cœur
+    seuls ou en courtes chaînes. La plupart des sommets du cœur sont des points d'articulation.
+    """
+    rng = random.Random(seed)
+    core_edges = num_edges // 2
+    n, core_src, core_dst = barabasi_albert_graph(core_edges, seed, m=2)
+    src, dst = list(core_src), list(core_dst)
+    repeated = src + dst
+    while len(src) < num_edges:
+        anchor = rng.choice(repeated)
+        # Chaîne de 1 à 3 sommets, parfois rattachée à un second sommet du cœur (multi-homing)
+        previous = anchor
+        for _ in range(rng.choice((1, 1, 1, 2, 3))):
+            src.append(previous)
+            dst.append(n)
+            previous = n
+            n += 1
+        second = rng.choice(repeated)
+        if rng.random() < 0.1 and second != anchor:
+            src.append(previous)
+            dst.append(second)
+    return (n,) + _arrays(src[:num_edges], dst[:num_edges])
+
+
+GENERATORS = {
+    "ba": barabasi_albert_graph,
+    "grid": grid_graph,
+    "path": path_graph,
+    "tree": tree_graph,
+    "caida": caida_like_graph,
+}
+
+
+def generate(kind, num_edges, seed=0):
+    """
+    Génère un graphe synthétique.
+
+    :param kind: Type de topologie ("ba", "grid", "path", "tree" ou "caida").
+    :param num_edges: Nombre d'arêtes visé (approché pour la grille).
+    :param seed: Graine du générateur pseudo-aléatoire.
+    :return: Tuple (n, src, dst).
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f"Type de graphe inconnu : {kind} (attendu : {', '.join(GENERATORS)})")
+    return GENERATORS[kind](int(num_edges), seed)
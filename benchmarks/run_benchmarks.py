@@ -0,0 +1,253 @@
+# benchmarks/run_benchmarks.py
+
+"""
+Banc d'essai des performances : génère des graphes synthétiques, chronomètre séparément
+chaque phase (lecture du fichier, construction CSR, DFS complet, actualisations incrémentales,
+sauvegarde et chargement de l'état, conversion et DFS du mode semi-externe), relève le volume
+d'entrées-sorties du mode semi-externe, compare l'actualisation par lot à l'application des
+mêmes modifications arête par arête, vérifie les points d'articulation avec NetworkX et écrit
+les résultats au format JSON pour les comparer d'une exécution à l'autre.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--kinds ba grid path tree caida] [--sizes 1e3 1e4 1e5]
+                                        [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generators import GENERATORS, generate
+from graph import CSRGraph
+from loader import read_edge_arrays, write_binary_edges
+from dfs import articulation_dfs
+from updater import incremental_update_batch, advanced_incremental_update_edge_addition, incremental_update_edge_removal
+from state_manager import save_graph_state, load_graph_state
+from external import convert_to_adjacency, external_articulation_points
+
+try:
+    import networkx as nx
+except ImportError:  # La vérification et la référence NetworkX sont alors ignorées
+    nx = None
+
+RESULTS_VERSION = 3
+
+
+def timed(phases, name, repeat, func, *args):
+    """
+    Exécute func(*args) repeat fois et enregistre dans phases[name] la meilleure durée
+    (time.perf_counter). Renvoie le résultat de la dernière exécution.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    phases[name] = best
+    return result
+
+
+def write_text_edges(path, n, src, dst, block=1 << 20):
+    """
+    Écrit un fichier d'arêtes au format texte "N M" puis "u v" par ligne.
+    """
+    with open(path, "w") as f:
+        f.write(f"{n} {len(src)}\n")
+        for i in range(0, len(src), block):
+            pairs = zip(src[i:i + block].tolist(), dst[i:i + block].tolist())
+            f.write("".join(f"{u} {v}\n" for u, v in pairs))
+
+
+def reference_articulation_points(n, edges):
+    g = nx.Graph()
+    g.add_nodes_from(range(n))
+    g.add_edges_from(edges)
+    return set(nx.articulation_points(g))
+
+
+def run_incremental(graph, state, added, removed):
+    disc, low, parent, ap = state
+    return incremental_update_batch(graph, added, removed, disc, low, parent, ap)[0]
+
+
+def run_edge_by_edge(graph, state, added, removed):
+    """
+    Référence de l'actualisation par lot : les mêmes modifications appliquées une arête à la
+    fois (advanced_incremental_update_edge_addition, incremental_update_edge_removal), le
+    graphe étant modifié avant chaque actualisation.
+    """
+    disc, low, parent, ap = state
+    for u, v in added:
+        graph.add_edge(u, v)
+        ap = advanced_incremental_update_edge_addition(graph, u, v, disc, low, parent, ap)[0]
+    for u, v in removed:
+        graph.remove_edge(u, v)
+        ap = incremental_update_edge_removal(graph, u, v, disc, low, parent, ap)[0]
+    return ap
+
+
+def pick_new_edges(graph, n, count, rng):
+    added = set()
+    while len(added) < count and n > 1:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v and v not in graph.adj[u]:
+            added.add((min(u, v), max(u, v)))
+    return sorted(added)
+
+
+def benchmark_case(kind, num_edges, args, workdir):
+    """
+    Chronomètre toutes les phases pour un graphe généré.
+
+    :return: Dictionnaire de résultats (paramètres, taille réelle, durées par phase, vérification).
+    """
+    rng = random.Random(args.seed)
+    n, src, dst = generate(kind, num_edges, args.seed)
+    text_path = os.path.join(workdir, f"{kind}_{num_edges}.txt")
+    binary_path = os.path.join(workdir, f"{kind}_{num_edges}.bin")
+    state_path = os.path.join(workdir, f"{kind}_{num_edges}.state")
+    adjacency_path = os.path.join(workdir, f"{kind}_{num_edges}.adj")
+    write_text_edges(text_path, n, src, dst)
+    write_binary_edges(binary_path, n, src, dst)
+
+    phases = {}
+    repeat = args.repeat
+    timed(phases, "parse_text", repeat, read_edge_arrays, text_path)
+    _, src, dst = timed(phases, "parse_binary", repeat, read_edge_arrays, binary_path)
+    csr = timed(phases, "build_csr", repeat, CSRGraph.from_edge_arrays, n, src, dst)
+    disc, low, parent, ap = timed(phases, "full_dfs", repeat, articulation_dfs, csr)
+    timed(phases, "state_save", repeat, save_graph_state, csr, disc, low, parent, state_path)
+    timed(phases, "state_load", repeat, load_graph_state, state_path)
+    timed(phases, "external_convert", repeat, convert_to_adjacency, text_path, adjacency_path)
+    external_ap, _, io = timed(phases, "external_dfs", repeat, external_articulation_points, adjacency_path)
+
+    result = {
+        "kind": kind,
+        "target_edges": num_edges,
+        "vertices": csr.num_vertices,
+        "edges": csr.num_edges,
+        "articulation_points": len(ap),
+        "phases": phases,
+        "io": io,
+        "check": None,
+        "external_check": external_ap == ap,
+        "batch_speedup": None,
+        "batch_check": None,
+    }
+    check = nx is not None and csr.num_edges <= args.check_limit
+    if check:
+        edges = csr.edges()
+        expected = timed(phases, "networkx", 1, reference_articulation_points, csr.num_vertices, edges)
+        result["check"] = expected == ap
+
+    if args.changes and csr.num_edges <= args.incremental_limit:
+        graph = csr.to_graph()
+        state = articulation_dfs(graph)
+        # Copie du graphe et de l'état pour les mêmes modifications appliquées arête par arête
+        each_graph = csr.to_graph()
+        each_state = tuple(dict(m) for m in state[:3]) + (set(state[3]),)
+        added = pick_new_edges(graph, csr.num_vertices, args.changes, rng)
+        for u, v in added:
+            graph.add_edge(u, v)
+        state = state[:3] + (timed(phases, "incremental_add", 1, run_incremental, graph, state, added, []),)
+        each_state = each_state[:3] + (timed(phases, "incremental_add_each", 1, run_edge_by_edge,
+                                             each_graph, each_state, added, []),)
+        removed = rng.sample(graph.edges(), min(args.changes, csr.num_edges))
+        for u, v in removed:
+            graph.remove_edge(u, v)
+        new_ap = timed(phases, "incremental_remove", 1, run_incremental, graph, state, [], removed)
+        each_ap = timed(phases, "incremental_remove_each", 1, run_edge_by_edge, each_graph, each_state, [], removed)
+        result["batch_speedup"] = {
+            change: phases[f"incremental_{change}_each"] / phases[f"incremental_{change}"]
+            for change in ("add", "remove") if phases[f"incremental_{change}"] > 0
+        }
+        result["batch_check"] = state[3] == each_state[3] and new_ap == each_ap
+        if check:
+            result["check"] = result["check"] and new_ap == reference_articulation_points(
+                csr.num_vertices, graph.edges())
+    return result
+
+
+def compare_results(previous, current):
+    """
+    Affiche, pour chaque cas commun aux deux exécutions, le rapport des durées par phase
+    (ancienne durée / nouvelle durée : > 1 signifie plus rapide).
+    """
+    old = {(r["kind"], r["target_edges"]): r["phases"] for r in previous["results"]}
+    for r in current["results"]:
+        key = (r["kind"], r["target_edges"])
+        if key not in old:
+            continue
+        ratios = [f"{phase}={old[key][phase] / t:.2f}x" for phase, t in r["phases"].items()
+                  if phase in old[key] and t > 0]
+        print(f"{key[0]:>6} {key[1]:>10} : " + " ".join(ratios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de la détection des points d'articulation.")
+    parser.add_argument("--kinds", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS),
+                        help="Topologies à générer")
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e3, 1e4, 1e5],
+                        help="Nombres d'arêtes visés (de 1e3 à 1e7)")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions par phase (meilleure durée retenue)")
+    parser.add_argument("--changes", type=int, default=10,
+                        help="Nombre d'arêtes ajoutées puis supprimées pour les phases incrémentales")
+    parser.add_argument("--check-limit", type=float, default=1e6,
+                        help="Taille maximale (en arêtes) vérifiée avec NetworkX")
+    parser.add_argument("--incremental-limit", type=float, default=1e6,
+                        help="Taille maximale (en arêtes) des phases incrémentales")
+    parser.add_argument("--seed", type=int, default=0, help="Graine des générateurs")
+    parser.add_argument("--output", default="benchmark_results.json", help="Fichier JSON de résultats")
+    parser.add_argument("--compare", help="Fichier JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for kind in args.kinds:
+            for size in args.sizes:
+                result = benchmark_case(kind, int(size), args, workdir)
+                results.append(result)
+                timings = " ".join(f"{phase}={t:.4f}s" for phase, t in result["phases"].items())
+                print(f"{kind:>6} {result['edges']:>10} arêtes, {len(result['phases'])} phases, "
+                      f"vérification={result['check']} : {timings}")
+                print(f"{'':>6} mode semi-externe : {result['io']['bytes_read']} octets lus, "
+                      f"fichier d'adjacence {result['io']['file_bytes']} octets, "
+                      f"identique={result['external_check']}")
+                if result["batch_speedup"] is not None:
+                    speedups = " ".join(f"{change}={s:.2f}x" for change, s in result["batch_speedup"].items())
+                    print(f"{'':>6} actualisation par lot / arête par arête : {speedups}, "
+                          f"identique={result['batch_check']}")
+
+    report = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": getattr(sys.modules.get("numpy"), "__version__", None),
+        "networkx": getattr(nx, "__version__", None),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare_results(json.load(f), report)
+    if any(r["check"] is False or not r["external_check"] or r["batch_check"] is False for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# src/batch.py
+
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from instrumentation import metrics
+from interning import IdInterner
+from state_manager import load_state_arrays
+from main import run_edge_file
+
+EDGE_PATTERNS = ("*.txt", "*.txt.gz", "*.edges")  # Fichiers d'arêtes retenus dans un répertoire
+CSV_FIELDS = ("file", "status", "vertices", "edges", "num_articulation_points", "num_bridges",
+              "updated_nodes", "seconds", "articulation_points", "error")
+
+
+def collect_files(inputs):
+    """
+    Développe les entrées de la ligne de commande en liste de fichiers d'arêtes : un répertoire
+    donne ses fichiers EDGE_PATTERNS, un motif glob ses correspondances, un fichier lui-même.
+
+    :param inputs: Chemins de répertoires, motifs glob ou fichiers.
+    :return: Liste triée et sans doublon des fichiers.
+    """
+    files = set()
+    for entry in inputs:
+        if os.path.isdir(entry):
+            for pattern in EDGE_PATTERNS:
+                files.update(glob.glob(os.path.join(entry, pattern)))
+        elif os.path.isfile(entry):
+            files.add(entry)
+        else:
+            files.update(path for path in glob.glob(entry) if os.path.isfile(path))
+    return sorted(files)
+
+
+def analyze_file(graph_file, intern_ids=False):
+    """
+    Traite un fichier d'arêtes comme main.py (état binaire <base>.state lu, mis à jour puis
+    sauvegardé) sans rien afficher, et résume le résultat. Exécutée dans un processus du pool.
+
+    :return: Dictionnaire sérialisable : fichier, statut ("ok", "unchanged" si l'empreinte du
+             fichier est inchangée, "error"), tailles, points d'articulation, ponts, nombre de
+             nœuds recalculés, durée totale et durée des phases (voir instrumentation).
+    """
+    base = os.path.splitext(graph_file)[0]
+    state_file, ids_file = base + ".state", base + ".ids"
+    args = argparse.Namespace(graph_file=graph_file, show_graph=False, render=None, workers=1,
+                              intern_ids=intern_ids)
+    enabled, verbose = metrics.enabled, metrics.verbose
+    metrics.configure(enabled=True)
+    metrics.reset()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            graph, ap, bridges, updated_nodes, _ = run_edge_file(args, state_file, base + ".json", ids_file)
+        header = load_state_arrays(state_file, ())
+    except (OSError, ValueError) as e:
+        return {"file": graph_file, "status": "error", "error": str(e),
+                "seconds": time.perf_counter() - start}
+    finally:
+        phases = dict(metrics.phases)
+        metrics.configure(enabled, verbose)
+    interner = IdInterner.load(ids_file)
+    return {
+        "file": graph_file,
+        "status": "unchanged" if graph is None else "ok",
+        "vertices": header["num_vertices"],
+        "edges": header["num_edges"],
+        "num_articulation_points": len(ap),
+        "num_bridges": len(bridges),
+        "updated_nodes": len(updated_nodes),
+        "articulation_points": interner.externals(ap) if interner else sorted(ap),
+        "bridges": interner.external_edges(bridges) if interner else bridges,
+        "seconds": time.perf_counter() - start,
+        "phases": phases,
+    }
+
+
+def run_batch(files, workers=1, intern_ids=False):
+    """
+    Traite les fichiers d'arêtes, en parallèle sur un pool de processus si workers > 1.
+    Chaque fichier a son propre état : les traitements sont indépendants.
+
+    :return: Liste des résumés (voir analyze_file), dans l'ordre des fichiers.
+    """
+    if workers <= 1 or len(files) <= 1:
+        return [analyze_file(path, intern_ids) for path in files]
+    chunksize = max(1, len(files) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze_file, files, [intern_ids] * len(files), chunksize=chunksize))
+
+
+def write_report(results, report_file, elapsed, workers):
+    """
+    Écrit le rapport consolidé : CSV si report_file se termine par ".csv" (une ligne par
+    fichier, points d'articulation séparés par des espaces), JSON sinon ("-" pour la sortie
+    standard) avec la liste des résumés et un bilan global.
+    """
+    if report_file.endswith(".csv"):
+        with open(report_file, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for result in results:
+                row = dict(result, seconds=f"{result['seconds']:.6f}")
+                row["articulation_points"] = " ".join(map(str, result.get("articulation_points", ())))
+                writer.writerow(row)
+        return
+    report = {
+        "summary": {
+            "files": len(results),
+            "errors": sum(result["status"] == "error" for result in results),
+            "workers": workers,
+            "seconds": elapsed,
+        },
+        "files": results,
+    }
+    if report_file == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    with open(report_file, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def main():
+    """
+    Traitement par lots : points d'articulation de nombreux fichiers d'arêtes (un par région,
+    par exemple) en un seul lancement, au lieu d'une boucle shell qui relance l'interpréteur
+    pour chaque fichier. Les fichiers sont répartis sur un pool de processus et les résultats
+    réunis dans un rapport JSON ou CSV.
+
+    Usage:
+         python src/batch.py <répertoire | motif | fichier>... [--workers N] [--report FICHIER]
+                             [--intern-ids]
+    """
+    parser = argparse.ArgumentParser(description="Points d'articulation de plusieurs fichiers d'arêtes.")
+    parser.add_argument("inputs", nargs="+", help="Répertoires, motifs glob (\"data/*.txt\") ou fichiers d'arêtes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Nombre de processus (par défaut : nombre de cœurs)")
+    parser.add_argument("--report", default="-", metavar="FICHIER",
+                        help="Rapport consolidé, .json ou .csv (\"-\" : JSON sur la sortie standard)")
+    parser.add_argument("--intern-ids", action="store_true",
+                        help="Identifiants de sommets quelconques (voir main.py --intern-ids)")
+    args = parser.parse_args()
+
+    files = collect_files(args.inputs)
+    if not files:
+        parser.exit(1, "Erreur : aucun fichier d'arêtes trouvé\n")
+    start = time.perf_counter()
+    results = run_batch(files, args.workers, args.intern_ids)
+    elapsed = time.perf_counter() - start
+    for result in results:
+        if result["status"] == "error":
+            print(f"{result['file']} : erreur : {result['error']}", file=sys.stderr)
+        else:
+            print(f"{result['file']} : {result['num_articulation_points']} point(s) d'articulation, "
+                  f"{result['seconds']:.3f} s", file=sys.stderr)
+    print(f"{len(files)} fichier(s) traité(s) en {elapsed:.3f} s", file=sys.stderr)
+    write_report(results, args.report, elapsed, args.workers)
+    sys.exit(1 if any(result["status"] == "error" for result in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# src/block_cut_tree.py
+
+from dfs import biconnected_dfs
+from lca import AncestorIndex
+
+class BlockCutTree:
+    """
+    Arbre blocs-points de coupure (block-cut tree) d'un graphe non orienté.
+
+    Chaque composante biconnexe (bloc) et chaque point d'articulation forme un nœud de
+    l'arbre ; un point d'articulation est relié aux blocs qui le contiennent. Les points
+    d'articulation qui séparent u de v sont exactement ceux situés sur le chemin entre
+    leurs nœuds dans cet arbre. Un AncestorIndex sur l'arbre enraciné permet de trouver ce
+    chemin (via le LCA) ou de tester un point d'articulation donné en O(log profondeur).
+
+    Les nœuds de l'arbre sont des entiers : les blocs 0..B-1, puis les points d'articulation.
+    """
+
+    def __init__(self, ap, edge_component):
+        """
+        :param ap: Ensemble des points d'articulation.
+        :param edge_component: Dictionnaire arête (u, v) -> numéro de composante biconnexe
+                               (tel que renvoyé par biconnected_dfs).
+        """
+        self.num_blocks = max(edge_component.values(), default=-1) + 1
+        self.cut_vertices = sorted(ap)
+        self.cut_node = {a: self.num_blocks + i for i, a in enumerate(self.cut_vertices)}
+        # Bloc unique de chaque sommet qui n'est pas un point d'articulation
+        self.block_of = {}
+
+        adj = [set() for _ in range(self.num_blocks + len(self.cut_vertices))]
+        for edge, block in edge_component.items():
+            for v in edge:
+                node = self.cut_node.get(v)
+                if node is None:
+                    self.block_of[v] = block
+                else:
+                    adj[block].add(node)
+                    adj[node].add(block)
+
+        # Enracinement itératif de chaque arbre de la forêt
+        tree_parent = {}
+        for start in range(len(adj)):
+            if start in tree_parent:
+                continue
+            tree_parent[start] = None
+            stack = [start]
+            while stack:
+                node = stack.pop()
+                for other in adj[node]:
+                    if other not in tree_parent:
+                        tree_parent[other] = node
+                        stack.append(other)
+        self.parent = tree_parent
+        self.index = AncestorIndex.build(tree_parent)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Construit l'arbre blocs-points de coupure d'un graphe en un seul parcours DFS.
+
+        :param graph: Instance de Graph ou de CSRGraph.
+        :return: Instance de BlockCutTree.
+        """
+        _, _, _, ap, _, edge_component = biconnected_dfs(graph)
+        return cls(ap, edge_component)
+
+    def node_of(self, v):
+        """
+        Renvoie le nœud de l'arbre représentant le sommet v, ou None pour un sommet isolé.
+        """
+        node = self.cut_node.get(v)
+        return self.block_of.get(v) if node is None else node
+
+    def separators(self, u, v):
+        """
+        Renvoie les points d'articulation dont la suppression sépare u de v.
+
+        :return: Liste triée des points d'articulation (u et v exclus), ou None si u et v
+                 ne sont pas dans la même composante connexe.
+        """
+        if u == v:
+            return []
+        x, y = self.node_of(u), self.node_of(v)
+        if x is None or y is None:
+            return None
+        top = self.index.lca(x, y)
+        if top is None:
+            return None
+        parent = self.parent
+        path = [top]
+        for node in (x, y):
+            while node != top:
+                path.append(node)
+                node = parent[node]
+        cut_vertices, offset = self.cut_vertices, self.num_blocks
+        return sorted(cut_vertices[node - offset] for node in path
+                      if node >= offset and cut_vertices[node - offset] not in (u, v))
+
+    def separates(self, a, u, v):
+        """
+        Indique si la suppression du sommet a sépare u de v (u et v connectés, a distinct des deux).
+        """
+        c = self.cut_node.get(a)
+        if c is None or a == u or a == v:
+            return False
+        x, y = self.node_of(u), self.node_of(v)
+        if x is None or y is None:
+            return False
+        index = self.index
+        top = index.lca(x, y)
+        if top is None:
+            return False
+        return index.is_ancestor(top, c) and (index.is_ancestor(c, x) or index.is_ancestor(c, y))
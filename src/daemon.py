@@ -0,0 +1,409 @@
+# src/daemon.py
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+from loader import load_graph
+from dfs import articulation_dfs, count_children, bridges_from_state
+from lca import AncestorIndex
+from updater import incremental_update_batch, register_vertices
+from instrumentation import metrics
+from dfs_state import DFSState
+from state_manager import load_graph_state, save_graph_state, get_dfs_state, get_articulation_state, get_ancestor_index
+from state_manager import as_dfs_state
+from history import HistoryStore
+from verification import ShadowVerifier, MODES
+
+MAX_VERTEX = 2 ** 63 - 1  # Sommets rangés en entiers signés sur 8 octets (tableaux "q" du DFSState)
+
+class _Snapshot:
+    """
+    Copie figée des sommets et des arêtes du graphe, sauvegardée hors du verrou.
+    """
+
+    def __init__(self, vertices, edges):
+        self._vertices = vertices
+        self._edges = edges
+
+    def vertices(self):
+        return self._vertices
+
+    def edges(self):
+        return self._edges
+
+
+class GraphDaemon:
+    """
+    Service résident : le graphe et l'état DFS (disc, low, parent, points d'articulation,
+    nombre d'enfants, index des ancêtres) sont chargés une seule fois puis gardés en mémoire,
+    l'état dans les tableaux compacts d'un DFSState dont les vues servent aux moteurs.
+
+    Les modifications d'arêtes (commandes "+ u v" / "- u v", ou nouvelle version du fichier
+    surveillé) sont appliquées par l'actualisation incrémentale, et les requêtes sont servies
+    directement depuis la mémoire. L'état est sauvegardé périodiquement par un thread de
+    checkpoint, uniquement s'il a changé depuis la dernière sauvegarde ; chaque checkpoint
+    peut aussi être ajouté à l'historique des versions.
+
+    Avec un vérificateur (verification.ShadowVerifier), un échantillon des actualisations est
+    contrôlé en arrière-plan par un DFS complet ; une divergence remplace l'état résident par
+    celui du DFS complet (ou par un recalcul si l'état a changé depuis la copie vérifiée).
+    """
+
+    def __init__(self, file_path, state_file=None, workers=1, history_file=None, verifier=None):
+        """
+        :param file_path: Fichier d'arêtes (texte, gzip ou binaire).
+        :param state_file: Fichier d'état (par défaut, le fichier d'arêtes avec l'extension .state).
+        :param workers: Nombre de processus pour un éventuel DFS complet.
+        :param history_file: Fichier d'historique des versions (history.HistoryStore), ou None.
+        :param verifier: ShadowVerifier sans fonction de réparation (celle du service est installée), ou None.
+        """
+        self.file_path = file_path
+        self.state_file = state_file or os.path.splitext(file_path)[0] + ".state"
+        self.workers = workers
+        self.history = HistoryStore(history_file) if history_file else None
+        self.verifier = verifier
+        if verifier is not None:
+            verifier.repair = self._repair
+        self.lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self.version = 0
+        self.saved_version = 0
+        self._stop = threading.Event()
+        self._threads = []
+        self._file_signature = None
+        with metrics.phase("load"):
+            self.graph = load_graph(file_path)
+            self._file_signature = self._stat_file()
+            self._load_state()
+
+    # --- Chargement et état ---
+
+    def _stat_file(self):
+        st = os.stat(self.file_path)
+        return st.st_mtime_ns, st.st_size
+
+    def _full_recompute(self):
+        if self.workers > 1:
+            from parallel import parallel_articulation_dfs
+            disc, low, parent, ap = parallel_articulation_dfs(self.graph, self.workers)
+        else:
+            disc, low, parent, ap = articulation_dfs(self.graph)
+        index = AncestorIndex.build(parent)
+        self._bind(DFSState.from_dicts(self.graph.vertices(), disc, low, parent, ap,
+                                       count_children(parent), index.depth, index.jump))
+        self.version += 1
+
+    def _bind(self, state):
+        # Les attributs disc, low, parent, ap, children et index sont les vues de l'état
+        self.state = state
+        self.disc, self.low, self.parent = state.disc, state.low, state.parent
+        self.ap, self.children = state.ap, state.children
+        self.index = AncestorIndex(state.parent, state.depth, state.jump)
+
+    def _load_state(self):
+        saved_state = load_graph_state(self.state_file)
+        if saved_state is None or set(saved_state["graph"]["vertices"]) != set(self.graph.vertices()):
+            self._full_recompute()
+        else:
+            disc, low, parent = get_dfs_state(saved_state)
+            ap, children = get_articulation_state(saved_state)
+            self._bind(as_dfs_state(self.graph, disc, low, parent, ap, children,
+                                    get_ancestor_index(saved_state)))
+            saved_edges = set(saved_state["graph"]["edges"])
+            current_edges = set(self.graph.edges())
+            if saved_edges != current_edges:
+                self._update(current_edges - saved_edges, saved_edges - current_edges)
+
+    def _update(self, added, removed):
+        updated = incremental_update_batch(self.graph, added, removed, self.disc, self.low, self.parent,
+                                           self.ap, self.children, self.index)[1]
+        self.version += 1
+        if self.verifier is not None:
+            self.verifier.observe(self.graph, self.state, added, removed, self.version)
+        return updated
+
+    def _repair(self, version, fresh):
+        # Appelée par le vérificateur après une divergence : l'état du DFS complet remplace
+        # l'état résident s'il correspond encore à la version vérifiée, sinon recalcul complet
+        disc, low, parent, ap = fresh
+        index = AncestorIndex.build(parent)
+        state = DFSState.from_dicts(disc, disc, low, parent, ap, count_children(parent), index.depth, index.jump)
+        with self.lock:
+            if self.version == version:
+                self._bind(state)
+                self.version += 1
+            else:
+                self._full_recompute()
+
+    # --- Modifications ---
+
+    def apply_changes(self, added=(), removed=()):
+        """
+        Applique un lot d'ajouts et de suppressions d'arêtes au graphe résident et à l'état DFS.
+        Les arêtes déjà présentes (ajout) ou absentes (suppression) sont ignorées.
+
+        :return: Liste triée des nœuds recalculés.
+        """
+        with self.lock:
+            adj = self.graph.adj
+            added = {(min(u, v), max(u, v)) for u, v in added
+                     if u != v and not (u in adj and v in adj[u])}
+            removed = {(min(u, v), max(u, v)) for u, v in removed if u in adj and v in adj[u]}
+            if not added and not removed:
+                return []
+            # Nouveaux sommets : racines isolées de nouveaux arbres DFS
+            register_vertices(self.graph, [w for edge in added for w in edge], self.disc, self.low,
+                              self.parent, self.children, self.index)
+            for u, v in added:
+                self.graph.add_edge(u, v)
+            for u, v in removed:
+                self.graph.remove_edge(u, v)
+            with metrics.phase("dfs"):
+                return self._update(added, removed)
+
+    def reload_file(self):
+        """
+        Relit le fichier d'arêtes s'il a changé (date de modification ou taille) et applique
+        la différence avec le graphe résident.
+
+        :return: Liste triée des nœuds recalculés, ou None si le fichier n'a pas changé.
+        """
+        signature = self._stat_file()
+        if signature == self._file_signature:
+            return None
+        with metrics.phase("parse"):
+            new_graph = load_graph(self.file_path)
+        with self.lock:
+            self._file_signature = signature
+            if set(new_graph.vertices()) != set(self.graph.vertices()):
+                self.graph = new_graph
+                with metrics.phase("dfs"):
+                    self._full_recompute()
+                return sorted(self.disc)
+            with metrics.phase("diff"):
+                current_edges = set(new_graph.edges())
+                resident_edges = set(self.graph.edges())
+            return self.apply_changes(current_edges - resident_edges, resident_edges - current_edges)
+
+    # --- Requêtes ---
+
+    def is_articulation(self, v):
+        with self.lock:
+            return v in self.ap
+
+    def articulation_points(self):
+        with self.lock:
+            return sorted(self.ap)
+
+    def bridges(self):
+        with self.lock:
+            return bridges_from_state(self.disc, self.low, self.parent)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "vertices": len(self.disc),
+                "articulation_points": len(self.ap),
+                "version": self.version,
+                "saved_version": self.saved_version,
+                **({"verification": self.verifier.stats()} if self.verifier is not None else {}),
+            }
+
+    # --- Sauvegarde ---
+
+    def checkpoint(self, force=False):
+        """
+        Sauvegarde l'état s'il a changé depuis la dernière sauvegarde (ou toujours si force).
+        Seule la copie de l'état est faite sous le verrou ; l'écriture se fait hors verrou.
+
+        :return: True si une sauvegarde a été écrite.
+        """
+        with self._save_lock:
+            with self.lock:
+                if self.version == self.saved_version and not force:
+                    return False
+                version = self.version
+                snapshot = _Snapshot(self.graph.vertices(), self.graph.edges())
+                state = self.state.copy()
+            with metrics.phase("save"):
+                save_graph_state(snapshot, state.disc, state.low, state.parent, self.state_file, state.ap,
+                                 state.children, AncestorIndex(state.parent, state.depth, state.jump))
+            if self.history is not None:
+                with metrics.phase("history"):
+                    self.history.commit(state)
+            with self.lock:
+                self.saved_version = version
+        return True
+
+    def _run_every(self, interval, func):
+        # Une erreur (sauvegarde ou relecture impossible) est signalée sans arrêter la tâche :
+        # elle sera retentée à l'intervalle suivant
+        while not self._stop.wait(interval):
+            try:
+                func()
+            except Exception as e:
+                print(f"Erreur de la tâche d'arrière-plan {func.__name__} : {e}", file=sys.stderr)
+
+    def start(self, checkpoint_interval=30.0, watch_interval=None):
+        """
+        Démarre les threads d'arrière-plan : checkpoint périodique et, si watch_interval est
+        fourni, surveillance du fichier d'arêtes (scrutation de sa date et de sa taille).
+        """
+        jobs = [(checkpoint_interval, self.checkpoint)]
+        if watch_interval:
+            jobs.append((watch_interval, self.reload_file))
+        for interval, func in jobs:
+            thread = threading.Thread(target=self._run_every, args=(interval, func), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """
+        Arrête les threads d'arrière-plan et écrit un dernier checkpoint si nécessaire.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        if self.verifier is not None:
+            self.verifier.close()
+        self.checkpoint()
+
+    # --- Protocole texte (entrée standard ou socket) ---
+
+    def _parse_vertex(self, token):
+        """
+        Lit un identifiant de sommet d'une commande et le refuse s'il ne peut pas être sauvegardé :
+        hors des entiers sur 8 octets, ou négatif avec un fichier d'état binaire.
+        """
+        v = int(token)
+        if not -MAX_VERTEX <= v <= MAX_VERTEX:
+            raise ValueError(f"sommet hors des entiers sur 8 octets : {v}")
+        if v < 0 and not self.state_file.endswith(".json"):
+            raise ValueError(f"sommet négatif refusé par le format binaire : {v}")
+        return v
+
+    def handle_command(self, line):
+        """
+        Exécute une commande du protocole texte et renvoie la réponse (une ligne) :
+          + u v        ajoute l'arête (u, v)
+          - u v        supprime l'arête (u, v)
+          ap [v]       liste des points d'articulation, ou 1/0 pour le sommet v
+          bridges      liste des ponts
+          stats        statistiques (JSON)
+          reload       relit le fichier d'arêtes
+          checkpoint   sauvegarde immédiate de l'état
+        """
+        parts = line.split()
+        if not parts:
+            return ""
+        command, args = parts[0], parts[1:]
+        try:
+            if command in ("+", "-") and len(args) == 2:
+                edge = (self._parse_vertex(args[0]), self._parse_vertex(args[1]))
+                if command == "+":
+                    updated = self.apply_changes(added=[edge])
+                else:
+                    updated = self.apply_changes(removed=[edge])
+                return f"ok {len(updated)}"
+            if command == "ap":
+                if args:
+                    return "1" if self.is_articulation(int(args[0])) else "0"
+                return json.dumps(self.articulation_points())
+            if command == "bridges":
+                return json.dumps(self.bridges())
+            if command == "stats":
+                return json.dumps(self.stats())
+            if command == "reload":
+                updated = self.reload_file()
+                return "inchangé" if updated is None else f"ok {len(updated)}"
+            if command == "checkpoint":
+                self.checkpoint(force=True)
+                return "ok"
+        except (ValueError, OSError) as e:
+            return f"erreur {e}"
+        return f"erreur commande inconnue : {line.strip()}"
+
+    def serve_stream(self, stream_in, stream_out):
+        """
+        Lit des commandes ligne par ligne (jusqu'à "quit" ou la fin du flux) et écrit les réponses.
+        """
+        for line in stream_in:
+            if line.strip() in ("quit", "exit"):
+                break
+            response = self.handle_command(line)
+            if response:
+                stream_out.write(response + "\n")
+                stream_out.flush()
+
+    def make_server(self, host="127.0.0.1", port=0):
+        """
+        Crée un serveur TCP local (un thread par connexion) parlant le même protocole texte.
+        """
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    line = raw.decode("utf-8", "replace")
+                    if line.strip() in ("quit", "exit"):
+                        break
+                    response = daemon.handle_command(line)
+                    if response:
+                        self.wfile.write((response + "\n").encode("utf-8"))
+
+        server = socketserver.ThreadingTCPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service résident de détection des points d'articulation.")
+    parser.add_argument("graph_file", help="Fichier d'arêtes à charger (et à surveiller avec --watch)")
+    parser.add_argument("--state-file", help="Fichier d'état (par défaut : <graph_file>.state)")
+    parser.add_argument("--watch", type=float, metavar="SECONDES",
+                        help="Surveille le fichier d'arêtes à cet intervalle et applique les modifications")
+    parser.add_argument("--listen", type=int, metavar="PORT",
+                        help="Accepte les commandes sur un socket TCP local (127.0.0.1:PORT) "
+                             "au lieu de l'entrée standard")
+    parser.add_argument("--checkpoint-interval", type=float, default=30.0,
+                        help="Intervalle (en secondes) des sauvegardes en arrière-plan")
+    parser.add_argument("--workers", type=int, default=1, help="Nombre de processus pour un DFS complet")
+    parser.add_argument("--history", action="store_true",
+                        help="Ajoute chaque checkpoint à l'historique des versions (<base>.history)")
+    parser.add_argument("--verify-rate", type=float, default=0.0, metavar="P",
+                        help="Probabilité (0 à 1) de vérifier une actualisation en arrière-plan par un DFS complet")
+    parser.add_argument("--verify-every", type=int, default=0, metavar="N",
+                        help="Vérifie en arrière-plan toutes les N actualisations")
+    parser.add_argument("--verify-mode", choices=MODES, default="thread",
+                        help="Vérification dans un thread ou dans un processus séparé")
+    parser.add_argument("--verify-log", metavar="FICHIER",
+                        help="Journal JSON des divergences détectées (par défaut : <base>.divergences.jsonl)")
+    args = parser.parse_args()
+
+    history_file = os.path.splitext(args.graph_file)[0] + ".history" if args.history else None
+    verifier = None
+    if args.verify_rate > 0 or args.verify_every > 0:
+        verifier = ShadowVerifier(args.verify_rate, args.verify_every, args.verify_mode,
+                                  args.verify_log or os.path.splitext(args.graph_file)[0] + ".divergences.jsonl")
+    daemon = GraphDaemon(args.graph_file, args.state_file, args.workers, history_file, verifier)
+    daemon.start(args.checkpoint_interval, args.watch)
+    print(f"Graphe chargé : {len(daemon.disc)} sommets, {len(daemon.ap)} points d'articulation", file=sys.stderr)
+    try:
+        if args.listen is not None:
+            with daemon.make_server(port=args.listen) as server:
+                print(f"Écoute sur 127.0.0.1:{server.server_address[1]}", file=sys.stderr)
+                server.serve_forever()
+        else:
+            daemon.serve_stream(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,447 @@
 
 # src/dfs.py
 
+from instrumentation import metrics
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, classify_state_arrays se rabat sur une boucle Python
+    np = None
+
+def articulation_dfs(graph, roots=None, disc=None, low=None, parent=None, start_time=0,
+                     scope=None, outer_disc=None):
+    """
+    Moteur DFS itératif (pile explicite, sans récursion) partagé par le calcul complet,
+    la détection des points d'articulation et l'actualisation incrémentale.
+
+    En un seul parcours, il calcule les temps de découverte, les valeurs low, les parents
+    dans l'arbre DFS ainsi que l'ensemble des points d'articulation. La mémoire utilisée
+    est bornée par la profondeur de l'arbre DFS (une entrée de pile par nœud actif).
+    Si l'instrumentation est active, les compteurs nodes_visited et edges_scanned (entrées
+    de listes d'adjacence parcourues) sont mis à jour à la fin du parcours.
+
+    :param graph: Instance de Graph (méthodes vertices() et neighbors(v)).
+    :param roots: Nœuds de départ (par défaut, tous les sommets du graphe).
+    :param disc: Dictionnaire des temps de découverte à compléter (nouveau si None).
+    :param low: Dictionnaire des valeurs low à compléter (nouveau si None).
+    :param parent: Dictionnaire des parents à compléter. Le parent d'une racine déjà présent
+                   dans ce dictionnaire est conservé (utile pour un DFS partiel à partir du LCA).
+    :param start_time: Valeur initiale du compteur de temps.
+    :param scope: Ensemble optionnel de nœuds auxquels restreindre le parcours. Les voisins
+                  hors de cet ensemble sont traités comme des ancêtres déjà visités.
+    :param outer_disc: Temps de découverte des nœuds hors de scope (obligatoire si scope est fourni).
+    :return: Tuple (disc, low, parent, ap) où ap est l'ensemble des points d'articulation.
+    """
+    disc = {} if disc is None else disc
+    low = {} if low is None else low
+    parent = {} if parent is None else parent
+    ap = set()
+    time = start_time
+    neighbors = graph.neighbors
+    counting = metrics.enabled
+    scanned = 0
+
+    if roots is None:
+        roots = graph.vertices()
+
+    for root in roots:
+        if root in disc:
+            continue
+        if root not in parent:
+            parent[root] = None
+        disc[root] = low[root] = time
+        time += 1
+        root_children = 0
+        stack = [(root, iter(neighbors(root)))]
+
+        while stack:
+            u, it = stack[-1]
+            pu = parent[u]
+            for v in it:
+                if v in disc:
+                    if v != pu and disc[v] < low[u]:
+                        low[u] = disc[v]
+                elif scope is not None and v not in scope:
+                    # Voisin hors de la zone recalculée : arête arrière vers un ancêtre
+                    if v != pu and outer_disc[v] < low[u]:
+                        low[u] = outer_disc[v]
+                else:
+                    parent[v] = u
+                    disc[v] = low[v] = time
+                    time += 1
+                    stack.append((v, iter(neighbors(v))))
+                    break
+            else:
+                stack.pop()
+                if counting:
+                    scanned += len(neighbors(u))
+                if not stack:
+                    continue
+                p = stack[-1][0]
+                if low[u] < low[p]:
+                    low[p] = low[u]
+                if parent[p] is None:
+                    root_children += 1
+                elif low[u] >= disc[p]:
+                    # Condition pour un nœud non-racine
+                    ap.add(p)
+
+        # Condition pour la racine
+        if parent[root] is None and root_children > 1:
+            ap.add(root)
+
+    if counting:
+        metrics.count("nodes_visited", time - start_time)
+        metrics.count("edges_scanned", scanned)
+    return disc, low, parent, ap
+
+
 def find_articulation_points(graph):
     """
     Détecte les points d'articulation dans le graphe donné en utilisant un parcours DFS.
-    
+
     :param graph: Instance de Graph (défini dans src/graph.py) avec les méthodes vertices() et neighbors(v)
     :return: Ensemble des points d'articulation (nœuds critiques)
     """
-    visited = {}
-    disc = {}
-    low = {}
-    parent = {}
-    ap = set()  # Ensemble des points d'articulation
-    time = [0]  # Compteur de temps sous forme de liste mutable
-
-    def dfs(u):
-        visited[u] = True
-        disc[u] = low[u] = time[0]
-        time[0] += 1
-        children = 0
-
-        for v in graph.neighbors(u):
-            if v not in visited:
-                parent[v] = u
-                children += 1
-                dfs(v)
-                low[u] = min(low[u], low[v])
-                # Condition pour la racine
-                if parent[u] is None and children > 1:
-                    ap.add(u)
-                # Condition pour un nœud non-racine
-                if parent[u] is not None and low[v] >= disc[u]:
-                    ap.add(u)
-            elif v != parent.get(u, None):
-                low[u] = min(low[u], disc[v])
-
-    for u in graph.vertices():
-        if u not in visited:
-            parent[u] = None
-            dfs(u)
-    
+    return articulation_dfs(graph)[3]
+
+
+def count_children(parent):
+    """
+    Compte le nombre d'enfants de chaque nœud dans l'arbre DFS.
+
+    :param parent: Dictionnaire des parents (None pour une racine).
+    :return: Dictionnaire nœud -> nombre d'enfants (0 pour une feuille).
+    """
+    children = dict.fromkeys(parent, 0)
+    for p in parent.values():
+        if p is not None:
+            children[p] += 1
+    return children
+
+
+def subtree_sizes(disc, parent):
+    """
+    Calcule la taille (nombre de nœuds) du sous-arbre DFS de chaque nœud, sans nouveau
+    parcours du graphe : les nœuds sont cumulés dans leur parent par disc décroissant.
+
+    :param disc: Dictionnaire des temps de découverte.
+    :param parent: Dictionnaire des parents (None pour une racine).
+    :return: Dictionnaire nœud -> taille de son sous-arbre (1 pour une feuille).
+    """
+    size = dict.fromkeys(parent, 1)
+    for v in sorted(parent, key=disc.__getitem__, reverse=True):
+        p = parent[v]
+        if p is not None:
+            size[p] += size[v]
+    return size
+
+
+def articulation_points_from_state(disc, low, parent):
+    """
+    Dérive les points d'articulation d'un état DFS déjà calculé, sans nouveau parcours :
+    une racine ayant plus d'un enfant, ou un nœud non-racine u ayant un enfant v tel que
+    low[v] >= disc[u].
+
+    :return: Ensemble des points d'articulation.
+    """
+    ap = set()
+    root_children = {}
+    for v, p in parent.items():
+        if p is None:
+            continue
+        if parent[p] is None:
+            root_children[p] = root_children.get(p, 0) + 1
+        elif low[v] >= disc[p]:
+            ap.add(p)
+    ap.update(r for r, count in root_children.items() if count > 1)
     return ap
+
+
+def low_from_tree(graph, disc, parent):
+    """
+    Recalcule les valeurs low imposées par un arbre DFS donné (disc et parent), sans nouveau
+    parcours : par disc décroissant, low[u] est le minimum de disc[u], des disc des voisins
+    autres que le parent et des low des enfants. Sert à contrôler un état actualisé
+    incrémentalement, dont l'arbre peut différer de celui d'un DFS complet.
+
+    :param graph: Graphe (méthode neighbors(v)).
+    :param disc: Dictionnaire des temps de découverte.
+    :param parent: Dictionnaire des parents (None pour une racine).
+    :return: Dictionnaire nœud -> valeur low attendue.
+    """
+    low = {}
+    for u in sorted(parent, key=disc.__getitem__, reverse=True):
+        p = parent[u]
+        value = min(low.get(u, disc[u]), disc[u])
+        for w in graph.neighbors(u):
+            if w != p and disc[w] < value:
+                value = disc[w]
+        low[u] = value
+        if p is not None and value < low.get(p, disc[p]):
+            low[p] = value
+    return low
+
+
+def is_dfs_state(graph, disc, low, parent):
+    """
+    Vérifie, sans nouveau DFS, qu'un état (disc, low, parent) est bien celui d'un parcours en
+    profondeur du graphe : chaque sommet a un état, parent est une forêt d'arêtes du graphe
+    où disc croît de parent à enfant, toute autre arête relie un ancêtre à un descendant (pas
+    d'arête transverse) et low vaut low_from_tree. Sert à contrôler un état repris d'une
+    version précédente avant de s'y fier.
+
+    :param graph: Instance de Graph ou de CSRGraph.
+    :return: True si l'état est celui d'un DFS du graphe.
+    """
+    vertices = set(graph.vertices())
+    if set(parent) != vertices or set(disc) != vertices or set(low) != vertices:
+        return False
+    edges = set(graph.edges())
+    children = {v: [] for v in vertices}
+    roots = []
+    for v, p in parent.items():
+        if p is None:
+            roots.append(v)
+        elif p not in vertices or disc[p] >= disc[v] or (min(p, v), max(p, v)) not in edges:
+            return False
+        else:
+            children[p].append(v)
+
+    # Intervalles d'entrée et de sortie de l'arbre : u est ancêtre de v si enter[u] <= enter[v] < leave[u]
+    enter, leave = {}, {}
+    clock = 0
+    for root in roots:
+        enter[root] = clock
+        clock += 1
+        stack = [(root, iter(children[root]))]
+        while stack:
+            u, it = stack[-1]
+            for v in it:
+                enter[v] = clock
+                clock += 1
+                stack.append((v, iter(children[v])))
+                break
+            else:
+                stack.pop()
+                leave[u] = clock
+    if len(enter) != len(vertices):
+        return False
+    for u, v in edges:
+        if enter[u] > enter[v]:
+            u, v = v, u
+        if enter[v] >= leave[u]:
+            return False
+    expected = low_from_tree(graph, disc, parent)
+    return all(low[v] == expected[v] for v in vertices)
+
+
+def biconnected_dfs(graph, roots=None):
+    """
+    Variante du moteur DFS itératif avec une pile d'arêtes : en un seul parcours, elle
+    calcule les points d'articulation, les ponts et la composante biconnexe de chaque arête.
+
+    Chaque arête de l'arbre et chaque arête arrière est empilée lors de sa découverte.
+    Quand un enfant u de p termine avec low[u] >= disc[p], les arêtes empilées jusqu'à (p, u)
+    forment une composante biconnexe ; si de plus low[u] > disc[p], l'arête (p, u) est un pont.
+
+    :param graph: Instance de Graph ou de CSRGraph.
+    :param roots: Nœuds de départ (par défaut, tous les sommets du graphe).
+    :return: Tuple (disc, low, parent, ap, bridges, edge_component) où bridges est la liste
+             triée des ponts (u, v) avec u < v et edge_component associe à chaque arête (u, v),
+             u < v, le numéro de sa composante biconnexe (0, 1, 2, ...).
+    """
+    disc, low, parent = {}, {}, {}
+    ap = set()
+    bridges = []
+    edge_component = {}
+    edge_stack = []
+    component = 0
+    time = 0
+    neighbors = graph.neighbors
+    counting = metrics.enabled
+    scanned = 0
+
+    if roots is None:
+        roots = graph.vertices()
+
+    for root in roots:
+        if root in disc:
+            continue
+        parent[root] = None
+        disc[root] = low[root] = time
+        time += 1
+        root_children = 0
+        stack = [(root, iter(neighbors(root)))]
+
+        while stack:
+            u, it = stack[-1]
+            pu = parent[u]
+            for v in it:
+                if v in disc:
+                    # Arête arrière (empilée une seule fois, depuis le descendant)
+                    if v != pu and disc[v] < disc[u]:
+                        edge_stack.append((u, v))
+                        if disc[v] < low[u]:
+                            low[u] = disc[v]
+                else:
+                    parent[v] = u
+                    disc[v] = low[v] = time
+                    time += 1
+                    edge_stack.append((u, v))
+                    stack.append((v, iter(neighbors(v))))
+                    break
+            else:
+                stack.pop()
+                if counting:
+                    scanned += len(neighbors(u))
+                if not stack:
+                    continue
+                p = stack[-1][0]
+                if low[u] < low[p]:
+                    low[p] = low[u]
+                if parent[p] is None:
+                    root_children += 1
+                elif low[u] >= disc[p]:
+                    ap.add(p)
+                if low[u] >= disc[p]:
+                    # Fermeture d'une composante biconnexe : dépilement jusqu'à (p, u)
+                    while True:
+                        a, b = edge_stack.pop()
+                        edge_component[(a, b) if a < b else (b, a)] = component
+                        if a == p and b == u:
+                            break
+                    component += 1
+                    if low[u] > disc[p]:
+                        bridges.append((p, u) if p < u else (u, p))
+
+        if root_children > 1:
+            ap.add(root)
+
+    if counting:
+        metrics.count("nodes_visited", time)
+        metrics.count("edges_scanned", scanned)
+    bridges.sort()
+    return disc, low, parent, ap, bridges, edge_component
+
+
+def find_bridges(graph):
+    """
+    Détecte les ponts du graphe (arêtes dont la suppression le déconnecte).
+
+    :param graph: Instance de Graph ou de CSRGraph.
+    :return: Liste triée des ponts (u, v) avec u < v.
+    """
+    return biconnected_dfs(graph)[4]
+
+
+def find_biconnected_components(graph):
+    """
+    Calcule les composantes biconnexes du graphe.
+
+    :param graph: Instance de Graph ou de CSRGraph.
+    :return: Liste des composantes, chacune étant la liste triée de ses arêtes (u, v), u < v.
+    """
+    return group_components(biconnected_dfs(graph)[5])
+
+
+def group_components(edge_component):
+    """
+    Regroupe les arêtes par composante biconnexe.
+
+    :param edge_component: Dictionnaire arête (u, v) -> numéro de composante.
+    :return: Liste indexée par numéro de composante des listes triées d'arêtes.
+    """
+    components = [[] for _ in range(max(edge_component.values(), default=-1) + 1)]
+    for edge, c in edge_component.items():
+        components[c].append(edge)
+    for edges in components:
+        edges.sort()
+    return components
+
+
+def bridges_from_state(disc, low, parent):
+    """
+    Dérive les ponts d'un état DFS déjà calculé, sans nouveau parcours : une arête de
+    l'arbre (p, v) est un pont si et seulement si low[v] > disc[p].
+
+    :return: Liste triée des ponts (u, v) avec u < v.
+    """
+    return sorted((min(p, v), max(p, v)) for v, p in parent.items()
+                  if p is not None and low[v] > disc[p])
+
+
+def edge_components_from_state(graph, disc, low, parent):
+    """
+    Dérive la composante biconnexe de chaque arête d'un état DFS déjà calculé, sans nouveau
+    parcours. Dans l'ordre de découverte, une arête de l'arbre (p, v) ouvre une nouvelle
+    composante si p est racine ou si low[v] >= disc[p], sinon elle appartient à celle de
+    l'arête (parent[p], p) ; une arête arrière appartient à la composante de l'arête de
+    l'arbre qui mène à son extrémité la plus profonde.
+
+    :param graph: Instance de Graph ou de CSRGraph.
+    :return: Dictionnaire arête (u, v), u < v -> numéro de composante, comme biconnected_dfs.
+    """
+    block = {}
+    component = 0
+    for v in sorted(disc, key=disc.__getitem__):
+        p = parent[v]
+        if p is None:
+            continue
+        if parent[p] is None or low[v] >= disc[p]:
+            block[v] = component
+            component += 1
+        else:
+            block[v] = block[p]
+    return {(u, v): block[u if disc[u] > disc[v] else v] for u, v in graph.edges()}
+
+
+def classify_state_arrays(disc, low, parent):
+    """
+    Dérive, en opérations vectorisées NumPy et sans nouveau parcours, les points
+    d'articulation, les ponts et le nombre d'enfants d'un état DFS stocké sous forme de
+    tableaux alignés (position i = i-ème sommet). Règles appliquées à chaque arête de l'arbre
+    (p, c) : p est un point d'articulation s'il n'est pas racine et que low[c] >= disc[p], ou
+    s'il est racine avec plus d'un enfant ; (p, c) est un pont si low[c] > disc[p].
+
+    :param disc: Tableau des temps de découverte.
+    :param low: Tableau des valeurs low.
+    :param parent: Tableau des positions des parents (-1 pour une racine).
+    :return: Tuple (ap, bridges, children) : masque booléen des points d'articulation,
+             tableau (k, 2) des ponts (position du parent, position de l'enfant) et nombre
+             d'enfants de chaque position.
+    """
+    if np is None:
+        return _classify_state_lists(list(disc), list(low), list(parent))
+    disc = np.asarray(disc, dtype=np.int64)
+    low = np.asarray(low, dtype=np.int64)
+    parent = np.asarray(parent, dtype=np.int64)
+    n = len(parent)
+    has_parent = parent >= 0
+    child = np.flatnonzero(has_parent)
+    p = parent[child]
+    children = np.bincount(p, minlength=n)
+    ap = ~has_parent & (children > 1)
+    ap[p[(low[child] >= disc[p]) & has_parent[p]]] = True
+    is_bridge = low[child] > disc[p]
+    bridges = np.column_stack((p[is_bridge], child[is_bridge]))
+    return ap, bridges, children
+
+
+def _classify_state_lists(disc, low, parent):
+    n = len(parent)
+    children = [0] * n
+    ap = [False] * n
+    bridges = []
+    for c, p in enumerate(parent):
+        if p < 0:
+            continue
+        children[p] += 1
+        if parent[p] >= 0 and low[c] >= disc[p]:
+            ap[p] = True
+        if low[c] > disc[p]:
+            bridges.append((p, c))
+    for v in range(n):
+        if parent[v] < 0 and children[v] > 1:
+            ap[v] = True
+    return ap, bridges, children
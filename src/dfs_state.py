@@ -0,0 +1,321 @@
+# src/dfs_state.py
+
+from array import array
+from collections.abc import MutableMapping, MutableSet
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, les tailles de sous-arbres sont cumulées en Python
+    np = None
+
+NO_PARENT = -1  # Parent d'une racine dans la colonne parent
+COLUMNS = ("disc", "low", "parent", "children", "depth", "jump")
+
+
+class DFSState:
+    """
+    État DFS d'un graphe rangé dans des tableaux compacts alignés sur les sommets : une colonne
+    d'entiers sur 8 octets par valeur (disc, low, parent, nombre d'enfants, profondeur et
+    pointeur de saut de l'index des ancêtres) et un octet par sommet pour le drapeau de point
+    d'articulation, soit 49 octets par sommet au lieu d'une centaine par entrée et par
+    dictionnaire.
+
+    Lorsque les sommets sont 0..N-1 (fichiers "N M", identifiants traduits par interning),
+    la position d'un sommet est le sommet lui-même ; sinon un dictionnaire des positions est tenu.
+
+    Les attributs disc, low, parent, children, depth et jump sont des vues dictionnaire
+    (ArrayMap) et ap une vue ensemble (ApSet) : les moteurs (updater, lca, queries) lisent et
+    écrivent directement dans les tableaux, et state_manager les sérialise sans conversion
+    sommet par sommet.
+    """
+
+    __slots__ = ("vertices", "positions", "columns", "ap_flags",
+                 "disc", "low", "parent", "children", "depth", "jump", "ap")
+
+    def __init__(self, vertices=None, columns=None, ap_flags=None, num_vertices=0):
+        """
+        :param vertices: Sommets (array "q") dans l'ordre des colonnes, ou None pour 0..N-1.
+        :param columns: Dictionnaire nom -> array("q") aligné sur les sommets (COLUMNS) ;
+                        les colonnes absentes sont initialisées à leur valeur par défaut.
+        :param ap_flags: bytearray des drapeaux de points d'articulation.
+        :param num_vertices: Nombre de sommets N lorsque vertices et columns sont omis.
+        """
+        columns = dict(columns or {})
+        n = len(vertices) if vertices is not None else (
+            len(next(iter(columns.values()))) if columns else num_vertices)
+        for name in COLUMNS:
+            if name not in columns:
+                default = NO_PARENT if name == "parent" else 0
+                columns[name] = array("q", [default]) * n
+        self.vertices = vertices
+        self.positions = None if vertices is None else {v: i for i, v in enumerate(vertices)}
+        self.columns = columns
+        self.ap_flags = bytearray(n) if ap_flags is None else bytearray(ap_flags)
+        for name in COLUMNS:
+            setattr(self, name, ArrayMap(self, name))
+        self.ap = ApSet(self)
+
+    @classmethod
+    def from_dicts(cls, vertices, disc, low, parent, ap=(), children=None, depth=None, jump=None):
+        """
+        Range un état DFS donné par dictionnaires (par exemple le résultat d'articulation_dfs).
+
+        :param vertices: Sommets du graphe.
+        """
+        vertices = sorted(vertices)
+        dense = not vertices or (vertices[0] == 0 and vertices[-1] == len(vertices) - 1)
+        columns = {
+            "disc": array("q", [disc[v] for v in vertices]),
+            "low": array("q", [low[v] for v in vertices]),
+            "parent": array("q", [NO_PARENT if parent[v] is None else parent[v] for v in vertices]),
+        }
+        for name, values in (("children", children), ("depth", depth), ("jump", jump)):
+            if values is not None:
+                columns[name] = array("q", [values.get(v, 0) for v in vertices])
+        ap_flags = bytearray(v in ap for v in vertices) if ap else None
+        return cls(None if dense else array("q", vertices), columns, ap_flags)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Reprend les sections d'un état binaire (state_manager.load_state_arrays) : une copie
+        de tableau par colonne, sans conversion sommet par sommet.
+        """
+        vertices = _int64_array(arrays["vertices"])
+        n = len(vertices)
+        dense = n == 0 or (vertices[0] == 0 and vertices[-1] == n - 1 and _is_range(arrays["vertices"]))
+        columns = {name: _int64_array(arrays[name]) for name in COLUMNS if name in arrays}
+        return cls(None if dense else vertices, columns, arrays.get("ap_flags"), n)
+
+    def __len__(self):
+        return len(self.ap_flags)
+
+    def position(self, v):
+        """
+        Position du sommet v dans les colonnes (KeyError s'il est inconnu).
+        """
+        if self.positions is not None:
+            return self.positions[v]
+        try:
+            if 0 <= v < len(self.ap_flags):
+                return v
+        except TypeError:
+            pass
+        raise KeyError(v)
+
+    def add_vertex(self, v):
+        """
+        Ajoute un sommet (colonnes à leur valeur par défaut) et renvoie sa position.
+        """
+        n = len(self.ap_flags)
+        if self.positions is None and v != n:
+            # Les sommets ne sont plus 0..N-1 : passage au dictionnaire des positions
+            self.vertices = array("q", range(n))
+            self.positions = dict(zip(range(n), range(n)))
+        if self.positions is not None:
+            self.vertices.append(v)
+            self.positions[v] = n
+        for name, column in self.columns.items():
+            column.append(NO_PARENT if name == "parent" else 0)
+        self.ap_flags.append(0)
+        return n
+
+    def vertex_list(self):
+        """
+        Sommets dans l'ordre des colonnes (range pour 0..N-1).
+        """
+        return range(len(self.ap_flags)) if self.positions is None else self.vertices
+
+    def vertex_array(self):
+        """
+        Sommets dans l'ordre des colonnes, en array("q").
+        """
+        if self.positions is not None:
+            return self.vertices
+        if np is not None:
+            return array("q", np.arange(len(self.ap_flags), dtype=np.int64).tobytes())
+        return array("q", range(len(self.ap_flags)))
+
+    def copy(self):
+        """
+        Copie indépendante de l'état (copie mémoire de chaque colonne).
+        """
+        vertices = None if self.positions is None else self.vertices[:]
+        return DFSState(vertices, {name: column[:] for name, column in self.columns.items()},
+                        self.ap_flags, len(self.ap_flags))
+
+    def nbytes(self):
+        """
+        Taille des tableaux de l'état, en octets (hors dictionnaire des positions).
+        """
+        total = len(self.ap_flags) + sum(c.itemsize * len(c) for c in self.columns.values())
+        return total + (0 if self.vertices is None else self.vertices.itemsize * len(self.vertices))
+
+    def subtree_sizes(self):
+        """
+        Taille du sous-arbre DFS de chaque sommet (array "q" aligné sur les colonnes) : les
+        sommets sont cumulés dans leur parent, des plus profonds vers les racines.
+        """
+        n = len(self.ap_flags)
+        parent = self.columns["parent"]
+        if self.positions is not None:
+            parent = array("q", [NO_PARENT if p == NO_PARENT else self.positions[p] for p in parent])
+        if np is None:
+            size = array("q", [1]) * n
+            for i in sorted(range(n), key=self.columns["disc"].__getitem__, reverse=True):
+                p = parent[i]
+                if p != NO_PARENT:
+                    size[p] += size[i]
+            return size
+        parent = np.frombuffer(parent, dtype=np.int64)
+        depth = np.frombuffer(self.columns["depth"], dtype=np.int64)
+        if n and not depth.any() and (parent != NO_PARENT).any():
+            depth = np.frombuffer(_depths(parent), dtype=np.int64)
+        size = np.ones(n, dtype=np.int64)
+        # Niveau par niveau, des plus profonds vers les racines
+        order = np.argsort(-depth, kind="stable")
+        levels = np.flatnonzero(np.diff(depth[order])) + 1
+        for group in np.split(order, levels):
+            group = group[parent[group] != NO_PARENT]
+            np.add.at(size, parent[group], size[group])
+        return array("q", size.tobytes())
+
+
+class ArrayMap(MutableMapping):
+    """
+    Vue dictionnaire (sommet -> valeur) sur une colonne d'un DFSState. Pour la colonne parent,
+    NO_PARENT est présenté comme None. Affecter un sommet inconnu l'ajoute à l'état.
+    """
+
+    __slots__ = ("state", "column", "is_parent")
+
+    def __init__(self, state, name):
+        self.state = state
+        self.column = state.columns[name]
+        self.is_parent = name == "parent"
+
+    def __getitem__(self, v):
+        value = self.column[self.state.position(v)]
+        return None if self.is_parent and value == NO_PARENT else value
+
+    def get(self, v, default=None):
+        try:
+            return self[v]
+        except KeyError:
+            return default
+
+    def __setitem__(self, v, value):
+        try:
+            i = self.state.position(v)
+        except KeyError:
+            i = self.state.add_vertex(v)
+        self.column[i] = NO_PARENT if value is None else value
+
+    def __delitem__(self, v):
+        raise TypeError("Un état DFS ne perd pas de sommet")
+
+    def __contains__(self, v):
+        try:
+            self.state.position(v)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.state.vertex_list())
+
+    def __len__(self):
+        return len(self.state)
+
+    def values(self):
+        if self.is_parent:
+            return [None if p == NO_PARENT else p for p in self.column]
+        return self.column
+
+    def clear(self):
+        """
+        Remet la colonne à sa valeur par défaut ; les sommets restent dans l'état.
+        """
+        self.column[:] = array("q", [NO_PARENT if self.is_parent else 0]) * len(self.column)
+
+
+class ApSet(MutableSet):
+    """
+    Vue ensemble des points d'articulation d'un DFSState (un octet par sommet).
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self, state):
+        self.state = state
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, v):
+        try:
+            return bool(self.state.ap_flags[self.state.position(v)])
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        vertices = self.state.vertex_list()
+        return (vertices[i] for i, flag in enumerate(self.state.ap_flags) if flag)
+
+    def __len__(self):
+        flags = self.state.ap_flags
+        return len(flags) - flags.count(0)
+
+    def add(self, v):
+        try:
+            i = self.state.position(v)
+        except KeyError:
+            i = self.state.add_vertex(v)
+        self.state.ap_flags[i] = 1
+
+    def discard(self, v):
+        try:
+            self.state.ap_flags[self.state.position(v)] = 0
+        except KeyError:
+            pass
+
+    def update(self, vertices):
+        for v in vertices:
+            self.add(v)
+
+    def clear(self):
+        flags = self.state.ap_flags
+        flags[:] = bytes(len(flags))
+
+
+def _int64_array(values):
+    # Copie d'une section (NumPy ou array) dans un array("q")
+    if isinstance(values, array):
+        return values[:]
+    if np is not None:
+        return array("q", np.asarray(values, dtype=np.int64).tobytes())
+    return array("q", values)
+
+
+def _is_range(vertices):
+    if np is not None:
+        vertices = np.asarray(vertices, dtype=np.int64)
+        return bool((vertices == np.arange(len(vertices))).all())
+    return all(v == i for i, v in enumerate(vertices))
+
+
+def _depths(parent):
+    # Profondeur de chaque position à partir des positions des parents (NO_PARENT pour une racine)
+    depth = array("q", [-1]) * len(parent)
+    for i in range(len(parent)):
+        path = []
+        j = i
+        while j != NO_PARENT and depth[j] < 0:
+            path.append(j)
+            j = parent[j]
+        d = -1 if j == NO_PARENT else depth[j]
+        for k in reversed(path):
+            d += 1
+            depth[k] = d
+    return depth
@@ -0,0 +1,376 @@
+# src/external.py
+
+"""
+Mode semi-externe : détection des points d'articulation d'un graphe dont les listes
+d'adjacence ne tiennent pas en mémoire.
+
+Le fichier d'arêtes "N M" (texte, gzip ou binaire) est converti une seule fois en un fichier
+d'adjacence trié sur disque (<base>.adj) : en-tête, tableau indptr (N + 1 entiers sur 8 octets)
+puis voisins de chaque sommet, triés, dans l'ordre des sommets. La conversion lit le fichier
+d'arêtes par blocs en deux passes (degrés, puis placement des voisins dans le fichier projeté
+en mémoire) et trie les listes de voisins par tranches de sommets.
+
+Le DFS itératif ne garde en mémoire que des tableaux par sommet (disc, low, parent, position
+de reprise dans la liste de voisins, drapeau de point d'articulation) et la pile des sommets
+actifs ; les voisins sont lus dans le fichier projeté en mémoire (mmap), dont les pages
+restent sous le contrôle du système. Le volume lu est compté et renvoyé avec le résultat.
+
+Usage:
+    python src/external.py <graph_file> [--adjacency FICHIER.adj] [--chunk-size OCTETS]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from loader import CHUNK_SIZE, read_edge_header, iter_edge_chunks
+from state_manager import atomic_write
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, la conversion place et trie les voisins en Python
+    np = None
+
+try:
+    import resource
+except ImportError:  # Hors Unix, les défauts de page ne sont pas comptés
+    resource = None
+
+ADJACENCY_MAGIC = b"PARXADJC"
+ADJACENCY_VERSION = 1
+# magic, version, taille des voisins (4 ou 8), N, nombre d'entrées, taille et date (ns) de la source
+ADJACENCY_HEADER = struct.Struct("<8sIIQQQQ")
+INDPTR_ITEMSIZE = 8
+
+
+def adjacency_path(graph_file):
+    """
+    Nom du fichier d'adjacence associé à un fichier d'arêtes (data/g.txt -> data/g.adj).
+    """
+    return os.path.splitext(graph_file)[0] + ".adj"
+
+
+def read_adjacency_header(path):
+    """
+    Lit l'en-tête d'un fichier d'adjacence.
+
+    :return: Tuple (itemsize, num_vertices, num_entries, source_size, source_mtime_ns).
+    """
+    with open(path, "rb") as f:
+        head = f.read(ADJACENCY_HEADER.size)
+    if len(head) < ADJACENCY_HEADER.size:
+        raise ValueError(f"Fichier d'adjacence tronqué : {path}")
+    magic, version, itemsize, n, entries, size, mtime_ns = ADJACENCY_HEADER.unpack(head)
+    if magic != ADJACENCY_MAGIC or version != ADJACENCY_VERSION or itemsize not in (4, 8):
+        raise ValueError(f"Format de fichier d'adjacence non reconnu : {path}")
+    expected = ADJACENCY_HEADER.size + INDPTR_ITEMSIZE * (n + 1) + itemsize * entries
+    if os.path.getsize(path) != expected:
+        raise ValueError(f"Fichier d'adjacence tronqué : {path}")
+    return itemsize, n, entries, size, mtime_ns
+
+
+def adjacency_is_current(path, graph_file):
+    """
+    Indique si le fichier d'adjacence existe et a été converti depuis la version actuelle
+    du fichier d'arêtes (même taille et même date de modification).
+    """
+    try:
+        _, _, _, size, mtime_ns = read_adjacency_header(path)
+    except (OSError, ValueError):
+        return False
+    st = os.stat(graph_file)
+    return (size, mtime_ns) == (st.st_size, st.st_mtime_ns)
+
+
+def convert_to_adjacency(graph_file, path=None, chunk_size=CHUNK_SIZE):
+    """
+    Convertit un fichier d'arêtes en fichier d'adjacence trié sur disque. Les boucles sont
+    ignorées ; chaque arête est rangée dans les deux sens. En mémoire ne restent qu'un tableau
+    d'entiers par sommet (positions de remplissage) et un bloc d'arêtes à la fois.
+
+    :param graph_file: Fichier d'arêtes "N M" (texte, gzip ou binaire).
+    :param path: Fichier d'adjacence à écrire (par défaut <base>.adj).
+    :param chunk_size: Taille des blocs lus dans le fichier d'arêtes, en octets.
+    :return: Chemin du fichier d'adjacence.
+    """
+    path = path or adjacency_path(graph_file)
+    num_vertices, _ = read_edge_header(graph_file)
+    itemsize = 4 if num_vertices < 2 ** 31 else 8
+
+    # Première passe : degrés, puis indptr par sommes cumulées
+    if np is not None:
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        for src, dst in iter_edge_chunks(graph_file, chunk_size):
+            src, dst = _without_loops(src, dst)
+            indptr[1:] += np.bincount(src, minlength=num_vertices)
+            indptr[1:] += np.bincount(dst, minlength=num_vertices)
+        np.cumsum(indptr, out=indptr)
+        entries = int(indptr[-1])
+        indptr_bytes = indptr.astype("<i8").tobytes()
+        fill = indptr[:-1].copy()
+    else:
+        indptr = array("q", bytes(INDPTR_ITEMSIZE * (num_vertices + 1)))
+        for src, dst in iter_edge_chunks(graph_file, chunk_size):
+            for u, v in zip(src, dst):
+                if u != v:
+                    indptr[u + 1] += 1
+                    indptr[v + 1] += 1
+        for i in range(num_vertices):
+            indptr[i + 1] += indptr[i]
+        entries = indptr[num_vertices]
+        fill = indptr[:num_vertices]
+        indptr_bytes = _little_endian(indptr)
+
+    st = os.stat(graph_file)
+    offset = ADJACENCY_HEADER.size + len(indptr_bytes)
+    with atomic_write(path, "w+b") as f:
+        f.write(ADJACENCY_HEADER.pack(ADJACENCY_MAGIC, ADJACENCY_VERSION, itemsize, num_vertices,
+                                      entries, st.st_size, st.st_mtime_ns))
+        f.write(indptr_bytes)
+        f.truncate(offset + itemsize * entries)
+        f.flush()
+        if entries:
+            with mmap.mmap(f.fileno(), 0) as mapped:
+                # Deuxième passe : placement des voisins, puis tri de chaque liste
+                if np is not None:
+                    indices = np.frombuffer(mapped, dtype="<i4" if itemsize == 4 else "<i8",
+                                            count=entries, offset=offset)
+                    for src, dst in iter_edge_chunks(graph_file, chunk_size):
+                        _scatter(indices, fill, *_without_loops(src, dst))
+                    _sort_segments(indices, indptr, max(1, chunk_size // itemsize))
+                    del indices
+                else:
+                    indices = memoryview(mapped)[offset:].cast("i" if itemsize == 4 else "q")
+                    for src, dst in iter_edge_chunks(graph_file, chunk_size):
+                        for u, v in zip(src, dst):
+                            if u != v:
+                                indices[fill[u]] = v
+                                fill[u] += 1
+                                indices[fill[v]] = u
+                                fill[v] += 1
+                    for u in range(num_vertices):
+                        start, end = indptr[u], indptr[u + 1]
+                        indices[start:end] = array(indices.format, sorted(indices[start:end]))
+                    indices.release()
+                mapped.flush()
+    return path
+
+
+def _without_loops(src, dst):
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    keep = src != dst
+    return src[keep], dst[keep]
+
+
+def _scatter(indices, fill, src, dst):
+    # Range les voisins d'un bloc à la suite des précédents, sommet par sommet
+    if not len(src):
+        return
+    u = np.concatenate((src, dst))
+    v = np.concatenate((dst, src))
+    order = np.argsort(u, kind="stable")
+    u, v = u[order], v[order]
+    first = np.flatnonzero(np.concatenate(([True], u[1:] != u[:-1])))
+    counts = np.diff(np.append(first, len(u)))
+    rank = np.arange(len(u)) - np.repeat(first, counts)
+    indices[fill[u] + rank] = v
+    fill[u[first]] += counts
+
+
+def _sort_segments(indices, indptr, max_entries):
+    # Trie les listes de voisins par tranches de sommets d'au plus max_entries entrées
+    # (une tranche contient au moins un sommet, quel que soit son degré)
+    n = len(indptr) - 1
+    lo = 0
+    while lo < n:
+        hi = int(np.searchsorted(indptr, indptr[lo] + max_entries, side="right")) - 1
+        hi = min(max(hi, lo + 1), n, lo + max_entries)
+        start, end = int(indptr[lo]), int(indptr[hi])
+        if end - start > 1:
+            owner = np.repeat(np.arange(hi - lo, dtype=np.int64), np.diff(indptr[lo:hi + 1]))
+            segment = indices[start:end]
+            segment[:] = segment[np.lexsort((segment, owner))]
+        lo = hi
+
+
+def _little_endian(values):
+    if sys.byteorder != "little":
+        values = values[:]
+        values.byteswap()
+    return values.tobytes()
+
+
+def _io_counters():
+    # Défauts de page majeurs (getrusage) et octets lus sur le stockage (/proc/self/io, Linux)
+    counters = {}
+    if resource is not None:
+        counters["major_faults"] = resource.getrusage(resource.RUSAGE_SELF).ru_majflt
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name == "read_bytes":
+                    counters["disk_read_bytes"] = int(value)
+    except OSError:
+        pass
+    return counters
+
+
+def external_articulation_points(path):
+    """
+    Calcule les points d'articulation et les ponts à partir d'un fichier d'adjacence, avec le
+    même parcours itératif que dfs.articulation_dfs (sommets pris dans l'ordre 0..N-1, voisins
+    dans l'ordre du fichier). Les deux ensembles ne dépendent pas de l'ordre du parcours : le
+    résultat est identique à celui du chemin en mémoire.
+
+    Mémoire : quatre tableaux d'entiers par sommet (disc, low, parent, position de reprise),
+    un octet par sommet pour les points d'articulation et la pile des sommets actifs.
+    Le tableau indptr et les voisins sont lus dans le fichier projeté en mémoire.
+
+    :param path: Fichier d'adjacence (voir convert_to_adjacency).
+    :return: Tuple (ap, bridges, io) : ensemble des points d'articulation, liste triée des
+             ponts (u, v) avec u < v, et volume d'entrées-sorties (octets lus dans le fichier,
+             taille du fichier, défauts de page majeurs et, sous Linux, octets lus sur le disque).
+    """
+    if sys.byteorder != "little":
+        raise ValueError("Le fichier d'adjacence (petit-boutiste) ne peut pas être projeté sur cette machine")
+    itemsize, n, entries, _, _ = read_adjacency_header(path)
+    offset = ADJACENCY_HEADER.size + INDPTR_ITEMSIZE * (n + 1)
+    before = _io_counters()
+    # Entiers sur 4 octets lorsque les valeurs le permettent
+    vertex_code = "i" if n < 2 ** 31 else "q"
+    entry_code = "i" if entries < 2 ** 31 else "q"
+    disc = array(vertex_code, [-1]) * n
+    low = array(vertex_code, bytes(array(vertex_code).itemsize * n))
+    parent = array(vertex_code, [-1]) * n
+    resume = array(entry_code, bytes(array(entry_code).itemsize * n))
+    ap_flags = bytearray(n)
+    bridges = []
+    stack = array(vertex_code)
+    scanned = indptr_reads = depth = 0
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if n else None
+    try:
+        view = memoryview(mapped) if mapped is not None else memoryview(b"")
+        indptr = view[ADJACENCY_HEADER.size:offset].cast("q")
+        indices = view[offset:].cast("i" if itemsize == 4 else "q")
+
+        time = 0
+        for root in range(n):
+            if disc[root] >= 0:
+                continue
+            disc[root] = low[root] = time
+            time += 1
+            resume[root] = indptr[root]
+            indptr_reads += 1
+            root_children = 0
+            stack.append(root)
+            depth = max(depth, 1)
+
+            while stack:
+                u = stack[-1]
+                pu = parent[u]
+                k = resume[u]
+                end = indptr[u + 1]
+                indptr_reads += 1
+                lu = low[u]
+                child = -1
+                while k < end:
+                    v = indices[k]
+                    k += 1
+                    dv = disc[v]
+                    if dv >= 0:
+                        if v != pu and dv < lu:
+                            lu = dv
+                    else:
+                        child = v
+                        break
+                scanned += k - resume[u]
+                resume[u] = k
+                low[u] = lu
+                if child >= 0:
+                    parent[child] = u
+                    disc[child] = low[child] = time
+                    time += 1
+                    resume[child] = indptr[child]
+                    indptr_reads += 1
+                    stack.append(child)
+                    if len(stack) > depth:
+                        depth = len(stack)
+                    continue
+
+                stack.pop()
+                if not stack:
+                    continue
+                p = stack[-1]
+                if lu < low[p]:
+                    low[p] = lu
+                if lu > disc[p]:
+                    bridges.append((min(p, u), max(p, u)))
+                if parent[p] < 0:
+                    root_children += 1
+                elif lu >= disc[p]:
+                    ap_flags[p] = 1
+
+            if root_children > 1:
+                ap_flags[root] = 1
+        indptr.release()
+        indices.release()
+        view.release()
+    finally:
+        if mapped is not None:
+            mapped.close()
+
+    after = _io_counters()
+    io = {
+        "bytes_read": scanned * itemsize + indptr_reads * INDPTR_ITEMSIZE,
+        "file_bytes": offset + itemsize * entries,
+        "resident_bytes": (disc.itemsize * 3 + resume.itemsize + 1) * n + stack.itemsize * depth,
+    }
+    io.update({name: after[name] - before[name] for name in after if name in before})
+    ap = {v for v, flag in enumerate(ap_flags) if flag}
+    bridges.sort()
+    return ap, bridges, io
+
+
+def articulation_points_out_of_core(graph_file, path=None, chunk_size=CHUNK_SIZE):
+    """
+    Convertit le fichier d'arêtes si nécessaire (fichier d'adjacence absent ou plus ancien
+    que la source), puis calcule les points d'articulation en mode semi-externe.
+
+    :return: Tuple (ap, bridges, io) de external_articulation_points ; io["converted"]
+             indique si la conversion a eu lieu.
+    """
+    path = path or adjacency_path(graph_file)
+    converted = not adjacency_is_current(path, graph_file)
+    if converted:
+        convert_to_adjacency(graph_file, path, chunk_size)
+    ap, bridges, io = external_articulation_points(path)
+    io["converted"] = converted
+    return ap, bridges, io
+
+
+def main():
+    """
+    Point d'entrée en ligne de commande du mode semi-externe.
+    """
+    parser = argparse.ArgumentParser(description="Points d'articulation d'un graphe lu sur disque (mode semi-externe).")
+    parser.add_argument("graph_file", help="Fichier du graphe (première ligne \"N M\", puis une arête par ligne)")
+    parser.add_argument("--adjacency", metavar="FICHIER", help="Fichier d'adjacence (par défaut <base>.adj)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Taille des blocs lus lors de la conversion")
+    args = parser.parse_args()
+    ap, bridges, io = articulation_points_out_of_core(args.graph_file, args.adjacency, args.chunk_size)
+    print("Points d'articulation détectés :")
+    print(sorted(ap))
+    print("\nPonts détectés :")
+    print(bridges)
+    print(f"\nVolume lu : {io['bytes_read']} octets (fichier d'adjacence : {io['file_bytes']} octets)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 
 # src/graph.py
 
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : les tableaux du module array suffisent
+    np = None
+
 class Graph:
     def __init__(self):
         # Dictionnaire : clé = sommet, valeur = ensemble des voisins
@@ -28,5 +35,180 @@ class Graph:
     def neighbors(self, v):
         return list(self.adj.get(v, []))
 
+    def edges(self):
+        """
+        Renvoie la liste triée des arêtes (u, v) avec u < v.
+        """
+        return sorted((u, v) for u in self.adj for v in self.adj[u] if u < v)
+
     def __str__(self):
         return "\n".join(f"{v}: {neighbors}" for v, neighbors in self.adj.items())
+
+
+class CSRGraph:
+    """
+    Représentation compacte et immuable d'un graphe non orienté au format CSR
+    (Compressed Sparse Row) : les voisins du sommet v sont indices[indptr[v]:indptr[v + 1]].
+
+    Les sommets sont les entiers 0..n-1. Les tableaux sont des array du module standard,
+    ce qui coûte quelques octets par arête au lieu de plusieurs centaines pour un dict de sets.
+    L'interface de lecture (vertices(), neighbors(v), edges()) est la même que celle de Graph.
+    """
+    __slots__ = ("indptr", "indices", "_indices_view")
+
+    def __init__(self, indptr, indices):
+        object.__setattr__(self, "indptr", indptr)
+        object.__setattr__(self, "indices", indices)
+        object.__setattr__(self, "_indices_view", memoryview(indices).toreadonly())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CSRGraph est immuable")
+
+    @classmethod
+    def from_edges(cls, num_vertices, edges):
+        """
+        Construit un CSRGraph à partir d'un nombre de sommets et d'un itérable d'arêtes (u, v).
+        Les boucles et les arêtes en double sont ignorées.
+
+        :param num_vertices: Nombre de sommets n (identifiants 0..n-1).
+        :param edges: Itérable de couples (u, v).
+        :return: Instance de CSRGraph.
+        """
+        typecode = "i" if num_vertices < 2 ** 31 else "q"
+        src = array(typecode)
+        dst = array(typecode)
+        for u, v in edges:
+            if u == v:
+                continue
+            if not (0 <= u < num_vertices and 0 <= v < num_vertices):
+                raise ValueError(f"Arête ({u}, {v}) hors de l'intervalle des sommets 0..{num_vertices - 1}")
+            src.append(u)
+            dst.append(v)
+        return cls._from_arrays(num_vertices, src, dst, typecode)
+
+    @classmethod
+    def from_edge_arrays(cls, num_vertices, src, dst):
+        """
+        Construit un CSRGraph à partir de deux tableaux d'entiers de même longueur (extrémités
+        des arêtes). Avec des tableaux NumPy, la construction est entièrement vectorisée et les
+        tableaux indptr/indices du résultat sont des ndarray.
+        """
+        if np is None or not isinstance(src, np.ndarray):
+            return cls.from_edges(num_vertices, zip(src, dst))
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if len(src) and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= num_vertices):
+            raise ValueError(f"Arête hors de l'intervalle des sommets 0..{num_vertices - 1}")
+        keep = src != dst
+        u = np.concatenate((src[keep], dst[keep]))
+        v = np.concatenate((dst[keep], src[keep]))
+        # Tri par clé combinée u * n + v, puis suppression des doublons
+        keys = u * num_vertices + v
+        keys.sort()
+        if len(keys):
+            keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        u, v = np.divmod(keys, num_vertices) if num_vertices else (keys, keys)
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(u, minlength=num_vertices), out=indptr[1:])
+        indices = v.astype(np.int32 if num_vertices < 2 ** 31 else np.int64)
+        return cls(indptr, indices)
+
+    @classmethod
+    def _from_arrays(cls, num_vertices, src, dst, typecode):
+        # Comptage des degrés (chaque arête est stockée dans les deux sens)
+        degree = array("q", bytes(8 * (num_vertices + 1)))
+        for u in src:
+            degree[u + 1] += 1
+        for v in dst:
+            degree[v + 1] += 1
+        for i in range(num_vertices):
+            degree[i + 1] += degree[i]
+        indptr = degree
+        fill = array("q", indptr)
+        indices = array(typecode, bytes(array(typecode).itemsize * indptr[num_vertices]))
+        for u, v in zip(src, dst):
+            indices[fill[u]] = v
+            fill[u] += 1
+            indices[fill[v]] = u
+            fill[v] += 1
+        # Tri et dédoublonnage des listes de voisins
+        write = 0
+        for u in range(num_vertices):
+            start, end = indptr[u], indptr[u + 1]
+            indptr[u] = write
+            previous = -1
+            for v in sorted(indices[start:end]):
+                if v != previous:
+                    indices[write] = v
+                    write += 1
+                    previous = v
+        indptr[num_vertices] = write
+        del indices[write:]
+        return cls(indptr, indices)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Construit un CSRGraph à partir d'une instance de Graph dont les sommets sont des entiers
+        positifs ou nuls. Les identifiants absents de Graph deviennent des sommets isolés.
+        """
+        vertices = graph.vertices()
+        num_vertices = max(vertices) + 1 if vertices else 0
+        return cls.from_edges(num_vertices, graph.edges())
+
+    @classmethod
+    def from_edge_file(cls, file_path):
+        """
+        Construit un CSRGraph directement depuis un fichier d'arêtes (texte "N M", texte gzip
+        ou binaire, voir src/loader.py), sans passer par un Graph intermédiaire.
+        """
+        from loader import read_edge_arrays
+        num_vertices, src, dst = read_edge_arrays(file_path)
+        return cls.from_edge_arrays(num_vertices, src, dst)
+
+    def to_graph(self):
+        """
+        Renvoie une copie modifiable sous forme de Graph.
+        """
+        g = Graph()
+        for u in self.vertices():
+            g.add_vertex(u)
+        for u, v in self.edges():
+            g.add_edge(u, v)
+        return g
+
+    @property
+    def num_vertices(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.indices) // 2
+
+    def vertices(self):
+        return range(self.num_vertices)
+
+    def neighbors(self, v):
+        # Tranche sans copie (memoryview en lecture seule) du tableau des voisins
+        if not 0 <= v < self.num_vertices:
+            return self._indices_view[0:0]
+        return self._indices_view[self.indptr[v]:self.indptr[v + 1]]
+
+    def degree(self, v):
+        return int(self.indptr[v + 1] - self.indptr[v])
+
+    def edges(self):
+        """
+        Renvoie la liste triée des arêtes (u, v) avec u < v.
+        """
+        indptr, indices = self.indptr, self.indices
+        if np is not None and isinstance(indices, np.ndarray):
+            u = np.repeat(np.arange(self.num_vertices), np.diff(indptr))
+            forward = u < indices
+            return list(zip(u[forward].tolist(), indices[forward].tolist()))
+        return [(u, indices[i]) for u in range(self.num_vertices)
+                for i in range(indptr[u], indptr[u + 1]) if u < indices[i]]
+
+    def __str__(self):
+        return "\n".join(f"{v}: {list(self.neighbors(v))}" for v in self.vertices())
+
@@ -0,0 +1,506 @@
+# src/history.py
+
+"""
+Historique versionné de l'état DFS : chaque sauvegarde ajoute une version à un fichier en
+ajout seul (<base>.history), sans réécrire les précédentes.
+
+Une version est enregistrée soit comme point de reprise complet (sommets, colonnes disc, low
+et parent, drapeaux des points d'articulation), soit comme delta par rapport à la version
+précédente : sommets ajoutés, points d'articulation gagnés et perdus, et plages contiguës des
+colonnes disc/low/parent qui ont changé, avec leurs nouvelles valeurs. Un point de reprise est
+écrit toutes les checkpoint_interval versions, lorsque le delta serait plus gros que l'état
+complet, ou lorsque l'ensemble des sommets n'est plus une extension du précédent.
+
+Reconstruire une version coûte la lecture d'un point de reprise et l'application d'au plus
+checkpoint_interval deltas ; les requêtes (points d'articulation d'une version, différence
+entre deux versions, historique d'un sommet) sont servies sans nouveau parcours du graphe.
+
+Usage:
+    python src/history.py <graph_file> list
+    python src/history.py <graph_file> ap VERSION
+    python src/history.py <graph_file> diff VERSION1 VERSION2
+    python src/history.py <graph_file> timeline VERTEX
+    python src/history.py <graph_file> at TIMESTAMP
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import namedtuple
+
+from dfs_state import DFSState
+from interning import IdInterner
+from state_manager import StateCorruptedError
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, les plages modifiées sont cherchées en Python
+    np = None
+
+RECORD_MAGIC = b"PXHR"
+# magic, type, version, horodatage (secondes), taille du contenu, CRC32 du contenu
+RECORD_HEADER = struct.Struct("<4sB3xQdQI")
+CHECKPOINT, DELTA = 0, 1
+CHECKPOINT_INTERVAL = 32
+HISTORY_COLUMNS = ("disc", "low", "parent")
+COUNT = struct.Struct("<Q")
+
+Record = namedtuple("Record", "version timestamp kind offset size crc")
+
+
+def history_path(graph_file):
+    """
+    Nom du fichier d'historique associé à un fichier d'arêtes (data/g.txt -> data/g.history).
+    """
+    return os.path.splitext(graph_file)[0] + ".history"
+
+
+class HistoryStore:
+    """
+    Fichier d'historique des versions de l'état DFS (voir le module). L'index des versions
+    est construit à la première requête en ne lisant que les en-têtes ; un enregistrement
+    incomplet en fin de fichier (écriture interrompue) est ignoré puis écrasé par l'ajout suivant.
+    """
+
+    def __init__(self, path, checkpoint_interval=CHECKPOINT_INTERVAL):
+        """
+        :param path: Fichier d'historique (créé au premier enregistrement).
+        :param checkpoint_interval: Nombre maximal de deltas entre deux points de reprise.
+        """
+        self.path = path
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self._records = None
+        self._end = 0
+        self._cache = None  # (version, DFSState) : dernière version reconstruite ou enregistrée
+
+    # --- Index ---
+
+    def records(self):
+        """
+        Enregistrements valides du fichier, par version croissante.
+        """
+        if self._records is None:
+            self._records, self._end = _scan(self.path)
+        return self._records
+
+    def latest(self):
+        """
+        Numéro de la dernière version (0 si l'historique est vide).
+        """
+        records = self.records()
+        return records[-1].version if records else 0
+
+    def versions(self):
+        """
+        Liste de dictionnaires {"version", "timestamp", "kind"} ("checkpoint" ou "delta").
+        """
+        return [{"version": r.version, "timestamp": r.timestamp,
+                 "kind": "checkpoint" if r.kind == CHECKPOINT else "delta"} for r in self.records()]
+
+    def version_at(self, timestamp):
+        """
+        Dernière version enregistrée à l'instant timestamp ou avant (None s'il n'y en a pas).
+        """
+        found = None
+        for record in self.records():
+            if record.timestamp > timestamp:
+                break
+            found = record.version
+        return found
+
+    def _record(self, version):
+        records = self.records()
+        if not records or not records[0].version <= version <= records[-1].version:
+            raise ValueError(f"Version inconnue : {version}")
+        return version - records[0].version
+
+    # --- Enregistrement ---
+
+    def commit(self, state, timestamp=None):
+        """
+        Enregistre l'état comme nouvelle version s'il diffère de la dernière.
+
+        :param state: DFSState (les colonnes disc, low, parent et les drapeaux sont lus).
+        :param timestamp: Horodatage en secondes (par défaut, l'heure courante).
+        :return: Numéro de la version enregistrée, ou None si l'état est inchangé.
+        """
+        records = self.records()
+        previous = self.state_at(records[-1].version) if records else None
+        payload = _encode_delta(previous, state) if previous is not None else None
+        if payload == b"":
+            return None
+        since = next((i for i, r in enumerate(reversed(records)) if r.kind == CHECKPOINT), len(records))
+        checkpoint = _encode_checkpoint(state)
+        if payload is None or since + 1 >= self.checkpoint_interval or len(payload) >= len(checkpoint):
+            kind, payload = CHECKPOINT, checkpoint
+        else:
+            kind = DELTA
+        version = self.latest() + 1
+        timestamp = time.time() if timestamp is None else timestamp
+        crc = zlib.crc32(payload)
+        with open(self.path, "ab") as f:
+            # Un enregistrement interrompu en fin de fichier est écrasé
+            f.truncate(self._end)
+            f.seek(self._end)
+            f.write(RECORD_HEADER.pack(RECORD_MAGIC, kind, version, timestamp, len(payload), crc))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        offset = self._end + RECORD_HEADER.size
+        records.append(Record(version, timestamp, kind, offset, len(payload), crc))
+        self._end = offset + len(payload)
+        self._cache = (version, _history_state(state))
+        return version
+
+    # --- Reconstruction et requêtes ---
+
+    def state_at(self, version):
+        """
+        Reconstruit l'état DFS d'une version : dernier point de reprise, puis deltas suivants
+        (en repartant de la dernière version reconstruite lorsqu'elle est plus proche).
+
+        :return: DFSState (colonnes disc, low, parent et points d'articulation).
+        """
+        records = self.records()
+        i = self._record(version)
+        start = i
+        while records[start].kind != CHECKPOINT:
+            start -= 1
+        if self._cache is not None and records[start].version <= self._cache[0] <= version:
+            state = self._cache[1].copy()
+            start = self._cache[0] - records[0].version + 1
+        else:
+            state = _decode_checkpoint(self._read(records[start]))
+            start += 1
+        for record in records[start:i + 1]:
+            _apply_delta(state, _decode_delta(self._read(record)))
+        self._cache = (version, state.copy())
+        return state
+
+    def articulation_points(self, version):
+        """
+        Ensemble des points d'articulation d'une version.
+        """
+        return set(self.state_at(version).ap)
+
+    def ap_diff(self, old, new):
+        """
+        Points d'articulation gagnés et perdus entre deux versions.
+
+        :return: Tuple (added, removed) de listes triées.
+        """
+        before, after = self.articulation_points(old), self.articulation_points(new)
+        return sorted(after - before), sorted(before - after)
+
+    def ap_timeline(self, vertex):
+        """
+        Historique d'un sommet : versions où il devient ou cesse d'être un point d'articulation.
+        Seuls les drapeaux des points de reprise et les différences des deltas sont lus.
+
+        :return: Liste de dictionnaires {"version", "timestamp", "ap"}.
+        """
+        timeline = []
+        current = False
+        position = count = None
+        for record in self.records():
+            payload = self._read(record)
+            if record.kind == CHECKPOINT:
+                vertices, flags = _checkpoint_flags(payload)
+                position = _find(vertices, vertex, len(flags))
+                is_ap = position is not None and bool(flags[position])
+                count = len(flags)
+            else:
+                delta = _decode_delta(payload, columns=False)
+                if position is None:
+                    if delta["appended"] is None:
+                        position = _find(None, vertex, delta["n"])
+                    else:
+                        found = _find(delta["appended"], vertex, len(delta["appended"]))
+                        position = None if found is None else count + found
+                count = delta["n"]
+                is_ap = current
+                if position is not None:
+                    if position in delta["ap_added"]:
+                        is_ap = True
+                    elif position in delta["ap_removed"]:
+                        is_ap = False
+            if is_ap != current:
+                timeline.append({"version": record.version, "timestamp": record.timestamp, "ap": is_ap})
+            current = is_ap
+        return timeline
+
+    def _read(self, record):
+        with open(self.path, "rb") as f:
+            f.seek(record.offset)
+            payload = f.read(record.size)
+        if len(payload) != record.size or zlib.crc32(payload) != record.crc:
+            raise StateCorruptedError(f"Version {record.version} corrompue dans {self.path}")
+        return payload
+
+
+def _scan(path):
+    # Lit les en-têtes des enregistrements et renvoie (enregistrements valides, fin du dernier)
+    records = []
+    end = 0
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return records, end
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        while end + RECORD_HEADER.size <= size:
+            f.seek(end)
+            magic, kind, version, timestamp, length, crc = RECORD_HEADER.unpack(f.read(RECORD_HEADER.size))
+            offset = end + RECORD_HEADER.size
+            if magic != RECORD_MAGIC or offset + length > size:
+                break
+            if records and version != records[-1].version + 1:
+                raise StateCorruptedError(f"Historique {path} incohérent à la version {version}")
+            records.append(Record(version, timestamp, kind, offset, length, crc))
+            end = offset + length
+    return records, end
+
+
+# --- Encodage ---
+
+def _history_state(state):
+    # Copie des seules données historisées (sommets, disc, low, parent, drapeaux)
+    vertices = None if state.positions is None else state.vertices[:]
+    return DFSState(vertices, {name: state.columns[name][:] for name in HISTORY_COLUMNS},
+                    state.ap_flags, len(state))
+
+
+def _to_bytes(values):
+    values = values if isinstance(values, array) else array("q", values)
+    if sys.byteorder != "little":
+        values = values[:]
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data):
+    values = array("q")
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _encode_checkpoint(state):
+    n = len(state)
+    parts = [COUNT.pack(n), COUNT.pack(state.positions is not None)]
+    if state.positions is not None:
+        parts.append(_to_bytes(state.vertices))
+    parts.extend(_to_bytes(state.columns[name]) for name in HISTORY_COLUMNS)
+    parts.append(bytes(state.ap_flags))
+    return b"".join(parts)
+
+
+def _checkpoint_flags(payload):
+    n, sparse = COUNT.unpack_from(payload, 0)[0], COUNT.unpack_from(payload, 8)[0]
+    pos = 16
+    vertices = None
+    if sparse:
+        vertices = _from_bytes(payload[pos:pos + 8 * n])
+        pos += 8 * n
+    pos += 8 * n * len(HISTORY_COLUMNS)
+    return vertices, payload[pos:pos + n]
+
+
+def _decode_checkpoint(payload):
+    vertices, flags = _checkpoint_flags(payload)
+    n = len(flags)
+    pos = 16 + (0 if vertices is None else 8 * n)
+    columns = {}
+    for name in HISTORY_COLUMNS:
+        columns[name] = _from_bytes(payload[pos:pos + 8 * n])
+        pos += 8 * n
+    return DFSState(vertices, columns, flags, n)
+
+
+def _changed_runs(old, new):
+    # Plages [début, fin) où les deux colonnes diffèrent ; les positions au-delà de old sont nouvelles
+    n_old, n_new = min(len(old), len(new)), len(new)
+    if np is not None:
+        a = np.frombuffer(old, dtype=np.int64, count=n_old)
+        b = np.frombuffer(new, dtype=np.int64, count=n_old)
+        changed = np.flatnonzero(a != b)
+        breaks = np.flatnonzero(np.diff(changed) != 1) + 1
+        starts = np.concatenate((changed[:1], changed[breaks])).tolist()
+        ends = np.concatenate((changed[breaks - 1], changed[-1:])).tolist() if len(changed) else []
+        runs = [(s, e + 1) for s, e in zip(starts, ends)]
+    else:
+        runs = []
+        for i in range(n_old):
+            if old[i] != new[i]:
+                if runs and runs[-1][1] == i:
+                    runs[-1] = (runs[-1][0], i + 1)
+                else:
+                    runs.append((i, i + 1))
+    if n_new > n_old:
+        if runs and runs[-1][1] == n_old:
+            runs[-1] = (runs[-1][0], n_new)
+        else:
+            runs.append((n_old, n_new))
+    return runs
+
+
+def _encode_delta(previous, state):
+    # Delta de previous vers state, b"" si rien n'a changé, None si un point de reprise s'impose
+    n_old, n = len(previous), len(state)
+    if n < n_old or (previous.positions is None) != (state.positions is None):
+        return None
+    appended = None
+    if state.positions is not None:
+        if state.vertices[:n_old] != previous.vertices:
+            return None
+        appended = state.vertices[n_old:]
+    flags = state.ap_flags
+    changes = _flag_changes(previous.ap_flags + bytes(n - n_old), flags)
+    ap_added = array("q", (i for i in changes if flags[i]))
+    ap_removed = array("q", (i for i in changes if not flags[i]))
+    runs = {name: _changed_runs(previous.columns[name], state.columns[name]) for name in HISTORY_COLUMNS}
+    if n == n_old and not changes and not any(runs.values()):
+        return b""
+    # Nombre de sommets ajoutés + 1 (0 pour des sommets 0..N-1)
+    parts = [COUNT.pack(n), COUNT.pack(0 if appended is None else len(appended) + 1)]
+    if appended is not None:
+        parts.append(_to_bytes(appended))
+    for values in (ap_added, ap_removed):
+        parts.append(COUNT.pack(len(values)))
+        parts.append(_to_bytes(values))
+    for name in HISTORY_COLUMNS:
+        column = state.columns[name]
+        parts.append(COUNT.pack(len(runs[name])))
+        parts.append(_to_bytes(array("q", (bound for run in runs[name] for bound in run))))
+        parts.extend(_to_bytes(column[s:e]) for s, e in runs[name])
+    return b"".join(parts)
+
+
+def _flag_changes(old, new):
+    if np is not None:
+        a = np.frombuffer(bytes(old), dtype=np.uint8)
+        b = np.frombuffer(bytes(new), dtype=np.uint8)
+        return np.flatnonzero(a != b).tolist()
+    return [i for i, (x, y) in enumerate(zip(old, new)) if x != y]
+
+
+def _decode_delta(payload, columns=True):
+    n = COUNT.unpack_from(payload, 0)[0]
+    k = COUNT.unpack_from(payload, 8)[0]
+    pos = 16
+    appended = None
+    if k:
+        appended = _from_bytes(payload[pos:pos + 8 * (k - 1)])
+        pos += 8 * (k - 1)
+    delta = {"n": n, "appended": appended}
+    for name in ("ap_added", "ap_removed"):
+        count = COUNT.unpack_from(payload, pos)[0]
+        delta[name] = set(_from_bytes(payload[pos + 8:pos + 8 + 8 * count]))
+        pos += 8 + 8 * count
+    if columns:
+        for name in HISTORY_COLUMNS:
+            count = COUNT.unpack_from(payload, pos)[0]
+            bounds = _from_bytes(payload[pos + 8:pos + 8 + 16 * count])
+            pos += 8 + 16 * count
+            runs = []
+            for j in range(count):
+                s, e = bounds[2 * j], bounds[2 * j + 1]
+                runs.append((s, e, _from_bytes(payload[pos:pos + 8 * (e - s)])))
+                pos += 8 * (e - s)
+            delta[name] = runs
+    return delta
+
+
+def _apply_delta(state, delta):
+    n_old = len(state)
+    grow = delta["n"] - n_old
+    if grow > 0:
+        for column in state.columns.values():
+            column.extend(array("q", [0]) * grow)
+        state.ap_flags.extend(bytes(grow))
+    if delta["appended"] is not None:
+        for i, v in enumerate(delta["appended"], n_old):
+            state.vertices.append(v)
+            state.positions[v] = i
+    for name in HISTORY_COLUMNS:
+        column = state.columns[name]
+        for s, e, values in delta[name]:
+            column[s:e] = values
+    for i in delta["ap_added"]:
+        state.ap_flags[i] = 1
+    for i in delta["ap_removed"]:
+        state.ap_flags[i] = 0
+
+
+def _find(vertices, vertex, n):
+    # Position d'un sommet (vertices None : sommets 0..n-1)
+    if vertices is None:
+        return vertex if isinstance(vertex, int) and 0 <= vertex < n else None
+    try:
+        return vertices.index(vertex)
+    except (ValueError, TypeError):
+        return None
+
+
+# --- Ligne de commande ---
+
+def run_command(store, command, args, interner=None):
+    """
+    Exécute une requête sur l'historique et renvoie un résultat sérialisable en JSON.
+
+    :param store: HistoryStore.
+    :param command: "list", "ap", "diff", "timeline" ou "at".
+    :param args: Arguments de la requête (chaînes).
+    :param interner: Table des identifiants (IdInterner) si l'état est indexé.
+    """
+    externals = interner.externals if interner else sorted
+    if command == "list":
+        return store.versions()
+    if command == "ap":
+        version = int(args[0])
+        return {"version": version, "articulation_points": externals(store.articulation_points(version))}
+    if command == "diff":
+        old, new = int(args[0]), int(args[1])
+        added, removed = store.ap_diff(old, new)
+        return {"from": old, "to": new, "added": externals(added), "removed": externals(removed)}
+    if command == "timeline":
+        vertex = interner.code(interner.parse(args[0])) if interner else int(args[0])
+        return {"vertex": args[0], "timeline": store.ap_timeline(vertex)}
+    if command == "at":
+        return {"timestamp": float(args[0]), "version": store.version_at(float(args[0]))}
+    raise ValueError(f"Requête inconnue : {command}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requêtes sur l'historique des versions de l'état DFS.")
+    parser.add_argument("graph_file", help="Fichier d'arêtes dont l'historique a été tenu par main.py --history")
+    parser.add_argument("--history-file", help="Fichier d'historique (par défaut : <graph_file>.history)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="Versions enregistrées")
+    subparsers.add_parser("ap", help="Points d'articulation d'une version").add_argument("version")
+    diff = subparsers.add_parser("diff", help="Points d'articulation gagnés et perdus entre deux versions")
+    diff.add_argument("version1")
+    diff.add_argument("version2")
+    subparsers.add_parser("timeline", help="Versions où un sommet devient ou cesse d'être un point d'articulation"
+                          ).add_argument("vertex")
+    subparsers.add_parser("at", help="Version en vigueur à un instant (secondes depuis l'epoch)").add_argument("timestamp")
+    args = parser.parse_args()
+
+    store = HistoryStore(args.history_file or history_path(args.graph_file))
+    interner = IdInterner.load(os.path.splitext(args.graph_file)[0] + ".ids")
+    values = [getattr(args, name) for name in ("version", "version1", "version2", "vertex", "timestamp")
+              if hasattr(args, name)]
+    try:
+        print(json.dumps(run_command(store, args.command, values, interner)))
+    except (ValueError, KeyError) as e:
+        parser.exit(1, f"Erreur : {e}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# src/instrumentation.py
+
+import json
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+
+class Metrics:
+    """
+    Instrumentation du chemin critique : compteurs (nœuds visités, arêtes parcourues,
+    taille des zones recalculées, ...) et chronomètres de phases (time.perf_counter).
+
+    Désactivée par défaut : count() et phase() se réduisent alors à un test de booléen,
+    et les boucles du moteur DFS ne consultent l'état qu'une fois par parcours.
+    Le mode verbeux ajoute des traces détaillées (par exemple un message par nœud recalculé).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.verbose = False
+        self.counters = {}
+        self.phases = {}
+
+    def configure(self, enabled=True, verbose=False):
+        """
+        Active ou désactive l'instrumentation. Le mode verbeux implique l'activation.
+        """
+        self.enabled = enabled or verbose
+        self.verbose = verbose
+
+    def reset(self):
+        """
+        Remet à zéro les compteurs et les chronomètres.
+        """
+        self.counters.clear()
+        self.phases.clear()
+
+    def count(self, name, value=1):
+        """
+        Incrémente le compteur 'name' de 'value' (sans effet si l'instrumentation est désactivée).
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Chronomètre le bloc 'with' et cumule sa durée (en secondes) dans la phase 'name'.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            self.trace(f"[phase] {name} : {elapsed:.6f} s")
+
+    def trace(self, message):
+        """
+        Affiche une trace détaillée en mode verbeux uniquement. Dans une boucle, tester
+        metrics.verbose avant de construire le message évite tout coût en mode normal.
+        """
+        if self.verbose:
+            print(message)
+
+    def to_dict(self):
+        """
+        Renvoie les mesures sous forme de dictionnaire sérialisable.
+        """
+        return {"counters": dict(self.counters), "phases": dict(self.phases)}
+
+    def export_json(self, filename):
+        """
+        Écrit les mesures dans un fichier JSON ("-" pour la sortie standard).
+        """
+        if filename == "-":
+            json.dump(self.to_dict(), sys.stdout, indent=2)
+            print()
+            return
+        with open(filename, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self):
+        """
+        Renvoie un résumé lisible des compteurs et des phases.
+        """
+        lines = [f"  {name} : {value}" for name, value in sorted(self.counters.items())]
+        lines += [f"  {name} : {seconds:.6f} s" for name, seconds in self.phases.items()]
+        return "\n".join(lines)
+
+
+# Instance partagée par tous les modules (désactivée par défaut)
+metrics = Metrics()
@@ -0,0 +1,168 @@
+# src/interning.py
+
+import struct
+import sys
+from array import array
+from state_manager import atomic_write
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, les identifiants sont indexés un par un
+    np = None
+
+# Format binaire de la table des identifiants (fichier .ids enregistré à côté de l'état) :
+#   en-tête de 24 octets : signature (8 octets), version (uint32), type (uint32), nombre N (uint64)
+#   type IDS_RANGE   : identifiants 0..N-1, aucune donnée ;
+#   type IDS_INTEGER : N entiers signés little-endian sur 8 octets ;
+#   type IDS_STRING  : N + 1 positions (entiers sur 8 octets) puis les chaînes UTF-8 concaténées.
+IDS_MAGIC = b"PARXIDS\0"
+IDS_VERSION = 1
+IDS_HEADER = struct.Struct("<8sIIQ")
+IDS_RANGE, IDS_INTEGER, IDS_STRING = 0, 1, 2
+
+
+class IdInterner:
+    """
+    Table de correspondance entre les identifiants externes des sommets (entiers épars, comme
+    des numéros d'AS sur 64 bits, ou chaînes, comme des noms d'hôtes) et des indices denses
+    0..N-1. Les moteurs (DFS, actualisation incrémentale, état sauvegardé) ne manipulent que
+    les indices denses ; la traduction vers les identifiants d'origine n'a lieu qu'en entrée
+    et en sortie de l'API.
+    """
+
+    def __init__(self, ids=(), numeric=True):
+        """
+        :param ids: Identifiants externes, dans l'ordre des indices denses.
+        :param numeric: True si les identifiants sont des entiers, False pour des chaînes.
+        """
+        self.ids = list(ids)
+        self.numeric = numeric
+        self.index = {external: code for code, external in enumerate(self.ids)}
+
+    @classmethod
+    def from_values(cls, values, numeric=True):
+        """
+        Indexe une suite d'identifiants externes : les identifiants distincts reçoivent les
+        indices 0..N-1 dans l'ordre croissant, si bien que la table ne dépend que de leur ensemble.
+
+        :param values: Identifiants (tableau NumPy d'entiers, ou séquence quelconque).
+        :param numeric: True si les identifiants sont des entiers.
+        :return: Tuple (interner, codes) : la table et l'indice dense de chaque valeur.
+        """
+        if numeric and np is not None:
+            unique, codes = np.unique(np.asarray(values, dtype=np.int64), return_inverse=True)
+            return cls(unique.tolist(), numeric), codes.ravel().astype(np.int64, copy=False)
+        interner = cls(sorted(set(values)), numeric)
+        index = interner.index
+        return interner, array("q", (index[v] for v in values))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def parse(self, token):
+        """
+        Convertit un identifiant lu dans un texte (commande, journal) : entier ou chaîne selon la table.
+        """
+        if isinstance(token, bytes):
+            token = token.decode("utf-8")
+        return int(token) if self.numeric else token
+
+    def intern(self, external):
+        """
+        Renvoie l'indice dense d'un identifiant, en l'ajoutant à la fin de la table s'il est nouveau.
+        """
+        code = self.index.get(external)
+        if code is None:
+            code = len(self.ids)
+            self.ids.append(external)
+            self.index[external] = code
+        return code
+
+    def merge(self, other):
+        """
+        Intègre les identifiants d'une autre table : ceux déjà connus gardent leur indice, les
+        nouveaux sont ajoutés à la fin. Un état sauvegardé reste ainsi valable d'un lancement à l'autre.
+
+        :param other: Table (IdInterner) à intégrer.
+        :return: Liste donnant, pour chaque indice de other, l'indice correspondant dans self.
+        """
+        return [self.intern(external) for external in other.ids]
+
+    def code(self, external):
+        """
+        Renvoie l'indice dense d'un identifiant connu (ValueError s'il est inconnu).
+        """
+        try:
+            return self.index[external]
+        except KeyError:
+            raise ValueError(f"Sommet inconnu : {external}") from None
+
+    def external(self, code):
+        """
+        Renvoie l'identifiant d'origine d'un indice dense.
+        """
+        return self.ids[code]
+
+    def externals(self, codes):
+        """
+        Traduit un ensemble d'indices denses en liste triée d'identifiants d'origine.
+        """
+        ids = self.ids
+        return sorted(ids[c] for c in codes)
+
+    def external_edges(self, edges):
+        """
+        Traduit des arêtes (u, v) en indices denses en liste triée d'arêtes d'origine (u < v).
+        """
+        ids = self.ids
+        return sorted((min(ids[u], ids[v]), max(ids[u], ids[v])) for u, v in edges)
+
+    def save(self, filename):
+        """
+        Écrit la table (de façon atomique) dans le format binaire compact décrit en tête du module.
+        """
+        n = len(self.ids)
+        if not self.numeric:
+            blobs = [s.encode("utf-8") for s in self.ids]
+            offsets = array("q", [0])
+            for blob in blobs:
+                offsets.append(offsets[-1] + len(blob))
+            kind, payload = IDS_STRING, [offsets, b"".join(blobs)]
+        elif self.ids == list(range(n)):
+            kind, payload = IDS_RANGE, []
+        else:
+            kind, payload = IDS_INTEGER, [array("q", self.ids)]
+        with atomic_write(filename) as f:
+            f.write(IDS_HEADER.pack(IDS_MAGIC, IDS_VERSION, kind, n))
+            for part in payload:
+                if isinstance(part, array):
+                    if sys.byteorder != "little":
+                        part.byteswap()
+                    part = part.tobytes()
+                f.write(part)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Relit une table écrite par save.
+
+        :return: Instance d'IdInterner, ou None si le fichier n'existe pas.
+        """
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        magic, version, kind, n = IDS_HEADER.unpack_from(data)
+        if magic != IDS_MAGIC or version != IDS_VERSION or kind not in (IDS_RANGE, IDS_INTEGER, IDS_STRING):
+            raise ValueError(f"Table d'identifiants non reconnue (version {version}, type {kind})")
+        if kind == IDS_RANGE:
+            return cls(range(n))
+        values = array("q")
+        values.frombytes(data[IDS_HEADER.size:IDS_HEADER.size + 8 * (n if kind == IDS_INTEGER else n + 1)])
+        if sys.byteorder != "little":
+            values.byteswap()
+        if kind == IDS_INTEGER:
+            return cls(values.tolist())
+        blob = data[IDS_HEADER.size + 8 * (n + 1):]
+        return cls([blob[values[i]:values[i + 1]].decode("utf-8") for i in range(n)], numeric=False)
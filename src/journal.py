@@ -0,0 +1,93 @@
+# src/journal.py
+
+# Journal des modifications d'arêtes, en ajout seul : une modification par ligne,
+#   "+ u v" pour l'ajout de l'arête (u, v), "- u v" pour sa suppression.
+# Les lignes vides et les commentaires (commençant par "#") sont ignorés. Le journal est
+# rejoué sur l'état sauvegardé (l'instantané) puis vidé lors du compactage.
+
+COMPACT_THRESHOLD = 10000  # Nombre d'entrées à partir duquel le journal est compacté
+
+
+def parse_journal_line(line, line_number=None, convert=int):
+    """
+    Analyse une ligne du journal.
+
+    :param line: Ligne "+ u v" ou "- u v" (str ou bytes).
+    :param line_number: Numéro de la ligne, pour le message d'erreur.
+    :param convert: Conversion des identifiants de sommets (entiers par défaut).
+    :return: Tuple (op, u, v) avec op égal à "+" ou "-", ou None pour une ligne vide ou un commentaire.
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    parts = line.split()
+    if not parts or parts[0].startswith("#"):
+        return None
+    if len(parts) != 3 or parts[0] not in ("+", "-"):
+        where = f" (ligne {line_number})" if line_number is not None else ""
+        raise ValueError(f"Entrée de journal invalide{where} : attendu \"+ u v\" ou \"- u v\", lu {line.strip()!r}")
+    return parts[0], convert(parts[1]), convert(parts[2])
+
+
+def read_journal(journal_path, convert=int):
+    """
+    Lit toutes les entrées d'un journal.
+
+    :param journal_path: Chemin du journal.
+    :param convert: Conversion des identifiants de sommets (entiers par défaut).
+    :return: Liste de tuples (op, u, v), dans l'ordre du fichier (vide si le fichier n'existe pas).
+    """
+    entries = []
+    try:
+        with open(journal_path, "r") as f:
+            for number, line in enumerate(f, 1):
+                entry = parse_journal_line(line, number, convert)
+                if entry is not None:
+                    entries.append(entry)
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def append_journal(journal_path, added=(), removed=()):
+    """
+    Ajoute des entrées à la fin du journal (créé s'il n'existe pas).
+
+    :param added: Arêtes (u, v) ajoutées.
+    :param removed: Arêtes (u, v) supprimées.
+    """
+    with open(journal_path, "a") as f:
+        f.writelines(f"+ {u} {v}\n" for u, v in added)
+        f.writelines(f"- {u} {v}\n" for u, v in removed)
+
+
+def truncate_journal(journal_path):
+    """
+    Vide le journal après son compactage dans l'instantané.
+    """
+    open(journal_path, "w").close()
+
+
+def net_changes(entries, graph):
+    """
+    Réduit une suite d'entrées à son effet net sur le graphe : pour chaque arête, seule la
+    dernière opération compte, et les opérations sans effet (ajout d'une arête présente,
+    suppression d'une arête absente) sont écartées. Rejouer deux fois le même journal est
+    donc sans effet.
+
+    :param entries: Entrées (op, u, v) dans l'ordre du journal.
+    :param graph: Graphe de l'instantané (instance de Graph).
+    :return: Tuple (added, removed) d'ensembles d'arêtes (u, v) avec u < v.
+    """
+    last = {}
+    for op, u, v in entries:
+        if u != v:
+            last[(u, v) if u < v else (v, u)] = op
+    added, removed = set(), set()
+    adj = graph.adj
+    for (u, v), op in last.items():
+        present = u in adj and v in adj[u]
+        if op == "+" and not present:
+            added.add((u, v))
+        elif op == "-" and present:
+            removed.add((u, v))
+    return added, removed
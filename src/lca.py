@@ -0,0 +1,115 @@
+# src/lca.py
+
+class AncestorIndex:
+    """
+    Index des ancêtres de l'arbre DFS par pointeurs de saut (« skew-binary jump pointers »).
+
+    Chaque nœud stocke sa profondeur et un unique pointeur de saut vers un ancêtre, calculé
+    à partir de celui de son parent : l'index occupe O(1) par nœud, se construit en O(N) et
+    se répare en O(taille de la zone) lorsqu'un sous-arbre est recalculé. Les requêtes
+    (ancêtre de niveau donné, test d'ascendance, LCA) coûtent O(log profondeur), au lieu de
+    matérialiser deux chemins jusqu'à la racine.
+    """
+
+    def __init__(self, parent, depth=None, jump=None):
+        """
+        :param parent: Dictionnaire des parents de l'arbre DFS (partagé, non copié).
+        :param depth: Profondeurs déjà calculées (par exemple rechargées depuis l'état).
+        :param jump: Pointeurs de saut déjà calculés.
+        """
+        self.parent = parent
+        self.depth = {} if depth is None else depth
+        self.jump = {} if jump is None else jump
+
+    @classmethod
+    def build(cls, parent):
+        """
+        Construit l'index pour tout l'arbre DFS en O(N).
+
+        :param parent: Dictionnaire des parents (None pour une racine).
+        :return: Instance d'AncestorIndex.
+        """
+        index = cls(parent)
+        depth = index.depth
+        for v in parent:
+            if v in depth:
+                continue
+            # Remontée jusqu'à un nœud déjà indexé, puis calcul de haut en bas
+            path = []
+            node = v
+            while node is not None and node not in depth:
+                path.append(node)
+                node = parent[node]
+            for node in reversed(path):
+                index._set(node)
+        return index
+
+    def _set(self, v):
+        depth, jump = self.depth, self.jump
+        p = self.parent[v]
+        if p is None:
+            depth[v] = 0
+            jump[v] = v
+            return
+        depth[v] = depth[p] + 1
+        jp = jump[p]
+        if depth[p] - depth[jp] == depth[jp] - depth[jump[jp]]:
+            jump[v] = jump[jp]
+        else:
+            jump[v] = p
+
+    def repair(self, nodes, disc):
+        """
+        Met à jour l'index pour les nœuds d'une zone recalculée (dont le parent a pu changer).
+        Les nœuds sont traités par disc croissant, donc chaque parent avant ses enfants.
+
+        :param nodes: Nœuds recalculés.
+        :param disc: Dictionnaire des temps de découverte (après recalcul).
+        """
+        for v in sorted(nodes, key=disc.get):
+            self._set(v)
+
+    def level_ancestor(self, v, target_depth):
+        """
+        Renvoie l'ancêtre de v situé à la profondeur target_depth (<= profondeur de v).
+        """
+        depth, jump, parent = self.depth, self.jump, self.parent
+        while depth[v] > target_depth:
+            j = jump[v]
+            v = j if depth[j] >= target_depth else parent[v]
+        return v
+
+    def is_ancestor(self, a, b):
+        """
+        Indique si 'a' est un ancêtre de 'b' (ou 'b' lui-même).
+        """
+        depth = self.depth
+        return depth[a] <= depth[b] and self.level_ancestor(b, depth[a]) == a
+
+    def lca(self, x, y):
+        """
+        Renvoie le Lowest Common Ancestor de x et y, ou None s'ils sont dans des arbres distincts.
+        """
+        depth, jump, parent = self.depth, self.jump, self.parent
+        if depth[x] < depth[y]:
+            x, y = y, x
+        x = self.level_ancestor(x, depth[y])
+        while x != y:
+            if parent[x] is None:
+                return None
+            jx, jy = jump[x], jump[y]
+            if jx != jy:
+                x, y = jx, jy
+            else:
+                x, y = parent[x], parent[y]
+        return x
+
+    def lca_many(self, pairs):
+        """
+        Répond à un lot de requêtes LCA.
+
+        :param pairs: Itérable de couples (x, y).
+        :return: Liste des LCA (None pour deux nœuds d'arbres distincts), dans l'ordre des couples.
+        """
+        lca = self.lca
+        return [lca(x, y) for x, y in pairs]
@@ -0,0 +1,427 @@
+# src/loader.py
+
+import gzip
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from graph import Graph, CSRGraph
+from interning import IdInterner
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, l'analyse se fait par blocs avec le module array
+    np = None
+
+# Format binaire des arêtes (lisible par memory-map) :
+#   en-tête de 32 octets : signature (8 octets), version (uint32), taille d'un entier (uint32),
+#                          nombre de sommets N (uint64), nombre d'arêtes M (uint64)
+#   puis M couples (u, v) d'entiers signés little-endian de 4 ou 8 octets.
+BINARY_MAGIC = b"PARXEDGE"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<8sIIQQ")
+GZIP_MAGIC = b"\x1f\x8b"
+
+CHUNK_SIZE = 1 << 24  # Taille des blocs lus lors de l'analyse du format texte (16 Mo)
+FINGERPRINT_DIGEST_SIZE = 16  # Taille de l'empreinte BLAKE2b du contenu d'un fichier d'arêtes
+
+
+def detect_format(file_path):
+    """
+    Détecte le format d'un fichier d'arêtes à partir de ses premiers octets.
+
+    :param file_path: Chemin vers le fichier.
+    :return: "binary", "gzip" ou "text".
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(len(BINARY_MAGIC))
+    if head == BINARY_MAGIC:
+        return "binary"
+    if head[:2] == GZIP_MAGIC:
+        return "gzip"
+    return "text"
+
+
+def parse_header(line):
+    """
+    Analyse et valide la ligne d'en-tête "N M".
+
+    :param line: Première ligne du fichier (str ou bytes).
+    :return: Tuple (num_vertices, num_edges), ou None si la ligne est vide.
+    """
+    parts = line.split()
+    if not parts:
+        return None
+    if len(parts) < 2:
+        raise ValueError("La première ligne doit contenir deux entiers : num_vertices et num_edges")
+    num_vertices, num_edges = int(parts[0]), int(parts[1])
+    if num_vertices < 0 or num_edges < 0:
+        raise ValueError("num_vertices et num_edges doivent être positifs ou nuls")
+    return num_vertices, num_edges
+
+
+def _parse_chunk(chunk):
+    # Analyse en bloc d'un morceau de texte ne contenant que des lignes complètes ; chaque ligne
+    # non vide doit contenir exactement deux entiers (le flux d'entiers seul ne le garantit pas)
+    if np is None:
+        values = array("q")
+        for line in chunk.splitlines():
+            pair = line.split()
+            if pair:
+                if len(pair) != 2:
+                    raise ValueError("Chaque ligne d'arête doit contenir deux entiers : u v")
+                values.extend(map(int, pair))
+        return values
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    blank = data <= 32  # Espaces, tabulations et fins de ligne
+    newline = data == 10
+    start = ~blank
+    start[1:] &= blank[:-1]
+    # Suite des débuts d'entiers et des fins de ligne dans l'ordre du texte : le nombre
+    # d'entiers d'une ligne est l'écart entre deux fins de ligne consécutives
+    events = newline[start | newline]
+    per_line = np.diff(np.flatnonzero(np.concatenate(([True], events, [True])))) - 1
+    if np.any((per_line != 0) & (per_line != 2)):
+        raise ValueError("Chaque ligne d'arête doit contenir deux entiers : u v")
+    count = len(events) - np.count_nonzero(events)
+    if count == 0:
+        # Lignes vides seulement (fromstring renverrait [0])
+        return np.empty(0, dtype=np.int64)
+    values = np.fromstring(chunk, dtype=np.int64, sep=" ")
+    if len(values) != count:
+        raise ValueError("Chaque ligne d'arête doit contenir deux entiers : u v")
+    return values
+
+
+def _read_text_edges(f, chunk_size):
+    header = parse_header(f.readline())
+    if header is None:
+        return 0, 0, _empty(), _empty()
+    num_vertices, num_edges = header
+    src, dst = _read_text_values(f, chunk_size)
+    return num_vertices, num_edges, src, dst
+
+
+def _iter_text_chunks(f, chunk_size):
+    # Lit le reste du fichier par blocs de lignes complètes et renvoie les entiers de chaque bloc
+    remainder = b""
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            break
+        block = remainder + block
+        cut = block.rfind(b"\n") + 1
+        if cut == 0:
+            remainder = block
+            continue
+        remainder = block[cut:]
+        yield _parse_chunk(block[:cut])
+    if remainder.strip():
+        yield _parse_chunk(remainder)
+
+
+def _read_text_values(f, chunk_size):
+    # Lit le reste du fichier par blocs et renvoie les deux colonnes d'entiers (src, dst)
+    parts = list(_iter_text_chunks(f, chunk_size))
+    if np is not None:
+        values = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+        src, dst = values[0::2], values[1::2]
+    else:
+        values = array("q")
+        for part in parts:
+            values.extend(part)
+        src, dst = values[0::2], values[1::2]
+    if len(values) % 2:
+        raise ValueError("Chaque ligne d'arête doit contenir deux entiers : u v")
+    return src, dst
+
+
+def _read_binary_edges(file_path):
+    with open(file_path, "rb") as f:
+        magic, version, itemsize, num_vertices, num_edges = BINARY_HEADER.unpack(f.read(BINARY_HEADER.size))
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f"Format binaire d'arêtes non reconnu (version {version})")
+        if itemsize not in (4, 8):
+            raise ValueError(f"Taille d'entier invalide dans le fichier binaire : {itemsize}")
+        if num_edges == 0:
+            return num_vertices, num_edges, _empty(), _empty()
+        if np is not None:
+            dtype = np.dtype("<i4" if itemsize == 4 else "<i8")
+            pairs = np.memmap(file_path, dtype=dtype, mode="r", offset=BINARY_HEADER.size,
+                              shape=(num_edges, 2))
+            return num_vertices, num_edges, pairs[:, 0], pairs[:, 1]
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    end = BINARY_HEADER.size + 2 * itemsize * num_edges
+    if len(mapped) < end:
+        raise ValueError("Fichier binaire d'arêtes tronqué")
+    values = memoryview(mapped)[BINARY_HEADER.size:end].cast("i" if itemsize == 4 else "q")
+    return num_vertices, num_edges, values[0::2], values[1::2]
+
+
+def _empty():
+    return np.empty(0, dtype=np.int64) if np is not None else array("q")
+
+
+def _validate(num_vertices, num_edges, src, dst):
+    if len(src) != num_edges:
+        raise ValueError(f"L'en-tête annonce {num_edges} arêtes mais le fichier en contient {len(src)}")
+    if not len(src):
+        return
+    if np is not None and isinstance(src, np.ndarray):
+        low, high = min(src.min(), dst.min()), max(src.max(), dst.max())
+    else:
+        low, high = min(min(src), min(dst)), max(max(src), max(dst))
+    if low < 0 or high >= num_vertices:
+        raise ValueError(f"Identifiant de sommet hors de l'intervalle 0..{num_vertices - 1}")
+
+
+def read_edge_arrays(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Lit un fichier d'arêtes et renvoie ses extrémités sous forme de tableaux compacts.
+
+    Formats acceptés (détection automatique) :
+      - texte : première ligne "N M", puis une arête "u v" par ligne,
+      - texte compressé gzip (même contenu),
+      - binaire (voir write_binary_edges), ouvert en memory-map sans copie.
+
+    Le texte est lu par blocs de chunk_size octets et analysé en bloc (NumPy si disponible),
+    au lieu d'un appel à int() par ligne.
+
+    :param file_path: Chemin vers le fichier.
+    :param chunk_size: Taille des blocs de lecture pour le format texte.
+    :return: Tuple (num_vertices, src, dst) ; src et dst sont des ndarray NumPy
+             (ou des tableaux array / memoryview sans NumPy).
+    """
+    fmt = detect_format(file_path)
+    if fmt == "binary":
+        num_vertices, num_edges, src, dst = _read_binary_edges(file_path)
+    else:
+        opener = gzip.open if fmt == "gzip" else open
+        with opener(file_path, "rb") as f:
+            num_vertices, num_edges, src, dst = _read_text_edges(f, chunk_size)
+    _validate(num_vertices, num_edges, src, dst)
+    return num_vertices, src, dst
+
+
+def read_edge_header(file_path):
+    """
+    Lit uniquement l'en-tête d'un fichier d'arêtes (texte, gzip ou binaire).
+
+    :param file_path: Chemin vers le fichier.
+    :return: Tuple (num_vertices, num_edges).
+    """
+    fmt = detect_format(file_path)
+    if fmt == "binary":
+        with open(file_path, "rb") as f:
+            _, version, itemsize, num_vertices, num_edges = BINARY_HEADER.unpack(f.read(BINARY_HEADER.size))
+        if version != BINARY_VERSION:
+            raise ValueError(f"Format binaire d'arêtes non reconnu (version {version})")
+        return num_vertices, num_edges
+    opener = gzip.open if fmt == "gzip" else open
+    with opener(file_path, "rb") as f:
+        return parse_header(f.readline()) or (0, 0)
+
+
+def iter_edge_chunks(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Parcourt un fichier d'arêtes par blocs, sans jamais charger toutes les arêtes en mémoire :
+    chaque bloc est validé (parité, intervalle des sommets) et le nombre total d'arêtes est
+    comparé à l'en-tête à la fin du parcours.
+
+    :param file_path: Chemin vers le fichier (texte, gzip ou binaire).
+    :param chunk_size: Taille approximative des blocs, en octets.
+    :return: Générateur de tuples (src, dst) de tableaux d'entiers.
+    """
+    num_vertices, num_edges = read_edge_header(file_path)
+    seen = 0
+    for src, dst in _iter_edge_blocks(file_path, chunk_size):
+        seen += len(src)
+        if seen > num_edges:
+            raise ValueError(f"L'en-tête annonce {num_edges} arêtes mais le fichier en contient davantage")
+        _validate(num_vertices, len(src), src, dst)
+        yield src, dst
+    if seen != num_edges:
+        raise ValueError(f"L'en-tête annonce {num_edges} arêtes mais le fichier en contient {seen}")
+
+
+def _iter_edge_blocks(file_path, chunk_size):
+    fmt = detect_format(file_path)
+    if fmt == "binary":
+        _, num_edges, src, dst = _read_binary_edges(file_path)
+        step = max(1, chunk_size // 16)
+        for i in range(0, num_edges, step):
+            yield src[i:i + step], dst[i:i + step]
+        return
+    opener = gzip.open if fmt == "gzip" else open
+    with opener(file_path, "rb") as f:
+        if parse_header(f.readline()) is None:
+            return
+        for values in _iter_text_chunks(f, chunk_size):
+            if len(values) % 2:
+                raise ValueError("Chaque ligne d'arête doit contenir deux entiers : u v")
+            yield values[0::2], values[1::2]
+
+
+def load_graph(file_path):
+    """
+    Charge un fichier d'arêtes dans une instance de Graph (sommets 0..N-1).
+
+    :param file_path: Chemin vers le fichier.
+    :return: Graph.
+    """
+    num_vertices, src, dst = read_edge_arrays(file_path)
+    g = Graph()
+    for i in range(num_vertices):
+        g.add_vertex(i)
+    for u, v in zip(src.tolist(), dst.tolist()):
+        g.add_edge(u, v)
+    return g
+
+
+def read_labeled_edge_arrays(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Lit une liste d'arêtes aux identifiants quelconques (sans ligne d'en-tête "N M") : une
+    arête "u v" par ligne, où u et v sont des entiers épars (par exemple des numéros d'AS sur
+    64 bits) ou des chaînes sans espace (par exemple des noms d'hôtes). Texte ou gzip.
+
+    Les identifiants sont convertis en indices denses 0..N-1 (voir interning.IdInterner) ;
+    les entiers sont analysés par blocs comme pour le format "N M", les chaînes une à une.
+
+    :param file_path: Chemin vers le fichier.
+    :param chunk_size: Taille des blocs de lecture.
+    :return: Tuple (interner, src, dst) ; src et dst contiennent des indices denses.
+    """
+    opener = gzip.open if detect_format(file_path) == "gzip" else open
+    with opener(file_path, "rb") as f:
+        first = f.readline()
+        while first and not first.split():
+            first = f.readline()
+        tokens = first.split()
+        if not tokens:
+            return IdInterner(), _empty(), _empty()
+        if len(tokens) != 2:
+            raise ValueError("Chaque ligne d'arête doit contenir deux identifiants : u v")
+        try:
+            head = [int(t) for t in tokens]
+        except ValueError:
+            head = None
+        if head is not None:
+            src, dst = _read_text_values(f, chunk_size)
+            if np is not None:
+                values = np.empty(2 * (len(src) + 1), dtype=np.int64)
+                values[:2] = head
+                values[2::2] = src
+                values[3::2] = dst
+            else:
+                values = array("q", head)
+                for u, v in zip(src, dst):
+                    values.append(u)
+                    values.append(v)
+            interner, codes = IdInterner.from_values(values, numeric=True)
+        else:
+            words = tokens + f.read().split()
+            if len(words) % 2:
+                raise ValueError("Chaque ligne d'arête doit contenir deux identifiants : u v")
+            interner, codes = IdInterner.from_values([w.decode("utf-8") for w in words], numeric=False)
+    return interner, codes[0::2], codes[1::2]
+
+
+def load_labeled_graph(file_path, interner=None):
+    """
+    Charge une liste d'arêtes aux identifiants quelconques (voir read_labeled_edge_arrays)
+    dans une instance de Graph dont les sommets sont des indices denses.
+
+    :param interner: Table existante (celle de l'état sauvegardé) : les identifiants déjà connus
+                     gardent leur indice et les nouveaux sont ajoutés à la fin. Sans table, les
+                     indices 0..N-1 suivent l'ordre croissant des identifiants.
+    :return: Tuple (graph, interner).
+    """
+    file_interner, src, dst = read_labeled_edge_arrays(file_path)
+    src, dst = src.tolist(), dst.tolist()
+    if interner is None:
+        interner, vertices = file_interner, range(len(file_interner))
+    else:
+        vertices = interner.merge(file_interner)
+        src = [vertices[u] for u in src]
+        dst = [vertices[v] for v in dst]
+    g = Graph()
+    for i in vertices:
+        g.add_vertex(i)
+    for u, v in zip(src, dst):
+        g.add_edge(u, v)
+    return g, interner
+
+
+def load_csr_graph(file_path):
+    """
+    Charge un fichier d'arêtes directement dans un CSRGraph.
+
+    :param file_path: Chemin vers le fichier.
+    :return: CSRGraph.
+    """
+    return CSRGraph.from_edge_file(file_path)
+
+
+def file_fingerprint(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Calcule l'empreinte d'un fichier d'arêtes : taille, date de modification (ns) et
+    condensé BLAKE2b du contenu. La taille et la date suffisent à conclure en O(1) qu'un
+    fichier est inchangé ; le condensé permet de le confirmer lorsque seule la date a changé.
+
+    :param file_path: Chemin vers le fichier.
+    :param chunk_size: Taille des blocs lus pour le condensé.
+    :return: Tuple (size, mtime_ns, digest).
+    """
+    st = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=FINGERPRINT_DIGEST_SIZE)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return st.st_size, st.st_mtime_ns, digest.digest()
+
+
+def write_binary_edges(file_path, num_vertices, src, dst, itemsize=None):
+    """
+    Écrit des arêtes au format binaire lisible par memory-map.
+
+    :param file_path: Chemin du fichier de sortie.
+    :param num_vertices: Nombre de sommets N.
+    :param src: Tableau (ou séquence) des premières extrémités.
+    :param dst: Tableau (ou séquence) des secondes extrémités.
+    :param itemsize: 4 ou 8 octets par entier (par défaut, 4 si N < 2**31).
+    """
+    if itemsize is None:
+        itemsize = 4 if num_vertices < 2 ** 31 else 8
+    if np is not None:
+        pairs = np.empty((len(src), 2), dtype="<i4" if itemsize == 4 else "<i8")
+        pairs[:, 0] = src
+        pairs[:, 1] = dst
+        payload = pairs.tobytes()
+    else:
+        values = array("i" if itemsize == 4 else "q")
+        for u, v in zip(src, dst):
+            values.append(u)
+            values.append(v)
+        if sys.byteorder != "little":
+            values.byteswap()
+        payload = values.tobytes()
+    with open(file_path, "wb") as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, itemsize, num_vertices, len(src)))
+        f.write(payload)
+
+
+def convert_to_binary(input_path, output_path):
+    """
+    Convertit une fois pour toutes un fichier d'arêtes (texte ou gzip) au format binaire.
+    """
+    num_vertices, src, dst = read_edge_arrays(input_path)
+    write_binary_edges(output_path, num_vertices, src, dst)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python src/loader.py <graph_file> <binary_output>")
+        sys.exit(1)
+    convert_to_binary(sys.argv[1], sys.argv[2])
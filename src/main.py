@@ -3,171 +3,533 @@
 import sys
 import os
 import time
-from graph import Graph
-from dfs import find_articulation_points
-from updater import advanced_incremental_update_edge_addition
-from state_manager import load_graph_state, save_graph_state, compare_graph_states, get_current_graph_state
-from visualize import draw_graph
+import argparse
+from instrumentation import metrics
+from loader import load_graph, load_labeled_graph, file_fingerprint
+from interning import IdInterner
+from journal import COMPACT_THRESHOLD, read_journal, net_changes, truncate_journal
+from dfs import articulation_dfs, count_children, bridges_from_state, edge_components_from_state
+from parallel import parallel_articulation_dfs
+from updater import incremental_update_batch, register_vertices
+from state_manager import load_graph_state, save_graph_state, get_current_graph_state, get_dfs_state, get_articulation_state, get_ancestor_index
+from state_manager import read_state_fingerprint, update_state_fingerprint, graph_from_state
+from state_manager import load_state_arrays, state_arrays, articulation_state_from_arrays, StateCorruptedError
+from state_manager import is_valid_state
+from visualize import render_graph, default_layout_cache, choose_view, VIEWS
+from external import articulation_points_out_of_core
+from history import HistoryStore
+from dfs_state import DFSState
+from verification import ShadowVerifier
 
-def compute_dfs_state(graph):
+def compute_dfs_state(graph, workers=1):
     """
     Effectue un DFS complet sur le graphe pour construire et retourner les dictionnaires:
       - disc  : temps de découverte pour chaque nœud,
       - low   : valeur minimale atteignable pour chaque nœud,
-      - parent: parent de chaque nœud dans l'arbre DFS.
+      - parent: parent de chaque nœud dans l'arbre DFS,
+    ainsi que l'ensemble des points d'articulation et le nombre d'enfants de chaque nœud.
+    Avec plusieurs processus, les grandes composantes connexes sont parcourues en parallèle
+    (voir src/parallel.py).
     
     Args:
         graph (Graph): Instance du graphe.
+        workers (int): Nombre de processus pour le DFS complet.
     
     Returns:
-        tuple: (disc, low, parent)
-    """
-    visited = {}
-    disc = {}
-    low = {}
-    parent = {}
-    time = [0]
-
-    def dfs(u):
-        visited[u] = True
-        disc[u] = low[u] = time[0]
-        time[0] += 1
-        for v in graph.neighbors(u):
-            if v not in visited:
-                parent[v] = u
-                dfs(v)
-                low[u] = min(low[u], low[v])
-            elif v != parent.get(u, None):
-                low[u] = min(low[u], disc[v])
-
-    for u in graph.vertices():
-        if u not in visited:
-            parent[u] = None
-            dfs(u)
-    return disc, low, parent
-
-def read_graph_from_file(file_path):
+        tuple: (disc, low, parent, ap, children)
+    """
+    if workers > 1:
+        disc, low, parent, ap = parallel_articulation_dfs(graph, workers)
+    else:
+        disc, low, parent, ap = articulation_dfs(graph)
+    return disc, low, parent, ap, count_children(parent)
+
+def read_graph_from_file(file_path, ids_file=None, intern_ids=False):
     """
     Lit un graphe depuis un fichier texte.
 
     Le format attendu est le suivant :
       - La première ligne contient deux entiers : le nombre de nœuds N et le nombre d'arêtes M.
       - Chaque ligne suivante contient deux entiers (u v) séparés par un espace.
+    Les fichiers compressés (gzip) et le format binaire de src/loader.py sont aussi acceptés.
+
+    Avec intern_ids, le fichier n'a pas d'en-tête et ses identifiants sont quelconques (entiers
+    épars ou chaînes) : ils sont convertis en indices denses, et la table de correspondance est
+    enregistrée dans ids_file (en réutilisant les indices de la table existante). Sinon, une
+    table laissée par un lancement précédent est supprimée.
 
     Args:
         file_path (str): Chemin vers le fichier.
+        ids_file (str, optional): Table des identifiants (<base>.ids).
+        intern_ids (bool): Identifiants quelconques à traduire en indices denses.
 
     Returns:
         Graph: Une instance de Graph construite à partir du fichier.
     """
-    g = Graph()
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-        if not lines:
-            return g
-        first_line = lines[0].strip()
-        if not first_line:
-            return g
-        parts = first_line.split()
-        if len(parts) < 2:
-            raise ValueError("La première ligne doit contenir deux entiers : num_vertices et num_edges")
-        num_vertices, num_edges = map(int, parts)
-        for i in range(num_vertices):
-            g.add_vertex(i)
-        for line in lines[1:]:
-            line = line.strip()
-            if line:
-                u, v = map(int, line.split())
-                g.add_edge(u, v)
-    return g
+    if not intern_ids:
+        if ids_file and os.path.exists(ids_file):
+            os.remove(ids_file)
+        return load_graph(file_path)
+    graph, interner = load_labeled_graph(file_path, IdInterner.load(ids_file))
+    interner.save(ids_file)
+    return graph
 
-def main():
+
+def source_unchanged(file_path, state_file):
     """
-    Point d'entrée principal du programme.
+    Indique, sans lire le graphe, si le fichier d'arêtes est celui dont l'état sauvegardé est issu.
 
-    Le programme lit un graphe depuis un fichier et génère dynamiquement un fichier d'état
-    (en remplaçant l'extension .txt par .json). L'état sauvegardé est comparé à la structure
-    du graphe actuel pour détecter une modification (ajout ou suppression d'arêtes).
+    La taille et la date de modification sont comparées à l'empreinte enregistrée dans l'état
+    (un seul appel à stat). Si seule la date diffère, le condensé du contenu tranche ; s'il est
+    identique, l'empreinte de l'état est mise à jour sur place.
 
-    En cas de modification, et si une arête ajoutée est détectée, l'actualisation incrémentale
-    est lancée pour recalculer uniquement le sous-arbre impacté à partir du LCA des nœuds de l'arête ajoutée.
-    Le nouvel état DFS est ensuite sauvegardé.
+    Args:
+        file_path (str): Fichier d'arêtes.
+        state_file (str): Fichier d'état (binaire, version 4 ou plus).
 
-    Usage:
-         python src/main.py <graph_file>
+    Returns:
+        bool: True si le fichier est inchangé.
     """
-    if len(sys.argv) != 2:
-        print("Usage: python src/main.py <graph_file>")
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    print(f"Lecture du graphe depuis le fichier : {file_path}")
-    graph = read_graph_from_file(file_path)
-    
-    print("Graphe chargé :")
-    print(graph)
+    stored = read_state_fingerprint(state_file)
+    if stored is None:
+        return False
+    st = os.stat(file_path)
+    if (st.st_size, st.st_mtime_ns) == stored[:2]:
+        return True
+    if st.st_size != stored[0]:
+        return False
+    fingerprint = file_fingerprint(file_path)
+    if fingerprint[2] != stored[2]:
+        return False
+    update_state_fingerprint(state_file, fingerprint)
+    return True
 
-    # Affichage du nombre de sommets et d'arêtes
+def print_graph_summary(graph, show_graph):
+    """
+    Affiche le nombre de sommets et d'arêtes du graphe (et sa liste d'adjacence si demandé).
+    """
+    if show_graph:
+        print("Graphe chargé :")
+        print(graph)
     print(f"Nombre de sommets : {len(graph.vertices())}")
     print(f"Nombre d’arêtes   : {sum(len(graph.neighbors(v)) for v in graph.vertices()) // 2}")
-    
-    # Génération dynamique du nom du fichier d'état (ex: data/example_graph.txt -> data/example_graph.json)
-    base, ext = os.path.splitext(file_path)
-    state_file = base + ".json"
 
-    start_time = time.time()  # Début du chronométrage
+def run_edge_file(args, state_file, json_state_file, ids_file=None, verifier=None):
+    """
+    Compare le fichier d'arêtes à l'état sauvegardé et met l'état à jour (DFS complet ou
+    actualisation incrémentale). Si l'empreinte du fichier est inchangée, ni la lecture du
+    graphe ni la comparaison des arêtes n'ont lieu.
+
+    Lorsque l'état chargé est déjà à jour, les points d'articulation et les ponts sont dérivés
+    de ses tableaux disc, low et parent par des opérations vectorisées ; seules ces sections
+    de l'état sont lues. Un état corrompu est ignoré et recalculé par un DFS complet.
+    Une actualisation incrémentale est transmise au vérificateur éventuel (ShadowVerifier).
 
-    saved_state = load_graph_state(state_file)
-    current_state = get_current_graph_state(graph)
+    Returns:
+        tuple: (graph, ap, bridges, updated_nodes, dfs) ; graph vaut None si le fichier est
+        inchangé et qu'aucun affichage ne le demande, updated_nodes liste les nœuds recalculés
+        et dfs est le tuple (disc, low, parent) de l'état, ou None lorsque graph vaut None.
+    """
+    file_path = args.graph_file
+    with metrics.phase("diff"):
+        unchanged = state_file != json_state_file and source_unchanged(file_path, state_file)
+    if unchanged:
+        try:
+            with metrics.phase("load"):
+                arrays = load_state_arrays(state_file, ("vertices", "disc", "low", "parent"))
+                graph = None
+                if args.show_graph or args.render:
+                    # None si l'état est corrompu (signalé par load_graph_state)
+                    saved_state = load_graph_state(state_file)
+                    unchanged = saved_state is not None
+                    graph = saved_state and graph_from_state(saved_state)
+        except StateCorruptedError as e:
+            print(f"État {state_file} ignoré : {e}", file=sys.stderr)
+            unchanged = False
+    if unchanged:
+        print(f"Fichier {file_path} inchangé depuis la dernière sauvegarde (empreinte identique).")
+        if args.show_graph:
+            print_graph_summary(graph, True)
+        else:
+            print(f"Nombre de sommets : {arrays['num_vertices']}")
+            print(f"Nombre d’arêtes   : {arrays['num_edges']}")
+        with metrics.phase("ap"):
+            ap, bridges = articulation_state_from_arrays(arrays)
+        return graph, ap, bridges, [], None if graph is None else get_dfs_state(saved_state)
+
+    # Empreinte prise avant la lecture : une modification pendant la lecture sera vue au prochain lancement
+    fingerprint = file_fingerprint(file_path)
+    print(f"Lecture du graphe depuis le fichier : {file_path}")
+    with metrics.phase("parse"):
+        graph = read_graph_from_file(file_path, ids_file, args.intern_ids)
+    print_graph_summary(graph, args.show_graph)
+
+    with metrics.phase("load"):
+        saved_state = load_graph_state(state_file)
+        migrate_state = False
+        if saved_state is None and state_file != json_state_file:
+            # Reprise d'un état JSON produit par une version précédente, après vérification :
+            # un état invalide n'est pas migré mais recalculé
+            saved_state = load_graph_state(json_state_file)
+            if saved_state is not None and not is_valid_state(saved_state):
+                print(f"État {json_state_file} ignoré : ce n'est pas l'état d'un DFS de son graphe",
+                      file=sys.stderr)
+                saved_state = None
+            migrate_state = saved_state is not None
     
     if saved_state is None:
         print("\nAucun état persistant trouvé. Exécution d'un DFS complet pour initialiser l'état...")
-        disc, low, parent = compute_dfs_state(graph)
-        save_graph_state(graph, disc, low, parent, state_file)
-    else:
-        saved_edges = set(tuple(edge) for edge in saved_state["graph"]["edges"])
-        current_edges = set(tuple(edge) for edge in current_state["graph"]["edges"])
+        with metrics.phase("dfs"):
+            disc, low, parent, ap, children = compute_dfs_state(graph, args.workers)
+        with metrics.phase("save"):
+            save_graph_state(graph, disc, low, parent, state_file, ap, children, fingerprint=fingerprint)
+        with metrics.phase("ap"):
+            bridges = bridges_from_state(disc, low, parent)
+        return graph, ap, bridges, [], (disc, low, parent)
+
+    with metrics.phase("diff"):
+        current_state = get_current_graph_state(graph)
+        saved_edges = set(saved_state["graph"]["edges"])
+        current_edges = set(current_state["graph"]["edges"])
+        vertices_changed = set(saved_state["graph"]["vertices"]) != set(current_state["graph"]["vertices"])
+    
+    updated_nodes_sorted = []
+    if vertices_changed:
+        print("\nL'ensemble des sommets a changé, recalcul complet du DFS...")
+        with metrics.phase("dfs"):
+            disc, low, parent, ap, children = compute_dfs_state(graph, args.workers)
+        with metrics.phase("save"):
+            save_graph_state(graph, disc, low, parent, state_file, ap, children, fingerprint=fingerprint)
+    elif saved_edges != current_edges:
+        added_edges = current_edges - saved_edges
+        removed_edges = saved_edges - current_edges
+        print("\nModifications détectées dans la structure du graphe :")
+        if added_edges:
+            print("Arêtes ajoutées :", added_edges)
+        if removed_edges:
+            print("Arêtes supprimées :", removed_edges)
         
-        if saved_edges != current_edges:
-            added_edges = current_edges - saved_edges
-            removed_edges = saved_edges - current_edges
-            print("\nModifications détectées dans la structure du graphe :")
-            if added_edges:
-                print("Arêtes ajoutées :", added_edges)
-            if removed_edges:
-                print("Arêtes supprimées :", removed_edges)
-            
-            if added_edges:
-                mod_edge = next(iter(added_edges))
-                print(f"\nActualisation incrémentale pour l'ajout de l'arête {mod_edge}...")
-                dfs_saved = saved_state["dfs_state"]
-                disc = {int(k): v for k, v in dfs_saved["disc"].items()}
-                low = {int(k): v for k, v in dfs_saved["low"].items()}
-                parent = {int(k): (None if dfs_saved["parent"][k] is None else int(dfs_saved["parent"][k]))
-                          for k in dfs_saved["parent"]}
-                updated_ap, updated_nodes_sorted = advanced_incremental_update_edge_addition(graph, mod_edge[0], mod_edge[1], disc, low, parent)
-                # Mise à jour visuelle avec coloration
-                draw_graph(file_path, articulation_points=updated_ap, highlighted_nodes=updated_nodes_sorted)
-                print("\nPoints d'articulation après actualisation incrémentale :")
-                print(sorted(updated_ap))
-            else:
-                print("\nModification(s) détectée(s) (suppression ou modifications diverses), recalcul complet du DFS...")
-                disc, low, parent = compute_dfs_state(graph)
-            save_graph_state(graph, disc, low, parent, state_file)
+        print(f"\nActualisation incrémentale pour {len(added_edges)} ajout(s) et {len(removed_edges)} suppression(s)...")
+        disc, low, parent = get_dfs_state(saved_state)
+        ap, children = get_articulation_state(saved_state)
+        index = get_ancestor_index(saved_state)
+        with metrics.phase("dfs"):
+            ap, updated_nodes_sorted = incremental_update_batch(graph, added_edges, removed_edges,
+                                                                disc, low, parent, ap, children, index)
+        print(f"Nombre total de nœuds recalculés : {len(updated_nodes_sorted)}")
+        if verifier is not None:
+            verifier.observe(graph, saved_state["dfs_state"]["state"], added_edges, removed_edges)
+        with metrics.phase("save"):
+            save_graph_state(graph, disc, low, parent, state_file, ap, children, index, fingerprint)
+    else:
+        print("\nAucune modification détectée par rapport à l'état sauvegardé.")
+        with metrics.phase("ap"):
+            ap, bridges = articulation_state_from_arrays(state_arrays(saved_state))
+        disc, low, parent = get_dfs_state(saved_state)
+        if migrate_state or saved_state.get("fingerprint") != fingerprint:
+            # Migration ou empreinte à enregistrer : le prochain lancement évitera la comparaison
+            children = get_articulation_state(saved_state)[1]
+            with metrics.phase("save"):
+                save_graph_state(graph, disc, low, parent, state_file, ap, children,
+                                 get_ancestor_index(saved_state), fingerprint)
+        return graph, ap, bridges, updated_nodes_sorted, (disc, low, parent)
+    with metrics.phase("ap"):
+        bridges = bridges_from_state(disc, low, parent)
+    return graph, ap, bridges, updated_nodes_sorted, (disc, low, parent)
+
+def run_journal(args, state_file, ids_file=None, verifier=None):
+    """
+    Rejoue le journal des modifications d'arêtes (lignes "+ u v" / "- u v") sur l'instantané
+    sauvegardé, sans relire ni comparer le fichier d'arêtes. L'instantané est initialisé depuis
+    le fichier d'arêtes s'il n'existe pas. Au-delà de --compact-after entrées, le journal est
+    compacté : l'état actualisé devient le nouvel instantané et le journal est vidé.
+
+    Si l'état est indexé (--intern-ids ou table ids_file existante), les identifiants du journal
+    sont traduits par la table des identifiants ; ceux qui n'y figurent pas encore y sont ajoutés.
+
+    Returns:
+        tuple: (graph, ap, bridges, updated_nodes, dfs) ; dfs est le tuple (disc, low, parent).
+    """
+    with metrics.phase("load"):
+        saved_state = load_graph_state(state_file)
+    if saved_state is None:
+        print(f"Aucun instantané trouvé. Initialisation depuis le fichier : {args.graph_file}")
+        with metrics.phase("parse"):
+            graph = read_graph_from_file(args.graph_file, ids_file, args.intern_ids)
+        with metrics.phase("dfs"):
+            disc, low, parent, ap, children = compute_dfs_state(graph, args.workers)
+        index = None
+    else:
+        graph = graph_from_state(saved_state)
+        disc, low, parent = get_dfs_state(saved_state)
+        ap, children = get_articulation_state(saved_state)
+        index = get_ancestor_index(saved_state)
+    print_graph_summary(graph, args.show_graph)
+
+    with metrics.phase("parse"):
+        if not (args.intern_ids or (ids_file and os.path.exists(ids_file))):
+            entries = read_journal(args.journal)
         else:
-            print("\nAucune modification détectée par rapport à l'état sauvegardé.")
-            dfs_saved = saved_state["dfs_state"]
-            disc = {int(k): v for k, v in dfs_saved["disc"].items()}
-            low = {int(k): v for k, v in dfs_saved["low"].items()}
-            parent = {int(k): (None if dfs_saved["parent"][k] is None else int(dfs_saved["parent"][k]))
-                      for k in dfs_saved["parent"]}
-
-    ap = find_articulation_points(graph)
+            interner = IdInterner.load(ids_file) or IdInterner()
+            known = len(interner)
+            entries = [(op, interner.intern(u), interner.intern(v))
+                       for op, u, v in read_journal(args.journal, interner.parse)]
+            if len(interner) != known:
+                interner.save(ids_file)
+    with metrics.phase("diff"):
+        added_edges, removed_edges = net_changes(entries, graph)
+    updated_nodes_sorted = []
+    print(f"\nJournal {args.journal} : {len(entries)} entrée(s), {len(added_edges)} ajout(s) et "
+          f"{len(removed_edges)} suppression(s) effectifs")
+    if added_edges or removed_edges:
+        register_vertices(graph, [w for edge in added_edges for w in edge], disc, low, parent, children, index)
+        for u, v in added_edges:
+            graph.add_edge(u, v)
+        for u, v in removed_edges:
+            graph.remove_edge(u, v)
+        with metrics.phase("dfs"):
+            ap, updated_nodes_sorted = incremental_update_batch(graph, added_edges, removed_edges,
+                                                                disc, low, parent, ap, children, index)
+        print(f"Nombre total de nœuds recalculés : {len(updated_nodes_sorted)}")
+        if verifier is not None and saved_state is not None:
+            verifier.observe(graph, saved_state["dfs_state"]["state"], added_edges, removed_edges)
+
+    if saved_state is None or (entries and len(entries) >= args.compact_after):
+        # Compactage : l'état actualisé devient l'instantané, le journal est vidé
+        with metrics.phase("save"):
+            save_graph_state(graph, disc, low, parent, state_file, ap, children, index)
+        if entries:
+            truncate_journal(args.journal)
+            print(f"Journal compacté dans l'instantané {state_file}")
+    with metrics.phase("ap"):
+        bridges = bridges_from_state(disc, low, parent)
+    return graph, ap, bridges, updated_nodes_sorted, (disc, low, parent)
+
+def state_mtime(state_file):
+    """
+    Date de modification (ns) du fichier d'état, ou None s'il n'existe pas.
+    """
+    try:
+        return os.stat(state_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def record_history(history_file, state_file, binary=True):
+    """
+    Ajoute l'état qui vient d'être sauvegardé à l'historique des versions (delta par rapport à
+    la version précédente, ou point de reprise). Pour un état binaire, seules les sections
+    sommets, disc, low, parent et drapeaux des points d'articulation sont relues.
+
+    Args:
+        history_file: Fichier d'historique (<base>.history).
+        state_file: Fichier d'état qui vient d'être écrit.
+        binary: False pour un état JSON.
+
+    Returns:
+        Numéro de la version enregistrée, ou None si l'état n'a pas changé.
+    """
+    if binary:
+        state = DFSState.from_arrays(load_state_arrays(state_file, ("vertices", "disc", "low", "parent", "ap_flags")))
+    else:
+        state = load_graph_state(state_file)["dfs_state"]["state"]
+    return HistoryStore(history_file).commit(state)
+
+def run_external(args):
+    """
+    Mode semi-externe : convertit au besoin le fichier d'arêtes en fichier d'adjacence trié
+    (<base>.adj) puis calcule les points d'articulation en lisant les voisins sur disque.
+    Aucun état n'est sauvegardé.
+
+    Args:
+        args: Arguments de la ligne de commande.
+
+    Returns:
+        Tuple (ap, bridges).
+    """
+    with metrics.phase("external"):
+        ap, bridges, io = articulation_points_out_of_core(args.graph_file)
+    if io["converted"]:
+        print(f"Fichier {args.graph_file} converti en fichier d'adjacence sur disque.")
+    print(f"Volume lu : {io['bytes_read']} octets (fichier d'adjacence : {io['file_bytes']} octets, "
+          f"tableaux en mémoire : {io['resident_bytes']} octets)")
+    for name, value in io.items():
+        if name != "converted":
+            metrics.count(f"external_{name}", value)
+    return ap, bridges
+
+
+def main():
+    """
+    Point d'entrée principal du programme.
+
+    Le programme lit un graphe depuis un fichier et génère dynamiquement un fichier d'état
+    (en remplaçant l'extension .txt par .state, ou par .json avec --state-format json).
+    Un ancien état .json est relu s'il n'existe pas encore d'état binaire. L'état sauvegardé
+    est comparé à la structure du graphe actuel pour détecter une modification (ajout ou
+    suppression d'arêtes).
+
+    En cas de modification, l'ensemble des arêtes ajoutées et supprimées est appliqué en un seul
+    lot par l'actualisation incrémentale : les zones impactées (sous-arbre du LCA d'une arête
+    ajoutée, sous-arbre détaché par une suppression) sont fusionnées puis recalculées une seule fois.
+    Le nouvel état DFS est ensuite sauvegardé.
+
+    Avec --journal, les modifications sont lues dans un journal en ajout seul et rejouées sur
+    l'état sauvegardé, sans comparer les ensembles d'arêtes. Sans journal, une empreinte du
+    fichier d'arêtes (taille, date, condensé) enregistrée dans l'état permet de conclure en O(1)
+    qu'il n'a pas changé.
+
+    Avec --render, le graphe est dessiné sans affichage dans un fichier image, en réutilisant le
+    graphe et les points d'articulation déjà calculés ; les nœuds recalculés sont mis en évidence.
+    Au-delà de quelques milliers de sommets, une vue condensée (voisinage des nœuds recalculés ou
+    arbre blocs-points de coupure) est dessinée, et le placement est mis en cache sur disque.
+
+    Avec --intern-ids, les sommets portent des identifiants quelconques (entiers épars sur 64 bits,
+    chaînes) : le fichier d'arêtes n'a pas d'en-tête, les moteurs travaillent sur des indices
+    denses, et la table de correspondance est enregistrée à côté de l'état (<base>.ids). Les
+    résultats sont retraduits en identifiants d'origine à l'affichage.
+
+    Avec --history, chaque nouvel état sauvegardé est aussi ajouté à l'historique des versions
+    (<base>.history, deltas et points de reprise périodiques) ; src/history.py interroge ensuite
+    les points d'articulation d'une version passée. L'historique est tenu dès que ce fichier existe.
+
+    Avec --verify-rate P, une actualisation incrémentale est contrôlée avec la probabilité P par
+    un DFS complet lancé dans un thread pendant l'affichage des résultats. Une divergence
+    (points d'articulation ou valeurs low) est consignée dans <base>.divergences.jsonl avec les
+    arêtes modifiées, et l'état sauvegardé est remplacé par celui du DFS complet.
+
+    Avec --external, le graphe n'est pas chargé en mémoire : le fichier "N M" est converti une
+    fois en fichier d'adjacence trié (<base>.adj), lu en memory-map par un DFS qui ne garde que
+    des tableaux par sommet. Les points d'articulation sont les mêmes, sans état persistant.
+
+    Par défaut (--quiet), le graphe n'est pas affiché. L'instrumentation (compteurs et durées
+    des phases lecture, chargement, diff, DFS, AP, sauvegarde) est activée par --metrics ou
+    --verbose ; --verbose ajoute les traces détaillées de l'actualisation incrémentale.
+
+    Usage:
+         python src/main.py <graph_file> [--state-format {binary,json}] [--workers N]
+                            [--quiet | --show-graph] [--verbose] [--metrics FICHIER.json]
+                            [--journal FICHIER [--compact-after N]] [--intern-ids] [--history]
+                            [--verify-rate P]
+                            [--external]
+                            [--render IMAGE [--view VUE] [--hops K]]
+    """
+    parser = argparse.ArgumentParser(description="Détection incrémentale des points d'articulation.")
+    parser.add_argument("graph_file", help="Fichier du graphe (première ligne \"N M\", puis une arête par ligne)")
+    parser.add_argument("--state-format", choices=["binary", "json"], default="binary",
+                        help="Format du fichier d'état sauvegardé (binaire compact par défaut)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Nombre de processus pour le DFS complet (composantes connexes en parallèle)")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--quiet", dest="show_graph", action="store_false",
+                        help="N'affiche pas le graphe (comportement par défaut)")
+    output.add_argument("--show-graph", dest="show_graph", action="store_true",
+                        help="Affiche la liste d'adjacence du graphe chargé")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Active l'instrumentation et les traces détaillées")
+    parser.add_argument("--metrics", metavar="FICHIER",
+                        help="Active l'instrumentation et exporte les mesures en JSON (\"-\" pour la sortie standard)")
+    parser.add_argument("--journal", metavar="FICHIER",
+                        help="Rejoue un journal de modifications (\"+ u v\" / \"- u v\") sur l'état sauvegardé")
+    parser.add_argument("--compact-after", type=int, default=COMPACT_THRESHOLD, metavar="N",
+                        help="Compacte le journal dans l'instantané à partir de N entrées (0 : à chaque lancement)")
+    parser.add_argument("--intern-ids", action="store_true",
+                        help="Identifiants de sommets quelconques (entiers épars ou chaînes), fichier sans en-tête \"N M\"")
+    parser.add_argument("--history", action="store_true",
+                        help="Ajoute chaque nouvel état à l'historique des versions (<base>.history)")
+    parser.add_argument("--verify-rate", type=float, default=0.0, metavar="P",
+                        help="Probabilité (0 à 1) de vérifier l'actualisation incrémentale par un DFS complet en arrière-plan")
+    parser.add_argument("--external", action="store_true",
+                        help="Mode semi-externe : voisins lus sur disque (<base>.adj), sans état persistant")
+    parser.add_argument("--render", metavar="IMAGE",
+                        help="Dessine le graphe dans un fichier (.png, .svg, .pdf) sans ouvrir de fenêtre")
+    parser.add_argument("--view", choices=VIEWS, default="auto",
+                        help="Vue dessinée : complète, arbre blocs-points de coupure ou voisinage des nœuds recalculés")
+    parser.add_argument("--hops", type=int, default=1, help="Rayon du voisinage pour --view neighborhood")
+    parser.set_defaults(show_graph=False)
+    args = parser.parse_args()
+    if args.external and (args.journal or args.intern_ids or args.history or args.render or args.show_graph):
+        parser.error("--external est incompatible avec --journal, --intern-ids, --history, --render et --show-graph")
+
+    if args.metrics or args.verbose:
+        metrics.configure(enabled=True, verbose=args.verbose)
+
+    start_time = time.perf_counter()  # Début du chronométrage
+
+    # Génération dynamique du nom du fichier d'état (ex: data/example_graph.txt -> data/example_graph.state)
+    base, ext = os.path.splitext(args.graph_file)
+    json_state_file = base + ".json"
+    state_file = json_state_file if args.state_format == "json" else base + ".state"
+    ids_file = base + ".ids"  # Présente si et seulement si l'état est indexé (--intern-ids)
+    history_file = base + ".history"
+    saved_at = state_mtime(state_file)
+    repairs = []
+    verifier = None
+    if args.verify_rate > 0:
+        verifier = ShadowVerifier(args.verify_rate, log_file=base + ".divergences.jsonl",
+                                  repair=lambda version, fresh: repairs.append(fresh))
+
+    # Points d'articulation et ponts issus de l'état DFS (persistant ou mis à jour), sans nouveau parcours
+    if args.external:
+        (ap, bridges), graph, updated_nodes, dfs = run_external(args), None, [], None
+    elif args.journal:
+        graph, ap, bridges, updated_nodes, dfs = run_journal(args, state_file, ids_file, verifier)
+    else:
+        graph, ap, bridges, updated_nodes, dfs = run_edge_file(args, state_file, json_state_file, ids_file, verifier)
+
+    if (args.history or os.path.exists(history_file)) and state_mtime(state_file) != saved_at:
+        with metrics.phase("history"):
+            version = record_history(history_file, state_file, state_file != json_state_file)
+        if version is not None:
+            print(f"\nVersion {version} ajoutée à l'historique {history_file}")
+
+    # Les identifiants d'origine ne sont rétablis qu'à l'affichage
+    interner = IdInterner.load(ids_file)
     print("\nPoints d'articulation détectés :")
-    print(sorted(ap))
+    print(interner.externals(ap) if interner else sorted(ap))
+    print("\nPonts détectés :")
+    print(interner.external_edges(bridges) if interner else bridges)
+
+    if args.render:
+        # Rendu sans affichage, à partir du graphe et des points d'articulation déjà calculés
+        with metrics.phase("render"):
+            view = choose_view(args.view, graph, updated_nodes)
+            # Blocs de la vue blocs-points de coupure dérivés de l'état DFS, sans nouveau parcours
+            edge_component = edge_components_from_state(graph, *dfs) if view == "block-cut" else None
+            render_graph(graph, ap, updated_nodes, output=args.render, view=view, hops=args.hops,
+                         layout_cache=default_layout_cache(args.graph_file, view),
+                         edge_component=edge_component)
+        print(f"\nGraphe dessiné dans {args.render} (vue {view})")
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     print(f"\nTemps moyen d'exécution : {end_time - start_time:.4f} secondes")
 
+    if verifier is not None:
+        # La vérification a tourné pendant l'affichage ; elle n'est attendue qu'ici
+        with metrics.phase("verify"):
+            verifier.close()
+        checks = verifier.stats()["checks"]
+        if repairs:
+            disc, low, parent, fresh_ap = repairs[-1]
+            # L'état réparé remplace celui qui vient d'être sauvegardé : même empreinte du fichier d'arêtes
+            if state_file == json_state_file:
+                fingerprint = load_graph_state(state_file)["fingerprint"]
+            else:
+                fingerprint = read_state_fingerprint(state_file)
+            save_graph_state(graph, disc, low, parent, state_file, fresh_ap, count_children(parent),
+                             fingerprint=fingerprint)
+            if args.history or os.path.exists(history_file):
+                record_history(history_file, state_file, state_file != json_state_file)
+            print(f"\nDivergence de l'actualisation incrémentale consignée dans {verifier.log_file} ; "
+                  f"état réparé par un DFS complet. Points d'articulation corrects :")
+            print(interner.externals(fresh_ap) if interner else sorted(fresh_ap))
+        elif checks:
+            print("\nVérification par DFS complet : état incrémental conforme.")
+
+    if metrics.enabled:
+        print("\nMesures :")
+        print(metrics.summary())
+    if args.metrics:
+        metrics.export_json(args.metrics)
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,178 @@
+# src/parallel.py
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from graph import CSRGraph
+from dfs import articulation_dfs
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, les tableaux d'arêtes sont des array du module standard
+    np = None
+
+# Taille minimale (en sommets) d'une composante connexe confiée au pool de processus ;
+# les composantes plus petites sont traitées dans le processus principal, leur transfert
+# coûtant plus cher que le parcours lui-même.
+MIN_PARALLEL_SIZE = 10000
+
+# Graphe CSR partagé, attaché une fois par processus du pool (voir _attach_shared_graph)
+_shared_graph = None
+_shared_memory = None
+
+
+def connected_components(num_vertices, src, dst):
+    """
+    Calcule les composantes connexes par union-find sur le tableau d'arêtes
+    (compression de chemin par division, union vers le plus petit représentant).
+
+    :param num_vertices: Nombre de sommets n (identifiants 0..n-1).
+    :param src: Première extrémité de chaque arête.
+    :param dst: Seconde extrémité de chaque arête.
+    :return: Liste label telle que label[v] est le plus petit sommet de la composante de v.
+    """
+    label = list(range(num_vertices))
+    for u, v in zip(src, dst):
+        while label[u] != u:
+            label[u] = label[label[u]]
+            u = label[u]
+        while label[v] != v:
+            label[v] = label[label[v]]
+            v = label[v]
+        if u < v:
+            label[v] = u
+        elif v < u:
+            label[u] = v
+    for v in range(num_vertices):
+        label[v] = label[label[v]]
+    return label
+
+
+def csr_edge_arrays(csr):
+    """
+    Renvoie les tableaux (src, dst) des arêtes u < v d'un CSRGraph, sous forme de listes d'entiers.
+    """
+    if np is not None:
+        indptr = np.asarray(csr.indptr, dtype=np.int64)
+        src = np.repeat(np.arange(csr.num_vertices, dtype=np.int64), np.diff(indptr))
+        dst = np.asarray(csr.indices, dtype=np.int64)
+        keep = src < dst
+        return src[keep].tolist(), dst[keep].tolist()
+    src, dst = array("q"), array("q")
+    for u, v in csr.edges():
+        src.append(u)
+        dst.append(v)
+    return src, dst
+
+
+def _int64_bytes(values):
+    # Entiers natifs sur 8 octets, relus par memoryview.cast("q") dans les processus du pool
+    if np is not None and isinstance(values, np.ndarray):
+        return np.ascontiguousarray(values, dtype=np.int64).tobytes()
+    return array("q", values).tobytes()
+
+
+def share_csr_graph(csr):
+    """
+    Copie les tableaux indptr et indices d'un CSRGraph dans un segment de mémoire partagée.
+
+    :return: Tuple (shm, num_vertices, num_indices) ; l'appelant doit appeler shm.close()
+             puis shm.unlink() une fois les processus terminés.
+    """
+    indptr, indices = _int64_bytes(csr.indptr), _int64_bytes(csr.indices)
+    shm = shared_memory.SharedMemory(create=True, size=max(8, len(indptr) + len(indices)))
+    shm.buf[:len(indptr)] = indptr
+    shm.buf[len(indptr):len(indptr) + len(indices)] = indices
+    return shm, csr.num_vertices, len(csr.indices)
+
+
+def _attach_shared_graph(name, num_vertices, num_indices):
+    # Initialisation d'un processus du pool : vue CSR sans copie sur la mémoire partagée
+    global _shared_graph, _shared_memory
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    values = _shared_memory.buf.cast("q")
+    _shared_graph = CSRGraph(values[:num_vertices + 1],
+                             values[num_vertices + 1:num_vertices + 1 + num_indices])
+
+
+def _analyze_component(root):
+    # DFS d'une composante dans un processus du pool. Le résultat est renvoyé sous forme de
+    # tableaux compacts indexés par temps de découverte local : order[t] est le sommet
+    # découvert au temps t, low et parent suivent le même ordre (-1 pour la racine).
+    disc, low, parent, ap = articulation_dfs(_shared_graph, roots=[root])
+    order = array("q", bytes(8 * len(disc)))
+    for v, t in disc.items():
+        order[t] = v
+    return (order,
+            array("q", [low[v] for v in order]),
+            array("q", [-1 if parent[v] is None else parent[v] for v in order]),
+            sorted(ap))
+
+
+def parallel_articulation_dfs(graph, workers=None, min_size=MIN_PARALLEL_SIZE):
+    """
+    Calcule l'état DFS complet (disc, low, parent) et les points d'articulation en traitant
+    les composantes connexes en parallèle.
+
+    Les composantes sont trouvées par union-find sur le tableau d'arêtes. Celles d'au moins
+    min_size sommets sont confiées à un ProcessPoolExecutor dont les processus lisent le graphe
+    CSR dans une mémoire partagée ; les autres sont parcourues dans le processus principal.
+    Les temps de découverte locaux sont ensuite décalés pour reproduire la numérotation d'un
+    parcours séquentiel (composantes dans l'ordre de graph.vertices()), de sorte que le résultat
+    a la même forme que celui d'articulation_dfs.
+
+    :param graph: Instance de CSRGraph, ou de Graph dont les sommets sont des entiers positifs ou nuls.
+    :param workers: Nombre de processus (par défaut, le nombre de cœurs).
+    :param min_size: Taille minimale d'une composante traitée par le pool.
+    :return: Tuple (disc, low, parent, ap), comme articulation_dfs.
+    """
+    vertices = graph.vertices()
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    label = connected_components(csr.num_vertices, *csr_edge_arrays(csr))
+    size = {}
+    for v in vertices:
+        size[label[v]] = size.get(label[v], 0) + 1
+    # Composantes dans l'ordre de leur premier sommet : (racine, taille, temps de départ)
+    components = []
+    seen = set()
+    time = 0
+    for v in vertices:
+        c = label[v]
+        if c not in seen:
+            seen.add(c)
+            components.append((v, size[c], time))
+            time += size[c]
+
+    large = [comp for comp in components if comp[1] >= min_size]
+    if workers <= 1 or not large:
+        return articulation_dfs(graph)
+
+    disc, low, parent, ap = {}, {}, {}, set()
+    shm, num_vertices, num_indices = share_csr_graph(csr)
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(large)), initializer=_attach_shared_graph,
+                                 initargs=(shm.name, num_vertices, num_indices)) as pool:
+            # Les plus grandes composantes d'abord, pour équilibrer la charge
+            futures = [(start, pool.submit(_analyze_component, root))
+                       for root, _, start in sorted(large, key=lambda comp: -comp[1])]
+            for root, n, start in components:
+                if n < min_size:
+                    _, _, _, component_ap = articulation_dfs(csr, roots=[root], disc=disc, low=low,
+                                                             parent=parent, start_time=start)
+                    ap |= component_ap
+            for start, future in futures:
+                order, component_low, component_parent, component_ap = future.result()
+                for t, v in enumerate(order):
+                    disc[v] = start + t
+                    low[v] = start + component_low[t]
+                    p = component_parent[t]
+                    parent[v] = None if p < 0 else p
+                ap.update(component_ap)
+    finally:
+        shm.close()
+        shm.unlink()
+    return disc, low, parent, ap
@@ -0,0 +1,238 @@
+# src/queries.py
+
+import argparse
+import heapq
+import json
+import os
+import sys
+from dfs import articulation_dfs, subtree_sizes
+from interning import IdInterner
+from loader import load_graph, load_labeled_graph
+from state_manager import load_graph_state, get_dfs_state, get_articulation_state
+
+class ImpactIndex:
+    """
+    Requêtes sur la panne d'un sommet, servies depuis l'état DFS (disc, low, parent) sans
+    nouveau parcours du graphe.
+
+    Retirer v détache chaque enfant DFS c tel que low[c] >= disc[v] (tous les enfants si v est
+    une racine) avec son sous-arbre ; le reste de l'arbre de v forme une pièce de plus. Avec la
+    taille des sous-arbres et la liste des enfants, précalculées en O(N), chaque requête coûte
+    O(nombre d'enfants de v), et l'appartenance aux points d'articulation O(1).
+    """
+
+    def __init__(self, disc, low, parent, ap=None, interner=None):
+        """
+        :param disc: Dictionnaire des temps de découverte.
+        :param low: Dictionnaire des valeurs low.
+        :param parent: Dictionnaire des parents (None pour une racine).
+        :param ap: Ensemble des points d'articulation (dérivé des enfants détachés s'il est omis).
+        :param interner: Table des identifiants (IdInterner) si l'état est indexé ; les requêtes
+                         et leurs résultats utilisent alors les identifiants d'origine.
+        """
+        self.interner = interner
+        self.disc = disc
+        self.low = low
+        self.parent = parent
+        self.size = subtree_sizes(disc, parent)
+        self.children = {v: [] for v in parent}
+        self.root = {}
+        # Par disc croissant, chaque parent est traité avant ses enfants
+        for v in sorted(parent, key=disc.__getitem__):
+            p = parent[v]
+            if p is None:
+                self.root[v] = v
+            else:
+                self.root[v] = self.root[p]
+                self.children[p].append(v)
+        self.num_components = sum(1 for p in parent.values() if p is None)
+        if ap is None:
+            ap = {v for v in parent if len(self._detached(v)) > (1 if parent[v] is None else 0)}
+        self.ap = ap
+
+    @classmethod
+    def from_state(cls, saved_state, interner=None):
+        """
+        Construit l'index à partir d'un état chargé par load_graph_state.
+        """
+        disc, low, parent = get_dfs_state(saved_state)
+        ap, _ = get_articulation_state(saved_state)
+        return cls(disc, low, parent, ap, interner)
+
+    def vertex(self, token):
+        """
+        Convertit un identifiant lu dans une requête en sommet de l'état (indice dense si l'état est indexé).
+        """
+        if self.interner is None:
+            return int(token)
+        return self.interner.code(self.interner.parse(token))
+
+    def _check(self, v):
+        if v not in self.parent:
+            raise ValueError(f"Sommet inconnu : {v}")
+
+    def _detached(self, v):
+        # Enfants DFS dont le sous-arbre est séparé du reste lorsque v est retiré
+        if self.parent[v] is None:
+            return self.children[v]
+        disc_v, low = self.disc[v], self.low
+        return [c for c in self.children[v] if low[c] >= disc_v]
+
+    def is_articulation(self, v):
+        """
+        Indique si v est un point d'articulation (O(1)).
+        """
+        self._check(v)
+        return v in self.ap
+
+    def pieces(self, v):
+        """
+        Tailles des pièces formées par la composante connexe de v une fois v retiré,
+        de la plus grande à la plus petite (liste vide pour un sommet isolé).
+        """
+        self._check(v)
+        sizes = [self.size[c] for c in self._detached(v)]
+        if self.parent[v] is not None:
+            sizes.append(self.size[self.root[v]] - 1 - sum(sizes))
+        sizes.sort(reverse=True)
+        return sizes
+
+    def components_after_removal(self, v):
+        """
+        Nombre de composantes connexes du graphe après la suppression de v.
+        """
+        return self.num_components - 1 + len(self.pieces(v))
+
+    def cut_off(self, v):
+        """
+        Nombre de sommets coupés de la plus grande pièce lorsque v tombe en panne
+        (0 si v n'est pas un point d'articulation).
+        """
+        sizes = self.pieces(v)
+        return sum(sizes) - sizes[0] if sizes else 0
+
+    def describe(self, v):
+        """
+        Résumé de l'impact de la panne de v (sérialisable en JSON).
+        """
+        sizes = self.pieces(v)
+        return {
+            "vertex": self.interner.external(v) if self.interner else v,
+            "articulation": v in self.ap,
+            "components": self.num_components - 1 + len(sizes),
+            "pieces": sizes,
+            "cut_off": sum(sizes) - sizes[0] if sizes else 0,
+        }
+
+    def top_critical(self, k):
+        """
+        Les k points d'articulation les plus critiques, classés par nombre de sommets coupés
+        puis par nombre de pièces (à égalité, le plus petit indice d'abord).
+
+        :return: Liste de résumés (voir describe).
+        """
+        ranked = heapq.nsmallest(k, self.ap,
+                                 key=lambda v: (-self.cut_off(v), -len(self.pieces(v)), v))
+        return [self.describe(v) for v in ranked]
+
+
+def load_impact_index(graph_file, state_file=None):
+    """
+    Charge l'état sauvegardé du graphe (par défaut <graph_file>.state) et construit l'index.
+    Sans état sauvegardé, l'état DFS est calculé à partir du fichier d'arêtes.
+    Si une table des identifiants (<graph_file>.ids) accompagne l'état, elle est chargée aussi.
+    """
+    base = os.path.splitext(graph_file)[0]
+    state_file = state_file or base + ".state"
+    interner = IdInterner.load(base + ".ids")
+    saved_state = load_graph_state(state_file)
+    if saved_state is not None:
+        return ImpactIndex.from_state(saved_state, interner)
+    if interner is not None:
+        graph, interner = load_labeled_graph(graph_file, interner)
+    else:
+        graph = load_graph(graph_file)
+    disc, low, parent, ap = articulation_dfs(graph)
+    return ImpactIndex(disc, low, parent, ap, interner)
+
+
+def run_query(index, command, args):
+    """
+    Exécute une requête et renvoie son résultat (sérialisable en JSON) :
+      is-ap v        le sommet v est-il un point d'articulation ?
+      components v   nombre de composantes connexes après la suppression de v
+      pieces v       tailles des pièces détachées par la suppression de v
+      impact v       résumé complet (composantes, pièces, sommets coupés)
+      top k          les k points d'articulation les plus critiques
+    """
+    if command not in ("is-ap", "components", "pieces", "impact", "top"):
+        raise ValueError(f"requête inconnue : {command}")
+    if len(args) != 1:
+        raise ValueError(f"{command} attend un argument, reçu {len(args)}")
+    if command == "top":
+        return index.top_critical(int(args[0]))
+    value = index.vertex(args[0])
+    if command == "is-ap":
+        return index.is_articulation(value)
+    if command == "components":
+        return index.components_after_removal(value)
+    if command == "pieces":
+        return index.pieces(value)
+    return index.describe(value)
+
+
+def run_batch(index, stream_in, stream_out):
+    """
+    Exécute une requête par ligne (lignes vides et commentaires "#" ignorés) et écrit, pour
+    chacune, une ligne JSON {"query": ..., "result": ...} ou {"query": ..., "error": ...}.
+
+    :return: Nombre de requêtes en erreur.
+    """
+    errors = 0
+    for line in stream_in:
+        parts = line.split()
+        if not parts or parts[0].startswith("#"):
+            continue
+        query = " ".join(parts)
+        try:
+            response = {"query": query, "result": run_query(index, parts[0], parts[1:])}
+        except ValueError as e:
+            response = {"query": query, "error": str(e)}
+            errors += 1
+        stream_out.write(json.dumps(response) + "\n")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requêtes sur l'impact de la panne d'un sommet.")
+    parser.add_argument("graph_file", help="Fichier d'arêtes dont l'état a été sauvegardé par main.py")
+    parser.add_argument("--state-file", help="Fichier d'état (par défaut : <graph_file>.state)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in [("is-ap", "Le sommet est-il un point d'articulation ?"),
+                               ("components", "Nombre de composantes après la suppression du sommet"),
+                               ("pieces", "Tailles des pièces détachées par la suppression du sommet"),
+                               ("impact", "Résumé de l'impact de la panne du sommet")]:
+        subparsers.add_parser(command, help=help_text).add_argument("vertex")
+    subparsers.add_parser("top", help="Points d'articulation les plus critiques").add_argument(
+        "k", type=int, nargs="?", default=10)
+    subparsers.add_parser("batch", help="Requêtes lues dans un fichier (une par ligne)").add_argument(
+        "queries", help="Fichier de requêtes (\"-\" pour l'entrée standard)")
+    args = parser.parse_args()
+
+    index = load_impact_index(args.graph_file, args.state_file)
+    if args.command == "batch":
+        if args.queries == "-":
+            errors = run_batch(index, sys.stdin, sys.stdout)
+        else:
+            with open(args.queries) as f:
+                errors = run_batch(index, f, sys.stdout)
+        sys.exit(1 if errors else 0)
+    value = args.k if args.command == "top" else args.vertex
+    try:
+        print(json.dumps(run_query(index, args.command, [value])))
+    except ValueError as e:
+        parser.exit(1, f"Erreur : {e}\n")
+
+
+if __name__ == "__main__":
+    main()
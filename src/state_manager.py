@@ -1,56 +1,504 @@
-
 # src/state_manager.py
 
 import json
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from contextlib import contextmanager
 from graph import Graph
+from dfs import articulation_points_from_state, count_children, classify_state_arrays, is_dfs_state
+from dfs_state import DFSState, ArrayMap, NO_PARENT
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, les sections sont lues dans des tableaux du module array
+    np = None
+from lca import AncestorIndex
+
+# Format binaire versionné de l'état DFS :
+#   en-tête de 32 octets : signature (8 octets), version (uint32), taille d'un entier (uint32),
+#                          nombre de sommets N (uint64), nombre d'arêtes M (uint64)
+#   à partir de la version 4, l'empreinte du fichier d'arêtes dont l'état est issu (32 octets :
+#                          taille (uint64), date de modification en ns (uint64), condensé de
+#                          16 octets ; que des zéros si l'état ne provient pas d'un fichier)
+#   puis les sections d'entiers signés little-endian sur 8 octets alignées sur les sommets
+#   (VERTEX_SECTIONS), edges[2M] (couples u < v triés), et enfin N octets indiquant les points
+#   d'articulation (à partir de la version 2). parent vaut NO_PARENT pour une racine ;
+#   depth et jump forment l'index des ancêtres (voir src/lca.py).
+#   À partir de la version 5, l'empreinte est suivie d'une table de sommes de contrôle (CRC32,
+#   uint32) : une par section (VERTEX_SECTIONS, edges, ap_flags) puis celle de l'en-tête et de
+#   la table elle-même. Chaque section se vérifie ainsi séparément, lorsqu'elle est lue.
+#   Les versions précédentes restent lisibles.
+STATE_MAGIC = b"PARXSTAT"
+STATE_VERSION = 5
+STATE_HEADER = struct.Struct("<8sIIQQ")
+STATE_FINGERPRINT = struct.Struct("<QQ16s")
+STATE_ITEMSIZE = 8
+VERTEX_SECTIONS = {
+    1: ("vertices", "disc", "low", "parent"),
+    2: ("vertices", "disc", "low", "parent", "children"),
+    3: ("vertices", "disc", "low", "parent", "children", "depth", "jump"),
+    4: ("vertices", "disc", "low", "parent", "children", "depth", "jump"),
+    5: ("vertices", "disc", "low", "parent", "children", "depth", "jump"),
+}
+STATE_CHECKSUMS = struct.Struct(f"<{len(VERTEX_SECTIONS[5]) + 3}I")
+
+
+class StateCorruptedError(ValueError):
+    """
+    Fichier d'état illisible : tronqué, somme de contrôle incorrecte ou format non reconnu.
+    """
+
+
+@contextmanager
+def atomic_write(filename, mode="wb"):
+    """
+    Écrit un fichier de façon atomique : le contenu est écrit dans un fichier temporaire voisin,
+    forcé sur disque, puis renommé en filename (os.replace). Après une interruption, filename
+    contient donc soit l'ancienne version complète, soit la nouvelle.
 
-def save_graph_state(graph, disc, low, parent, filename):
+    :param mode: Mode d'ouverture du fichier temporaire ("wb" ou "w").
     """
-    Sauvegarde l'état du graphe et de la structure DFS dans un fichier JSON.
-    
-    :param graph: Instance de Graph.
+    tmp = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def save_graph_state(graph, disc, low, parent, filename, ap=None, children=None, index=None,
+                     fingerprint=None):
+    """
+    Sauvegarde l'état du graphe et de la structure DFS.
+
+    Le format est choisi d'après l'extension : JSON pour ".json", format binaire compact sinon.
+
+    :param graph: Instance de Graph ou de CSRGraph.
     :param disc: Dictionnaire des temps de découverte.
     :param low: Dictionnaire des valeurs low.
     :param parent: Dictionnaire des parents dans l'arbre DFS.
-    :param filename: Nom complet du fichier de sauvegarde (par exemple "data/example_graph.json").
+    :param filename: Nom complet du fichier de sauvegarde (par exemple "data/example_graph.state").
+    :param ap: Ensemble des points d'articulation (dérivé de l'état DFS s'il est absent).
+    :param children: Nombre d'enfants de chaque nœud (dérivé de parent s'il est absent).
+    :param index: Index des ancêtres (AncestorIndex, construit à partir de parent s'il est absent).
+    :param fingerprint: Empreinte (size, mtime_ns, digest) du fichier d'arêtes dont l'état est issu
+                        (voir loader.file_fingerprint), ou None.
+    """
+    if ap is None:
+        ap = articulation_points_from_state(disc, low, parent)
+    if children is None:
+        children = count_children(parent)
+    if index is None:
+        index = AncestorIndex.build(parent)
+    state = as_dfs_state(graph, disc, low, parent, ap, children, index)
+    if filename.endswith(".json"):
+        save_graph_state_json(graph, state, fingerprint, filename)
+    else:
+        save_graph_state_binary(graph, state, fingerprint, filename)
+
+def as_dfs_state(graph, disc, low, parent, ap, children, index):
+    """
+    Renvoie l'état DFS sous forme de DFSState : celui dont disc, low, parent, children, depth
+    et jump sont les vues (cas d'un état rechargé puis actualisé en place), sinon une copie
+    rangée en tableaux des dictionnaires.
+    """
+    state = disc.state if isinstance(disc, ArrayMap) else None
+    views = (disc, low, parent, children, index.depth, index.jump)
+    if state is not None and len(state) == len(graph.vertices()) and \
+            all(isinstance(m, ArrayMap) and m.state is state for m in views):
+        if ap is not state.ap:
+            state.ap.clear()
+            state.ap.update(ap)
+        return state
+    return DFSState.from_dicts(graph.vertices(), disc, low, parent, ap, children, index.depth, index.jump)
+
+def save_graph_state_json(graph, dfs_state, fingerprint, filename):
+    """
+    Sauvegarde l'état du graphe et de la structure DFS dans un fichier JSON : les colonnes de
+    l'état DFS sont des listes alignées sur "vertices" (null pour le parent d'une racine).
     """
+    columns = {name: column.tolist() for name, column in dfs_state.columns.items()}
+    columns["parent"] = [None if p == NO_PARENT else p for p in columns["parent"]]
     state = {
         "graph": {
-            "vertices": graph.vertices(),
-            "edges": sorted([tuple(sorted(edge)) for edge in [(u, v) for u in graph.vertices() 
-                                                                for v in graph.neighbors(u) if u < v]])
+            "vertices": list(dfs_state.vertex_list()),
+            "edges": graph.edges()
         },
-        "dfs_state": {
-            "disc": {str(k): v for k, v in disc.items()},
-            "low": {str(k): v for k, v in low.items()},
-            "parent": {str(k): (parent[k] if parent[k] is None else parent[k]) for k in parent}
-        }
+        "dfs_state": dict(columns, ap=sorted(dfs_state.ap)),
     }
-    with open(filename, "w") as f:
+    if fingerprint is not None:
+        size, mtime_ns, digest = fingerprint
+        state["source"] = {"size": size, "mtime_ns": mtime_ns, "digest": digest.hex()}
+    with atomic_write(filename, "w") as f:
         json.dump(state, f, indent=2)
 
+def save_graph_state_binary(graph, dfs_state, fingerprint, filename):
+    """
+    Sauvegarde l'état du graphe et de la structure DFS (DFSState) dans le format binaire
+    versionné : les colonnes de l'état sont écrites telles quelles, alignées sur ses sommets.
+    Les sommets doivent être des entiers positifs ou nuls. L'écriture est atomique (atomic_write).
+    """
+    vertices = dfs_state.vertex_array()
+    if dfs_state.positions is not None and vertices and min(vertices) < 0:
+        raise ValueError("Le format binaire n'accepte que des sommets entiers positifs ou nuls")
+    edges = array("q")
+    for u, v in graph.edges():
+        edges.append(u)
+        edges.append(v)
+    sections = [vertices] + [dfs_state.columns[name] for name in VERTEX_SECTIONS[STATE_VERSION][1:]] + [edges]
+    payload = []
+    for section in sections:
+        if sys.byteorder != "little":
+            section = section[:]
+            section.byteswap()
+        payload.append(section.tobytes())
+    payload.append(bytes(dfs_state.ap_flags))
+    header = STATE_HEADER.pack(STATE_MAGIC, STATE_VERSION, STATE_ITEMSIZE, len(vertices), len(edges) // 2)
+    checksums = [zlib.crc32(part) for part in payload]
+    checksums.append(zlib.crc32(header + struct.pack(f"<{len(checksums)}I", *checksums)))
+    with atomic_write(filename) as f:
+        f.write(header)
+        f.write(STATE_FINGERPRINT.pack(*(fingerprint or (0, 0, b""))))
+        f.write(STATE_CHECKSUMS.pack(*checksums))
+        for part in payload:
+            f.write(part)
+
 def load_graph_state(filename):
     """
-    Charge l'état du graphe sauvegardé depuis un fichier JSON.
-    
+    Charge l'état du graphe sauvegardé, au format binaire ou JSON (détection automatique).
+
+    Dans les deux cas, l'état renvoyé a la même forme : les dictionnaires disc, low et parent
+    de "dfs_state" sont indexés par des entiers et les arêtes sont des tuples (u, v).
+
+    Un état corrompu (écriture interrompue par une version précédente, somme de contrôle
+    incorrecte) est signalé sur la sortie d'erreur et traité comme absent : l'appelant
+    recalcule alors l'état complet, qui remplacera le fichier.
+
     :param filename: Nom complet du fichier de sauvegarde (par exemple "data/example_graph.json").
-    :return: L'état sauvegardé ou None si le fichier n'existe pas.
+    :return: L'état sauvegardé ou None si le fichier n'existe pas ou est corrompu.
+    """
+    try:
+        with open(filename, "rb") as f:
+            head = f.read(len(STATE_MAGIC))
+    except FileNotFoundError:
+        return None
+    try:
+        if head == STATE_MAGIC:
+            return load_graph_state_binary(filename)
+        return load_graph_state_json(filename)
+    except StateCorruptedError as e:
+        print(f"État {filename} ignoré : {e}", file=sys.stderr)
+        return None
+
+def load_graph_state_json(filename):
+    """
+    Charge un état sauvegardé au format JSON et convertit les clés en entiers.
+
+    Un état de l'ancien format (dictionnaires indexés par sommet) n'est repris que s'il est
+    bien celui d'un parcours en profondeur de son graphe (is_valid_state) : certaines versions
+    précédentes en ont sauvegardé qui ne le sont pas.
     """
     try:
         with open(filename, "r") as f:
             state = json.load(f)
+        legacy = not isinstance(state["dfs_state"]["disc"], list)
+        state = _convert_json_state(state)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise StateCorruptedError(f"état JSON illisible ({e!r})") from e
+    if legacy and not is_valid_state(state):
+        raise StateCorruptedError("état de l'ancien format qui n'est pas celui d'un DFS de son graphe")
+    return state
+
+def _convert_json_state(state):
+    dfs_saved = state["dfs_state"]
+    state["format"] = "json"
+    state["graph"]["edges"] = [tuple(edge) for edge in state["graph"]["edges"]]
+    source = state.pop("source", None)
+    state["fingerprint"] = None if source is None else (
+        source["size"], source["mtime_ns"], bytes.fromhex(source["digest"]))
+    if isinstance(dfs_saved["disc"], list):
+        # Colonnes alignées sur les sommets
+        columns = {name: array("q", [NO_PARENT if x is None else x for x in dfs_saved[name]])
+                   for name in VERTEX_SECTIONS[STATE_VERSION][1:]}
+        arrays = dict(columns, vertices=array("q", state["graph"]["vertices"]))
+        dfs_state = DFSState.from_arrays(arrays)
+        dfs_state.ap.update(dfs_saved["ap"])
+        state["dfs_state"] = _state_views(dfs_state)
         return state
+    # Ancien format (dictionnaires indexés par sommet) : rangé lui aussi dans un DFSState
+    dicts = {
+        "disc": {int(k): v for k, v in dfs_saved["disc"].items()},
+        "low": {int(k): v for k, v in dfs_saved["low"].items()},
+        "parent": {int(k): (None if p is None else int(p)) for k, p in dfs_saved["parent"].items()},
+    }
+    names = VERTEX_SECTIONS[2]
+    if "depth" in dfs_saved:
+        names = VERTEX_SECTIONS[STATE_VERSION]
+        dicts["depth"] = {int(k): v for k, v in dfs_saved["depth"].items()}
+        dicts["jump"] = {int(k): v for k, v in dfs_saved["jump"].items()}
+    if "ap" in dfs_saved:
+        dicts["ap"] = set(dfs_saved["ap"])
+        dicts["children"] = {int(k): v for k, v in dfs_saved["children"].items()}
+    else:
+        # État produit par une version précédente : dérivation sans nouveau parcours
+        fill_articulation_state(dicts)
+    dfs_state = DFSState.from_dicts(dicts["disc"].keys(), **dicts)
+    state["dfs_state"] = _state_views(dfs_state, names)
+    return state
+
+def load_graph_state_binary(filename):
+    """
+    Charge un état sauvegardé au format binaire versionné.
+    """
+    arrays = load_state_arrays(filename)
+    names = VERTEX_SECTIONS[arrays["version"]]
+    state = DFSState.from_arrays(arrays)
+    dfs_state = _state_views(state, names)
+    if arrays["ap_flags"] is None:
+        fill_articulation_state(dfs_state)
+    vertices = list(state.vertex_list())
+    edges = arrays["edges"]
+    return {
+        "format": "binary",
+        "version": arrays["version"],
+        "fingerprint": arrays["fingerprint"],
+        "graph": {
+            "vertices": vertices,
+            "edges": list(zip(edges[0::2].tolist(), edges[1::2].tolist())),
+        },
+        "dfs_state": dfs_state,
+        "arrays": arrays,
+    }
+
+def _state_views(state, names=VERTEX_SECTIONS[STATE_VERSION]):
+    # "dfs_state" d'un état chargé : les vues du DFSState (les colonnes absentes des anciennes
+    # versions sont omises, pour être reconstruites), et l'état lui-même
+    dfs_state = {name: getattr(state, name) for name in names if name != "vertices"}
+    dfs_state.update(ap=state.ap, state=state)
+    return dfs_state
+
+def load_state_arrays(filename, sections=None):
+    """
+    Lit les sections d'un état binaire sous forme de tableaux alignés sur les sommets
+    (NumPy si disponible, sinon module array), sans construire de dictionnaires.
+
+    Seules les sections demandées sont lues (un seek et une lecture chacune) et, à partir de la
+    version 5, vérifiées : dériver les points d'articulation n'a besoin que de vertices, disc,
+    low et parent, pas des arêtes, de loin la plus grande section.
+
+    :param sections: Noms des sections à lire (toutes par défaut).
+    :return: Dictionnaire : "vertices", une entrée par section de VERTEX_SECTIONS (parent vaut
+             NO_PARENT pour une racine), "edges" (couples u, v à plat), "ap_flags" (octets, ou
+             None avant la version 2), limités aux sections demandées, ainsi que "version",
+             "fingerprint", "num_vertices" et "num_edges".
+    :raises StateCorruptedError: Fichier tronqué, format non reconnu ou section corrompue.
+    """
+    prefix = STATE_HEADER.size + STATE_FINGERPRINT.size + STATE_CHECKSUMS.size
+    with open(filename, "rb") as f:
+        head = f.read(prefix)
+        if len(head) < STATE_HEADER.size:
+            raise StateCorruptedError("en-tête d'état binaire tronqué")
+        magic, version, itemsize, num_vertices, num_edges = STATE_HEADER.unpack_from(head)
+        if magic != STATE_MAGIC or version not in VERTEX_SECTIONS or itemsize != STATE_ITEMSIZE:
+            raise StateCorruptedError(f"format d'état binaire non reconnu (version {version})")
+        n = num_vertices
+        names = VERTEX_SECTIONS[version]
+        start = STATE_HEADER.size + (STATE_FINGERPRINT.size if version >= 4 else 0)
+        checksums = None
+        if version >= 5:
+            if len(head) < prefix:
+                raise StateCorruptedError("en-tête d'état binaire tronqué")
+            checksums = STATE_CHECKSUMS.unpack_from(head, start)
+            start += STATE_CHECKSUMS.size
+            table = struct.pack(f"<{len(checksums) - 1}I", *checksums[:-1])
+            if zlib.crc32(head[:STATE_HEADER.size] + table) != checksums[-1]:
+                raise StateCorruptedError("somme de contrôle de l'en-tête incorrecte")
+        # Position et taille de chaque section dans le fichier
+        layout = {name: (start + i * n * STATE_ITEMSIZE, n * STATE_ITEMSIZE) for i, name in enumerate(names)}
+        end = start + len(names) * n * STATE_ITEMSIZE
+        layout["edges"] = (end, 2 * num_edges * STATE_ITEMSIZE)
+        end += 2 * num_edges * STATE_ITEMSIZE
+        if version >= 2:
+            layout["ap_flags"] = (end, n)
+            end += n
+        if os.fstat(f.fileno()).st_size != end:
+            raise StateCorruptedError("fichier d'état binaire tronqué")
+        fingerprint = None
+        if version >= 4:
+            fingerprint = STATE_FINGERPRINT.unpack_from(head, STATE_HEADER.size)
+            if fingerprint == (0, 0, bytes(16)):
+                fingerprint = None
+
+        arrays = {} if version >= 2 else {"ap_flags": None}
+        order = list(layout)
+        for name in order if sections is None else sections:
+            offset, size = layout[name]
+            f.seek(offset)
+            data = f.read(size)
+            if checksums is not None and zlib.crc32(data) != checksums[order.index(name)]:
+                raise StateCorruptedError(f"somme de contrôle incorrecte pour la section {name}")
+            if name == "ap_flags":
+                arrays[name] = data
+            elif np is not None:
+                arrays[name] = np.frombuffer(data, dtype="<i8")
+            else:
+                arrays[name] = array("q")
+                arrays[name].frombytes(data)
+                if sys.byteorder != "little":
+                    arrays[name].byteswap()
+    arrays.update(version=version, fingerprint=fingerprint, num_vertices=n, num_edges=num_edges)
+    return arrays
+
+def _parent_positions(vertices, parent_ids):
+    # Position de chaque parent dans la liste des sommets (-1 pour une racine)
+    if np is None:
+        position = {v: i for i, v in enumerate(vertices)}
+        return [-1 if p == NO_PARENT else position[p] for p in parent_ids]
+    vertices = np.asarray(vertices, dtype=np.int64)
+    parent_ids = np.asarray(parent_ids, dtype=np.int64)
+    if np.array_equal(vertices, np.arange(len(vertices))):
+        return parent_ids
+    order = np.argsort(vertices, kind="stable")
+    is_root = parent_ids == NO_PARENT
+    positions = order[np.searchsorted(vertices[order], np.where(is_root, vertices[order[0]], parent_ids))]
+    positions[is_root] = -1
+    return positions
+
+def state_arrays(saved_state):
+    """
+    Renvoie les tableaux (voir load_state_arrays) d'un état chargé par load_graph_state :
+    ceux du fichier pour un état binaire, sinon construits à partir des dictionnaires.
+    """
+    if "arrays" in saved_state:
+        return saved_state["arrays"]
+    disc, low, parent = get_dfs_state(saved_state)
+    vertices = list(disc)
+    return {
+        "vertices": vertices,
+        "disc": [disc[v] for v in vertices],
+        "low": [low[v] for v in vertices],
+        "parent": [NO_PARENT if parent[v] is None else parent[v] for v in vertices],
+    }
+
+def articulation_state_from_arrays(arrays):
+    """
+    Dérive les points d'articulation et les ponts des tableaux d'un état binaire
+    (load_state_arrays) par les opérations vectorisées de dfs.classify_state_arrays,
+    sans construire les dictionnaires disc, low et parent.
+
+    :return: Tuple (ap, bridges) : ensemble des points d'articulation et liste triée des
+             ponts (u, v) avec u < v.
+    """
+    vertices = arrays["vertices"]
+    if len(vertices) == 0:
+        return set(), []
+    parent = _parent_positions(vertices, arrays["parent"])
+    ap_mask, bridges, _ = classify_state_arrays(arrays["disc"], arrays["low"], parent)
+    if np is None:
+        ap = {v for v, flag in zip(vertices, ap_mask) if flag}
+        return ap, sorted((min(vertices[p], vertices[c]), max(vertices[p], vertices[c])) for p, c in bridges)
+    vertices = np.asarray(vertices, dtype=np.int64)
+    ends = vertices[bridges]
+    lo, hi = ends.min(axis=1), ends.max(axis=1)
+    order = np.lexsort((hi, lo))
+    return set(vertices[ap_mask].tolist()), list(zip(lo[order].tolist(), hi[order].tolist()))
+
+def read_state_fingerprint(filename):
+    """
+    Lit uniquement l'empreinte du fichier d'arêtes enregistrée dans un état binaire
+    (en-tête de taille fixe : lecture en O(1), sans charger l'état).
+
+    :return: Tuple (size, mtime_ns, digest), ou None si le fichier n'existe pas, est au format
+             JSON ou antérieur à la version 4, ou ne contient pas d'empreinte.
+    """
+    try:
+        with open(filename, "rb") as f:
+            data = f.read(STATE_HEADER.size + STATE_FINGERPRINT.size)
     except FileNotFoundError:
         return None
+    if len(data) < STATE_HEADER.size + STATE_FINGERPRINT.size:
+        return None
+    magic, version = STATE_HEADER.unpack_from(data)[:2]
+    if magic != STATE_MAGIC or version < 4:
+        return None
+    fingerprint = STATE_FINGERPRINT.unpack_from(data, STATE_HEADER.size)
+    return None if fingerprint == (0, 0, bytes(16)) else fingerprint
+
+def update_state_fingerprint(filename, fingerprint):
+    """
+    Remplace sur place l'empreinte enregistrée dans un état binaire (version 4 ou plus),
+    par exemple lorsque seule la date de modification du fichier d'arêtes a changé.
+
+    :return: True si l'empreinte a été réécrite.
+    """
+    if read_state_fingerprint(filename) is None:
+        return False
+    # Réécriture sur place de 32 octets hors des sommes de contrôle : une empreinte abîmée par
+    # une interruption ne peut que différer de celle du fichier, ce qui force une relecture.
+    with open(filename, "r+b") as f:
+        f.seek(STATE_HEADER.size)
+        f.write(STATE_FINGERPRINT.pack(*fingerprint))
+    return True
+
+def fill_articulation_state(dfs_state):
+    """
+    Complète un état DFS chargé sans points d'articulation ni nombre d'enfants
+    (anciens formats) en les dérivant de disc, low et parent.
+    """
+    dfs_state["ap"] = articulation_points_from_state(dfs_state["disc"], dfs_state["low"], dfs_state["parent"])
+    dfs_state["children"] = count_children(dfs_state["parent"])
+
+def get_dfs_state(saved_state):
+    """
+    Renvoie le tuple (disc, low, parent) d'un état chargé par load_graph_state.
+    """
+    dfs_saved = saved_state["dfs_state"]
+    return dfs_saved["disc"], dfs_saved["low"], dfs_saved["parent"]
+
+def get_articulation_state(saved_state):
+    """
+    Renvoie le tuple (ap, children) d'un état chargé par load_graph_state : l'ensemble
+    persistant des points d'articulation et le nombre d'enfants de chaque nœud.
+    """
+    dfs_saved = saved_state["dfs_state"]
+    return dfs_saved["ap"], dfs_saved["children"]
+
+def get_ancestor_index(saved_state):
+    """
+    Renvoie l'index des ancêtres (AncestorIndex) d'un état chargé par load_graph_state,
+    lié au dictionnaire parent de l'état. Il est reconstruit si l'état n'en contient pas.
+    """
+    dfs_saved = saved_state["dfs_state"]
+    if "depth" not in dfs_saved:
+        return AncestorIndex.build(dfs_saved["parent"])
+    return AncestorIndex(dfs_saved["parent"], dfs_saved["depth"], dfs_saved["jump"])
+
+def graph_from_state(saved_state):
+    """
+    Reconstruit le graphe (instance de Graph) enregistré dans un état chargé par load_graph_state.
+    """
+    g = Graph()
+    for v in saved_state["graph"]["vertices"]:
+        g.add_vertex(v)
+    for u, v in saved_state["graph"]["edges"]:
+        g.add_edge(u, v)
+    return g
 
-def compare_graph_states(current_state, saved_state):
+def is_valid_state(saved_state):
     """
-    Compare la structure du graphe actuel et celle sauvegardée sur la base de la liste d'arêtes.
-    Retourne True s'il y a modification, False sinon.
+    Vérifie qu'un état chargé par load_graph_state est celui d'un parcours en profondeur de son
+    propre graphe (dfs.is_dfs_state), en O(V + E) et sans nouveau DFS. À appeler avant de
+    reprendre un état produit par une version précédente.
     """
-    current_edges = set([tuple(sorted(edge)) for edge in current_state["graph"]["edges"]])
-    saved_edges = set([tuple(sorted(edge)) for edge in saved_state["graph"]["edges"]])
-    return current_edges != saved_edges
+    return is_dfs_state(graph_from_state(saved_state), *get_dfs_state(saved_state))
 
 def get_current_graph_state(graph):
     """
@@ -58,9 +506,8 @@ def get_current_graph_state(graph):
     """
     state = {
         "graph": {
-            "vertices": graph.vertices(),
-            "edges": sorted([tuple(sorted(edge)) for edge in [(u, v) for u in graph.vertices() 
-                                                                for v in graph.neighbors(u) if u < v]])
+            "vertices": list(graph.vertices()),
+            "edges": graph.edges()
         }
     }
     return state
@@ -1,7 +1,8 @@
 
 # src/updater.py
 
-from dfs import find_articulation_points
+from dfs import articulation_dfs, articulation_points_from_state, count_children
+from instrumentation import metrics
 
 def get_path_to_root(node, parent):
     """
@@ -34,50 +35,170 @@ def find_lca(x, y, parent, disc):
     lca = max(common, key=lambda node: disc[node])
     return lca
 
-def partial_dfs_update(graph, u, new_disc, new_low, new_parent, visited, time, counter, updated_nodes, original_parent):
+def evaluate_articulation(graph, u, disc, low, parent):
     """
-    Effectue un DFS partiel à partir du nœud 'u', recalculant les valeurs new_disc et new_low
-    uniquement pour les nœuds appartenant au sous-arbre défini par l'état DFS initial (original_parent).
+    Évalue la condition d'articulation du nœud u à partir de ses enfants dans l'arbre DFS.
+    Coût O(degré(u)).
+
+    Returns:
+        tuple: (True si u est un point d'articulation, nombre d'enfants de u)
+    """
+    count = 0
+    critical = False
+    du = disc[u]
+    for v in graph.neighbors(u):
+        if parent.get(v) == u:
+            count += 1
+            if low[v] >= du:
+                critical = True
+    if parent[u] is None:
+        return count > 1, count
+    return critical, count
+
+def refresh_articulation(graph, nodes, disc, low, parent, ap=None, children=None):
+    """
+    Met à jour l'ensemble des points d'articulation (et le nombre d'enfants) après une
+    actualisation, en ne réévaluant que les nœuds recalculés et leurs parents : la condition
+    d'un nœud ne dépend que de son disc et des valeurs low de ses enfants.
+
+    Si ap n'est pas fourni, il est dérivé de tout l'état DFS (sans nouveau parcours).
+
+    Returns:
+        set: L'ensemble des points d'articulation (ap, modifié en place s'il est fourni).
+    """
+    if ap is None:
+        return articulation_points_from_state(disc, low, parent)
+    if children is None:
+        children = {}
+    candidates = set(nodes)
+    candidates.update(parent[u] for u in nodes if parent[u] is not None)
+    for u in candidates:
+        is_ap, children[u] = evaluate_articulation(graph, u, disc, low, parent)
+        if is_ap:
+            ap.add(u)
+        else:
+            ap.discard(u)
+    return ap
+
+def replace_state(graph, disc, low, parent, ap=None, children=None, index=None):
+    """
+    Remplace en place tout l'état DFS par un recalcul complet (cas de repli).
+    L'index des ancêtres éventuel est reconstruit.
+
+    Returns:
+        tuple: (points d'articulation, liste triée de tous les nœuds)
+    """
+    metrics.count("full_recomputes")
+    new_disc, new_low, new_parent, new_ap = articulation_dfs(graph)
+    for d, new in ((disc, new_disc), (low, new_low), (parent, new_parent)):
+        d.clear()
+        d.update(new)
+    if ap is not None:
+        ap.clear()
+        ap.update(new_ap)
+        new_ap = ap
+    if children is not None:
+        children.clear()
+        children.update(count_children(parent))
+    if index is not None:
+        index.depth.clear()
+        index.jump.clear()
+        index.repair(parent, disc)
+    return new_ap, sorted(new_disc)
+
+def register_vertices(graph, vertices, disc, low, parent, children=None, index=None):
+    """
+    Ajoute à l'état DFS des sommets qui n'y figurent pas encore, comme racines isolées de
+    nouveaux arbres DFS, avant l'application d'arêtes qui les touchent. Leurs temps de
+    découverte suivent la plus grande valeur disc existante.
+
+    Returns:
+        list: Sommets ajoutés.
+    """
+    new_vertices = [v for v in dict.fromkeys(vertices) if v not in disc]
+    if not new_vertices:
+        return []
+    time = max(disc.values(), default=-1) + 1
+    for v in new_vertices:
+        graph.add_vertex(v)
+        disc[v] = low[v] = time
+        time += 1
+        parent[v] = None
+        if children is not None:
+            children[v] = 0
+    if index is not None:
+        index.repair(new_vertices, disc)
+    return new_vertices
+
+def get_subtree_nodes(graph, root, parent, subtree=None):
+    """
+    Renvoie l'ensemble des nœuds du sous-arbre DFS enraciné en 'root', en ne suivant
+    que les arêtes d'arbre (v est un enfant de u si parent[v] == u). Parcours itératif.
+    Si 'subtree' est fourni, les nœuds y sont ajoutés (et ceux déjà présents ne sont pas reparcourus).
+    """
+    if subtree is None:
+        subtree = set()
+    elif root in subtree:
+        return subtree
+    subtree.add(root)
+    stack = [root]
+    while stack:
+        u = stack.pop()
+        for v in graph.neighbors(u):
+            if v not in subtree and parent.get(v) == u:
+                subtree.add(v)
+                stack.append(v)
+    return subtree
+
+def retraverse_region(graph, root, root_parent, scope, disc):
+    """
+    Relance le moteur DFS itératif sur la zone 'scope' à partir de 'root', rattaché à 'root_parent'
+    (None pour une nouvelle racine). Les temps de découverte attribués réutilisent, dans l'ordre,
+    les anciennes valeurs disc des nœuds de la zone : les valeurs restent uniques dans tout
+    l'état et supérieures à celles des ancêtres de la zone.
+
+    Returns:
+        tuple: (new_disc, new_low, new_parent) pour les nœuds de la zone.
+    """
+    start_time = min(disc[u] for u in scope)
+    new_disc, new_low, new_parent, _ = articulation_dfs(
+        graph, roots=[root], parent={root: root_parent}, start_time=start_time,
+        scope=scope, outer_disc=disc)
+    old_values = sorted(disc[u] for u in scope)
+    for u, t in new_disc.items():
+        new_disc[u] = old_values[t - start_time]
+    for u, t in new_low.items():
+        if t >= start_time:
+            new_low[u] = old_values[t - start_time]
+    return new_disc, new_low, new_parent
+
+def partial_dfs_update(graph, root, disc, low, parent):
+    """
+    Effectue un DFS partiel itératif à partir du nœud 'root', recalculant les valeurs disc et low
+    uniquement pour les nœuds appartenant au sous-arbre défini par l'état DFS initial (parent).
+    Les voisins situés hors de ce sous-arbre sont des ancêtres de 'root' : leurs temps de
+    découverte sont lus dans l'état global.
 
     Args:
         graph (Graph): Le graphe.
-        u (int): Le nœud de départ pour la mise à jour.
-        new_disc (dict): Dictionnaire local pour les temps de découverte recalculés.
-        new_low (dict): Dictionnaire local pour les valeurs low recalculées.
-        new_parent (dict): Dictionnaire local pour les parents recalculés.
-        visited (set): Ensemble des nœuds déjà visités dans le DFS partiel.
-        time (list): Liste contenant la valeur du temps courant (mutable).
-        counter (list): Liste utilisée comme compteur (le premier élément compte le nombre de nœuds traités).
-        updated_nodes (list): Liste des nœuds recalculés (pour affichage).
-        original_parent (dict): Dictionnaire des parents issu de l'état DFS initial, pour restreindre le DFS.
-    
+        root (int): Le nœud de départ pour la mise à jour (typiquement le LCA).
+        disc (dict): Dictionnaire global des temps de découverte (non modifié).
+        low (dict): Dictionnaire global des valeurs low (non modifié).
+        parent (dict): Dictionnaire des parents issu de l'état DFS initial, pour restreindre le DFS.
+
     Returns:
-        None
+        tuple: (new_disc, new_low, new_parent, updated_nodes) pour les nœuds recalculés,
+               updated_nodes étant listés dans l'ordre de découverte.
     """
-    if u in visited:
-        return
-    visited.add(u)
-    counter[0] += 1
-    updated_nodes.append(u)
-    
-    new_disc[u] = new_low[u] = time[0]
-    time[0] += 1
-    print(f"Traitement du nœud {u} : new_disc={new_disc[u]}, new_low={new_low[u]}")
-    
-    for v in graph.neighbors(u):
-        # Ne traiter que les voisins qui appartiennent au sous-arbre de u dans l'état DFS initial.
-        if original_parent.get(v) != u:
-            continue
-        if v not in visited:
-            new_parent[v] = u
-            partial_dfs_update(graph, v, new_disc, new_low, new_parent, visited, time, counter, updated_nodes, original_parent)
-            new_low[u] = min(new_low[u], new_low[v])
-        elif v != new_parent.get(u, None):
-            new_low[u] = min(new_low[u], new_disc[v])
-    
-    print(f"Nœud {u} terminé : new_disc={new_disc[u]}, new_low={new_low[u]}")
+    scope = get_subtree_nodes(graph, root, parent)
+    new_disc, new_low, new_parent = retraverse_region(graph, root, parent.get(root), scope, disc)
+    updated_nodes = sorted(new_disc, key=new_disc.get)
+    if metrics.verbose:
+        for u in updated_nodes:
+            metrics.trace(f"Nœud {u} terminé : new_disc={new_disc[u]}, new_low={new_low[u]}")
+    return new_disc, new_low, new_parent, updated_nodes
 
-def advanced_incremental_update_edge_addition(graph, x, y, disc, low, parent):
+def advanced_incremental_update_edge_addition(graph, x, y, disc, low, parent, ap=None, children=None, index=None):
     """
     Met à jour de manière incrémentale l'état DFS après l'ajout d'une arête (x, y) 
     en recalculant uniquement la sous-arborescence impactée à partir du LCA des deux nœuds,
@@ -90,39 +211,333 @@ def advanced_incremental_update_edge_addition(graph, x, y, disc, low, parent):
         disc (dict): Dictionnaire global des temps de découverte.
         low (dict): Dictionnaire global des valeurs low.
         parent (dict): Dictionnaire global des parents dans l'arbre DFS (état initial).
+        ap (set, optionnel): Points d'articulation de l'état initial, mis à jour en place
+            en ne réévaluant que la zone recalculée.
+        children (dict, optionnel): Nombre d'enfants de chaque nœud, mis à jour en place.
+        index (AncestorIndex, optionnel): Index des ancêtres, utilisé pour le LCA puis réparé
+            sur la zone recalculée.
 
     Returns:
-        list: Liste des points d'articulation détectés après actualisation incrémentale.
+        tuple: (points d'articulation après actualisation, liste triée des nœuds recalculés).
     """
-    lca = find_lca(x, y, parent, disc)
+    lca = index.lca(x, y) if index is not None else find_lca(x, y, parent, disc)
     if lca is None:
-        return find_articulation_points(graph)
-
-    print(f"LCA pour les nœuds {x} et {y} est {lca}")
-
-    visited = set()
-    counter = [0]
-    updated_nodes = []
-    new_disc = {}
-    new_low = {}
-    new_parent = {}
-    # Reprise du temps à partir du LCA
-    time = [disc[lca]]
-    
-    partial_dfs_update(graph, lca, new_disc, new_low, new_parent, visited, time, counter, updated_nodes, parent)
+        # Les deux nœuds appartiennent à des arbres DFS distincts : recalcul complet.
+        return replace_state(graph, disc, low, parent, ap, children, index)
+
+    metrics.trace(f"LCA pour les nœuds {x} et {y} est {lca}")
+
+    new_disc, new_low, new_parent, updated_nodes = partial_dfs_update(graph, lca, disc, low, parent)
 
     updated_nodes_sorted = sorted(updated_nodes)
-    print(f"DFS partiel mis à jour sur {counter[0]} nœuds à partir du LCA {lca}")
-    print(f"Nœuds recalculés : {updated_nodes_sorted}")
-    print(f"Nombre total de nœuds recalculés : {len(updated_nodes_sorted)}")
+    metrics.count("regions_recomputed")
+    metrics.count("region_size", len(updated_nodes_sorted))
+    metrics.trace(f"DFS partiel mis à jour sur {len(updated_nodes)} nœuds à partir du LCA {lca}")
+    if metrics.verbose:
+        metrics.trace(f"Nœuds recalculés : {updated_nodes_sorted}")
     
     # Intégration : mettre à jour uniquement les nœuds recalculés dans l'état global
     for node in new_disc:
         disc[node] = new_disc[node]
         low[node] = new_low[node]
-        parent[node] = new_parent[node] if node in new_parent else parent.get(node, None)
-    
-    #return find_articulation_points(graph)
+        parent[node] = new_parent[node]
+    if index is not None:
+        index.repair(updated_nodes, disc)
     
-    new_ap = find_articulation_points(graph)
+    new_ap = refresh_articulation(graph, updated_nodes, disc, low, parent, ap, children)
+    return new_ap, updated_nodes_sorted
+
+def recompute_low(graph, u, disc, low, parent):
+    """
+    Recalcule low[u] à partir des voisins de u : temps de découverte des voisins reliés par
+    une arête arrière et valeurs low des enfants dans l'arbre DFS. Coût O(degré(u)).
+
+    Returns:
+        bool: True si la valeur low[u] a changé.
+    """
+    value = disc[u]
+    pu = parent[u]
+    for v in graph.neighbors(u):
+        if v == pu or v not in disc:
+            continue
+        if parent[v] == u:
+            if low[v] < value:
+                value = low[v]
+        elif disc[v] < value:
+            value = disc[v]
+    changed = value != low[u]
+    low[u] = value
+    return changed
+
+def repair_low_to_root(graph, start, disc, low, parent, through=None):
+    """
+    Recalcule low en remontant de 'start' vers la racine, et s'arrête dès qu'une valeur
+    est inchangée (les ancêtres suivants ne peuvent plus être affectés). Si 'through' est
+    fourni, tous les nœuds jusqu'à cet ancêtre sont recalculés avant l'arrêt anticipé
+    (nécessaire lorsqu'un ancêtre a reçu de nouveaux enfants).
+
+    Returns:
+        list: Nœuds dont la valeur low a été recalculée.
+    """
+    touched = []
+    forced = through is not None
+    node = start
+    while node is not None:
+        touched.append(node)
+        changed = recompute_low(graph, node, disc, low, parent)
+        if node == through:
+            forced = False
+        if not changed and not forced:
+            break
+        node = parent[node]
+    metrics.count("low_repairs", len(touched))
+    return touched
+
+def incremental_update_edge_removal(graph, x, y, disc, low, parent, ap=None, children=None, index=None):
+    """
+    Met à jour de manière incrémentale l'état DFS après la suppression d'une arête (x, y).
+    Le graphe doit déjà refléter la suppression.
+
+      - Arête hors arbre (arête arrière) : seules les valeurs low du chemin allant de
+        l'extrémité la plus profonde vers l'ancêtre sont réparées, avec arrêt anticipé.
+      - Arête d'arbre (p, c) : le sous-arbre détaché de c est ré-enraciné sur l'arête arrière
+        qui le relie à l'ancêtre le plus profond (ou devient une nouvelle composante) puis
+        reparcouru seul ; les valeurs low sont ensuite réparées à partir de p.
+
+    Args:
+        graph (Graph): Le graphe (arête déjà supprimée).
+        x (int): Un des nœuds de l'arête supprimée.
+        y (int): L'autre nœud.
+        disc (dict): Dictionnaire global des temps de découverte.
+        low (dict): Dictionnaire global des valeurs low.
+        parent (dict): Dictionnaire global des parents dans l'arbre DFS.
+        ap (set, optionnel): Points d'articulation, mis à jour en place.
+        children (dict, optionnel): Nombre d'enfants de chaque nœud, mis à jour en place.
+        index (AncestorIndex, optionnel): Index des ancêtres, réparé sur le sous-arbre reparcouru.
+
+    Returns:
+        tuple: (points d'articulation après actualisation, liste triée des nœuds recalculés).
+    """
+    if x not in disc or y not in disc:
+        return refresh_articulation(graph, [], disc, low, parent, ap, children), []
+
+    if parent[x] == y or parent[y] == x:
+        p, c = (y, x) if parent[x] == y else (x, y)
+        detached = get_subtree_nodes(graph, c, parent)
+        # Ancêtre le plus profond encore relié au sous-arbre détaché
+        root, anchor = c, None
+        for u in detached:
+            for v in graph.neighbors(u):
+                if v not in detached and (anchor is None or disc[v] > disc[anchor]):
+                    root, anchor = u, v
+        if anchor is None:
+            metrics.trace(f"Arête d'arbre ({p}, {c}) supprimée : le sous-arbre de {len(detached)} nœuds "
+                          f"devient une nouvelle composante")
+        else:
+            metrics.trace(f"Arête d'arbre ({p}, {c}) supprimée : sous-arbre de {len(detached)} nœuds "
+                          f"ré-enraciné en {root} sous {anchor}")
+        metrics.count("regions_recomputed")
+        new_disc, new_low, new_parent = retraverse_region(graph, root, anchor, detached, disc)
+        disc.update(new_disc)
+        low.update(new_low)
+        parent.update(new_parent)
+        if index is not None:
+            index.repair(new_disc, disc)
+        updated_nodes = list(new_disc) + repair_low_to_root(graph, p, disc, low, parent)
+    else:
+        # Arête arrière : réparation de low depuis l'extrémité la plus profonde
+        deeper = x if disc[x] > disc[y] else y
+        updated_nodes = repair_low_to_root(graph, deeper, disc, low, parent)
+
+    updated_nodes_sorted = sorted(set(updated_nodes))
+    metrics.count("region_size", len(updated_nodes_sorted))
+    if metrics.verbose:
+        metrics.trace(f"Nœuds recalculés : {updated_nodes_sorted}")
+
+    new_ap = refresh_articulation(graph, updated_nodes_sorted, disc, low, parent, ap, children)
+    return new_ap, updated_nodes_sorted
+
+def is_ancestor(a, b, parent, disc):
+    """
+    Indique si 'a' est un ancêtre de 'b' (ou 'b' lui-même) dans l'arbre DFS.
+    Les temps de découverte décroissent strictement en remontant vers la racine.
+    """
+    node = b
+    while node is not None and disc[node] > disc[a]:
+        node = parent[node]
+    return node == a
+
+def rehang_region(graph, roots, disc, low, parent):
+    """
+    Recalcule une zone sale formée des sous-arbres DFS (état initial) enracinés en 'roots'.
+
+    Chaque morceau connexe de la zone est reparcouru une seule fois et rattaché à l'ancêtre
+    le plus profond auquel il est encore relié (ou devient une nouvelle racine). Les valeurs
+    disc réutilisent les anciennes valeurs de la zone. L'état global est mis à jour en place.
+
+    Returns:
+        tuple: (nœuds recalculés, ancêtre de rattachement le plus haut ou None)
+    """
+    scope = set()
+    for root in sorted(roots, key=disc.get):
+        get_subtree_nodes(graph, root, parent, scope)
+
+    # Ancêtre le plus profond relié à chaque nœud de la zone (les voisins hors zone sont des ancêtres)
+    anchor = {}
+    for u in scope:
+        best = None
+        for v in graph.neighbors(u):
+            if v not in scope and (best is None or disc[v] > disc[best]):
+                best = v
+        anchor[u] = best
+    order = sorted(scope, key=lambda u: -1 if anchor[u] is None else disc[anchor[u]], reverse=True)
+
+    start_time = min(disc[u] for u in scope)
+    new_disc, new_low, new_parent = {}, {}, {}
+    topmost = None
+    for u in order:
+        if u in new_disc:
+            continue
+        a = anchor[u]
+        new_parent[u] = a
+        if a is not None and (topmost is None or disc[a] < disc[topmost]):
+            topmost = a
+        articulation_dfs(graph, roots=[u], disc=new_disc, low=new_low, parent=new_parent,
+                         start_time=start_time + len(new_disc), scope=scope, outer_disc=disc)
+
+    old_values = sorted(disc[u] for u in scope)
+    for u, t in new_disc.items():
+        disc[u] = old_values[t - start_time]
+    for u, t in new_low.items():
+        low[u] = old_values[t - start_time] if t >= start_time else t
+    parent.update(new_parent)
+    return list(new_disc), topmost
+
+def incremental_update_batch(graph, added_edges, removed_edges, disc, low, parent, ap=None, children=None, index=None):
+    """
+    Applique en une seule fois un lot d'ajouts et de suppressions d'arêtes à l'état DFS.
+    Le graphe doit déjà refléter toutes les modifications.
+
+    Chaque modification est classée d'après l'arbre DFS initial :
+      - arête arrière ajoutée ou supprimée : simple réparation de low à partir de l'extrémité
+        la plus profonde ;
+      - arête transverse ajoutée : zone sale = sous-arbre du LCA ;
+      - arête reliant deux arbres DFS : zone sale = les deux arbres, traités ensemble ;
+      - arête d'arbre supprimée (p, c) : zone sale = sous-arbre détaché de c.
+    Les zones imbriquées sont fusionnées dans leur ancêtre, puis chaque zone restante est
+    recalculée exactement une fois, avant la réparation des valeurs low au-dessus des zones.
+
+    Args:
+        graph (Graph): Le graphe (modifications déjà appliquées).
+        added_edges (iterable): Arêtes (u, v) ajoutées.
+        removed_edges (iterable): Arêtes (u, v) supprimées.
+        disc (dict): Dictionnaire global des temps de découverte.
+        low (dict): Dictionnaire global des valeurs low.
+        parent (dict): Dictionnaire global des parents dans l'arbre DFS.
+        ap (set, optionnel): Points d'articulation, mis à jour en place en ne réévaluant
+            que les nœuds recalculés et leurs parents.
+        children (dict, optionnel): Nombre d'enfants de chaque nœud, mis à jour en place.
+        index (AncestorIndex, optionnel): Index des ancêtres, utilisé pour les requêtes
+            d'ascendance et de LCA puis réparé sur les zones recalculées. Sans index, les
+            chemins vers la racine sont parcourus.
+
+    Returns:
+        tuple: (points d'articulation après actualisation, liste triée des nœuds recalculés).
+    """
+    added_edges = list(added_edges)
+    removed_edges = list(removed_edges)
+    if any(u not in disc or v not in disc for u, v in added_edges + removed_edges):
+        # Nouveaux sommets absents de l'état : recalcul complet.
+        return replace_state(graph, disc, low, parent, ap, children, index)
+
+    dirty = set()
+    links = []
+    repair_starts = []
+    cross_edges = []
+    for x, y in added_edges:
+        if index is not None:
+            related = index.is_ancestor(x, y) or index.is_ancestor(y, x)
+        else:
+            related = is_ancestor(x, y, parent, disc) or is_ancestor(y, x, parent, disc)
+        if related:
+            repair_starts.append((x, y))
+        else:
+            cross_edges.append((x, y))
+    # Requêtes LCA traitées en un seul lot
+    if index is not None:
+        lcas = index.lca_many(cross_edges)
+    else:
+        lcas = [find_lca(x, y, parent, disc) for x, y in cross_edges]
+    for (x, y), lca in zip(cross_edges, lcas):
+        if lca is None:
+            if index is not None:
+                root_x, root_y = index.level_ancestor(x, 0), index.level_ancestor(y, 0)
+            else:
+                root_x, root_y = get_path_to_root(x, parent)[-1], get_path_to_root(y, parent)[-1]
+            dirty.update((root_x, root_y))
+            links.append((root_x, root_y))
+        else:
+            dirty.add(lca)
+    for x, y in removed_edges:
+        if parent[x] == y or parent[y] == x:
+            dirty.add(x if parent[x] == y else y)
+        else:
+            repair_starts.append((x, y))
+
+    # Fusion des zones imbriquées : seules les racines sans ancêtre sale sont conservées
+    # (topmost[v] = racine sale la plus haute parmi v et ses ancêtres, mémoïsé le long des chemins)
+    topmost = {}
+    for root in dirty:
+        path = []
+        node = root
+        while node is not None and node not in topmost:
+            path.append(node)
+            node = parent[node]
+        current = None if node is None else topmost[node]
+        for node in reversed(path):
+            if current is None and node in dirty:
+                current = node
+            topmost[node] = current
+    top = {root: topmost[root] for root in dirty}
+    # Regroupement des arbres reliés par une nouvelle arête (union-find)
+    group = {root: root for root in top.values()}
+    def find(r):
+        while group[r] != r:
+            group[r] = group[group[r]]
+            r = group[r]
+        return r
+    for a, b in links:
+        ra, rb = find(top[a]), find(top[b])
+        if ra != rb:
+            group[ra] = rb
+    # Une zone contient aussi ses racines imbriquées : le parcours par arêtes d'arbre
+    # s'arrête aux arêtes d'arbre supprimées, dont l'enfant est lui-même une racine sale.
+    regions = {}
+    for root in dirty:
+        regions.setdefault(find(top[root]), []).append(root)
+
+    metrics.trace(f"Lot de {len(added_edges)} ajout(s) et {len(removed_edges)} suppression(s) : "
+                  f"{len(regions)} zone(s) sale(s) à recalculer")
+    metrics.count("regions_recomputed", len(regions))
+
+    updated_nodes = set()
+    for roots in regions.values():
+        old_parents = [parent[root] for root in roots if top[root] == root]
+        nodes, topmost = rehang_region(graph, roots, disc, low, parent)
+        if index is not None:
+            index.repair(nodes, disc)
+        updated_nodes.update(nodes)
+        for p in old_parents:
+            if p is not None:
+                updated_nodes.update(repair_low_to_root(graph, p, disc, low, parent, through=topmost))
+
+    # Réparation des valeurs low pour les arêtes arrière (de la plus profonde à la moins profonde)
+    starts = [x if disc[x] > disc[y] else y for x, y in repair_starts]
+    for start in sorted(starts, key=disc.get, reverse=True):
+        updated_nodes.update(repair_low_to_root(graph, start, disc, low, parent))
+
+    updated_nodes_sorted = sorted(updated_nodes)
+    metrics.count("region_size", len(updated_nodes_sorted))
+
+    new_ap = refresh_articulation(graph, updated_nodes_sorted, disc, low, parent, ap, children)
     return new_ap, updated_nodes_sorted
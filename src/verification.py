@@ -0,0 +1,203 @@
+# src/verification.py
+
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from graph import Graph
+from dfs import articulation_dfs, low_from_tree
+from dfs_state import DFSState
+
+CHANGES_LIMIT = 1000  # Nombre maximal d'actualisations gardées comme déclencheurs d'une divergence
+LOW_SAMPLE = 10  # Nombre de valeurs low divergentes détaillées dans un rapport
+MODES = ("thread", "process")
+
+
+def take_snapshot(graph, state):
+    """
+    Copie figée du graphe et de l'état DFS, transmissible à un autre thread ou processus :
+    sommets et arêtes du graphe, colonnes disc, low et parent, drapeaux des points d'articulation.
+
+    :param graph: Graphe (méthodes vertices() et edges()).
+    :param state: DFSState actualisé.
+    :return: Tuple (vertices, edges, state_vertices, columns, ap_flags).
+    """
+    columns = {name: state.columns[name][:] for name in ("disc", "low", "parent")}
+    state_vertices = None if state.positions is None else state.vertices[:]
+    return graph.vertices(), graph.edges(), state_vertices, columns, bytes(state.ap_flags)
+
+
+def check_snapshot(snapshot):
+    """
+    Vérifie un état actualisé incrémentalement contre un DFS complet du même graphe :
+    les points d'articulation doivent coïncider, et les valeurs low doivent être celles
+    qu'impose l'arbre DFS de l'état (dfs.low_from_tree).
+
+    :param snapshot: Résultat de take_snapshot.
+    :return: Rapport (dictionnaire) ; en cas de divergence, "fresh" contient l'état du DFS
+             complet (disc, low, parent, ap) pour la réparation.
+    """
+    vertices, edges, state_vertices, columns, ap_flags = snapshot
+    state = DFSState(state_vertices, columns, ap_flags)
+    graph = Graph()
+    for v in vertices:
+        graph.add_vertex(v)
+    for u, v in edges:
+        graph.add_edge(u, v)
+    disc, low, parent, ap = articulation_dfs(graph)
+
+    report = {"vertices": len(vertices), "edges": len(edges), "missing_ap": [], "extra_ap": [],
+              "low_mismatches": 0, "low_sample": []}
+    if set(state.vertex_list()) != set(vertices):
+        report["vertex_mismatch"] = True
+    else:
+        current_ap = set(state.ap)
+        report["missing_ap"] = sorted(ap - current_ap)
+        report["extra_ap"] = sorted(current_ap - ap)
+        expected = low_from_tree(graph, state.disc, state.parent)
+        mismatches = [v for v in state.vertex_list() if state.low[v] != expected[v]]
+        report["low_mismatches"] = len(mismatches)
+        report["low_sample"] = [[v, state.low[v], expected[v]] for v in mismatches[:LOW_SAMPLE]]
+    report["ok"] = not (report.get("vertex_mismatch") or report["missing_ap"] or report["extra_ap"]
+                        or report["low_mismatches"])
+    report["fresh"] = None if report["ok"] else (disc, low, parent, ap)
+    return report
+
+
+class ShadowVerifier:
+    """
+    Vérification de l'actualisation incrémentale en arrière-plan, sur un échantillon des
+    actualisations : au taux sample_rate et/ou toutes les every actualisations, une copie
+    du graphe et de l'état est vérifiée par un DFS complet dans un thread ou un processus
+    (check_snapshot), sans attendre le résultat.
+
+    Une divergence est enregistrée avec les modifications d'arêtes appliquées depuis la
+    vérification précédente (déclencheurs possibles), ajoutée au journal log_file (une ligne
+    JSON par divergence) puis transmise à repair, qui reçoit la version vérifiée et l'état du
+    DFS complet. Une seule vérification est en cours à la fois : un échantillon tiré pendant
+    qu'une vérification tourne est compté comme ignoré, et ses modifications restent
+    rattachées à la vérification suivante.
+    """
+
+    def __init__(self, sample_rate=0.0, every=0, mode="thread", log_file=None, repair=None, seed=None):
+        """
+        :param sample_rate: Probabilité de vérifier une actualisation (0 : jamais au hasard).
+        :param every: Vérifie toutes les every actualisations (0 : désactivé).
+        :param mode: "thread" ou "process" (DFS complet hors du GIL).
+        :param log_file: Journal JSON des divergences (une ligne par divergence), ou None.
+        :param repair: Fonction repair(version, fresh) appelée après une divergence.
+        :param seed: Graine du tirage des actualisations vérifiées.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Mode de vérification inconnu : {mode}")
+        self.sample_rate = sample_rate
+        self.every = every
+        self.mode = mode
+        self.log_file = log_file
+        self.repair = repair
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._executor = None
+        self._futures = set()
+        self._changes = deque(maxlen=CHANGES_LIMIT)
+        self._truncated = False
+        self.updates = 0
+        self.checks = 0
+        self.skipped = 0
+        self.errors = 0
+        self.divergences = []
+
+    def observe(self, graph, state, added=(), removed=(), version=None):
+        """
+        À appeler après chaque actualisation incrémentale, sur le chemin rapide : seule la
+        copie du graphe et de l'état est faite lorsque l'actualisation est tirée.
+
+        :param graph: Graphe actualisé.
+        :param state: DFSState actualisé.
+        :param added: Arêtes ajoutées par l'actualisation.
+        :param removed: Arêtes supprimées par l'actualisation.
+        :param version: Version de l'état (transmise à repair).
+        :return: True si une vérification a été lancée.
+        """
+        with self._lock:
+            self.updates += 1
+            self._truncated = self._truncated or len(self._changes) == CHANGES_LIMIT
+            self._changes.append({"update": self.updates, "added": sorted(added), "removed": sorted(removed)})
+            sampled = ((self.every and self.updates % self.every == 0)
+                       or (self.sample_rate and self._rng.random() < self.sample_rate))
+            if not sampled:
+                return False
+            if self._futures:
+                self.skipped += 1
+                return False
+            changes = {"changes": list(self._changes), "changes_truncated": self._truncated}
+            self._changes.clear()
+            self._truncated = False
+            if self._executor is None:
+                self._executor = (ThreadPoolExecutor if self.mode == "thread" else ProcessPoolExecutor)(max_workers=1)
+            future = self._executor.submit(check_snapshot, take_snapshot(graph, state))
+            self._futures.add(future)
+        future.add_done_callback(lambda f: self._done(f, version, changes))
+        return True
+
+    def _done(self, future, version, changes):
+        try:
+            report = future.result()
+        except Exception as e:
+            print(f"Vérification impossible : {e}", file=sys.stderr)
+            with self._idle:
+                self.errors += 1
+                self._futures.discard(future)
+                self._idle.notify_all()
+            return
+        fresh = report.pop("fresh")
+        if not report["ok"]:
+            record = dict(report, time=time.time(), version=version, repaired=self.repair is not None, **changes)
+            if self.repair is not None:
+                try:
+                    self.repair(version, fresh)
+                except Exception as e:
+                    print(f"Réparation impossible : {e}", file=sys.stderr)
+                    record["repaired"] = False
+            if self.log_file:
+                try:
+                    with open(self.log_file, "a") as f:
+                        f.write(json.dumps(record, default=str) + "\n")
+                except OSError as e:
+                    print(f"Divergence non consignée dans {self.log_file} : {e}", file=sys.stderr)
+        with self._idle:
+            self.checks += 1
+            if not report["ok"]:
+                self.divergences.append(record)
+            self._futures.discard(future)
+            self._idle.notify_all()
+
+    def wait(self):
+        """
+        Attend la fin de la vérification en cours.
+        """
+        with self._idle:
+            self._idle.wait_for(lambda: not self._futures)
+
+    def close(self):
+        """
+        Attend la vérification en cours et arrête le thread ou le processus de vérification.
+        """
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def stats(self):
+        """
+        Compteurs : actualisations observées, vérifications terminées, échantillons ignorés,
+        erreurs et divergences.
+        """
+        with self._lock:
+            return {"updates": self.updates, "checks": self.checks, "skipped": self.skipped,
+                    "errors": self.errors, "divergences": len(self.divergences),
+                    "pending": len(self._futures)}
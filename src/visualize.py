@@ -1,69 +1,318 @@
-import sys
-import matplotlib.pyplot as plt 
-import networkx as nx
-from graph import Graph
-from dfs import find_articulation_points
-from matplotlib.patches import Patch
-
-
-def read_graph_from_file(filepath):
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-    first_line = lines[0].strip().split()
-    n, m = int(first_line[0]), int(first_line[1])
-    edges = [tuple(map(int, line.strip().split())) for line in lines[1:]]
-    return n, edges
-
-def draw_graph(filepath, articulation_points=None, highlighted_nodes=None):
-    # Lecture et création du graphe personnalisé
-    n, edges = read_graph_from_file(filepath)
-    custom_graph = Graph()
-    for i in range(n):
-        custom_graph.add_vertex(i)
-    for u, v in edges:
-        custom_graph.add_edge(u, v)
-
-    # Si les points d'articulation ne sont pas fournis, on les calcule
-    if articulation_points is None:
-        articulation_points = find_articulation_points(custom_graph)
-
-    # Création d'un graphe NetworkX pour la visualisation
-    G_nx = nx.Graph()
-    G_nx.add_nodes_from(range(n))
-    G_nx.add_edges_from(edges)
-
-    # Positionnement automatique des nœuds
-    pos = nx.spring_layout(G_nx, seed=42)
-
-    # Définition des couleurs : jaune > rouge > bleu clair
-    node_colors = []
-    for node in G_nx.nodes():
-        if highlighted_nodes and node in highlighted_nodes:
-            node_colors.append('yellow')  # Sommets recalculés
-        elif node in articulation_points:
-            node_colors.append('red')  # Points d'articulation
+# src/visualize.py
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+from dfs import find_articulation_points, biconnected_dfs
+from loader import load_graph
+
+# NetworkX et Matplotlib ne sont importés qu'au moment du dessin : importer ce module (par
+# exemple depuis main.py ou un traitement par lots sans rendu) reste rapide.
+
+# spring_layout n'a besoin que de NumPy en dessous de 500 nœuds (SciPy au-delà)
+FULL_VIEW_LIMIT = 400        # Au-delà, la vue "auto" dessine une vue condensée
+MAX_DRAWN_NODES = 400        # Nombre maximal de nœuds d'une vue condensée
+LABEL_LIMIT = 200            # Au-delà, les étiquettes des nœuds ne sont pas dessinées
+INCREMENTAL_ITERATIONS = 15  # Itérations du placement repris depuis un cache périmé
+VIEWS = ("auto", "full", "block-cut", "neighborhood")
+
+COLORS = {"highlighted": "yellow", "articulation": "red", "block": "lightgreen", "other": "lightblue"}
+
+
+def graph_fingerprint(g):
+    """
+    Empreinte (BLAKE2b) de la structure d'un graphe NetworkX : nœuds et arêtes triés.
+    Deux graphes de même empreinte ont le même placement.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps(sorted(map(str, g.nodes()))).encode())
+    edges = sorted(tuple(sorted(map(str, edge))) for edge in g.edges())
+    h.update(json.dumps(edges).encode())
+    return h.hexdigest()
+
+
+def load_layout(cache_file):
+    """
+    Lit un cache de placement.
+
+    :return: Tuple (empreinte, positions) ; (None, {}) si le cache est absent ou illisible.
+    """
+    try:
+        with open(cache_file, "r") as f:
+            data = json.load(f)
+        return data["fingerprint"], {node: (x, y) for node, x, y in data["positions"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, {}
+
+
+def save_layout(cache_file, fingerprint, positions):
+    """
+    Écrit un cache de placement : l'empreinte du graphe et la position de chaque nœud.
+    """
+    with open(cache_file, "w") as f:
+        json.dump({"fingerprint": fingerprint,
+                   "positions": [[node, float(x), float(y)] for node, (x, y) in positions.items()]}, f)
+
+
+def compute_layout(g, cache_file=None, seed=42):
+    """
+    Calcule le placement des nœuds (spring_layout), en le reprenant d'un cache sur disque.
+
+    Si l'empreinte du graphe est celle du cache, le placement est réutilisé tel quel. Sinon,
+    les positions des nœuds déjà connus servent de point de départ et quelques itérations
+    suffisent : un graphe modifié de quelques arêtes garde sa disposition.
+
+    :param g: Graphe NetworkX à placer.
+    :param cache_file: Fichier de cache (aucun cache si None).
+    :return: Dictionnaire nœud -> (x, y).
+    """
+    import networkx as nx
+    fingerprint = graph_fingerprint(g)
+    cached_fingerprint, cached = load_layout(cache_file) if cache_file else (None, {})
+    if cached_fingerprint == fingerprint and all(v in cached for v in g):
+        return cached
+    initial = {v: cached[v] for v in g if v in cached}
+    if initial:
+        positions = nx.spring_layout(g, pos=initial, iterations=INCREMENTAL_ITERATIONS, seed=seed)
+    else:
+        positions = nx.spring_layout(g, seed=seed)
+    positions = {v: (float(x), float(y)) for v, (x, y) in positions.items()}
+    if cache_file:
+        save_layout(cache_file, fingerprint, positions)
+    return positions
+
+
+def default_layout_cache(graph_file, view):
+    """
+    Nom du cache de placement d'une vue (ex: data/example_graph.txt -> data/example_graph.full.layout.json).
+    """
+    return os.path.splitext(graph_file)[0] + f".{view}.layout.json"
+
+
+def _node_color(v, articulation_points, highlighted_nodes):
+    if v in highlighted_nodes:
+        return COLORS["highlighted"]
+    if v in articulation_points:
+        return COLORS["articulation"]
+    return COLORS["other"]
+
+
+def full_view(graph, articulation_points, highlighted_nodes):
+    """
+    Vue complète : tous les sommets et toutes les arêtes.
+
+    :return: Tuple (graphe NetworkX, couleurs par nœud, tailles par nœud).
+    """
+    import networkx as nx
+    g = nx.Graph()
+    g.add_nodes_from(graph.vertices())
+    g.add_edges_from(graph.edges())
+    colors = {v: _node_color(v, articulation_points, highlighted_nodes) for v in g}
+    return g, colors, dict.fromkeys(g, 200)
+
+
+def _best_first(adj, weight, start, max_nodes):
+    # Sélection de max_nodes nœuds connexes autour de start, les plus lourds d'abord
+    selected = {start}
+    heap = [(-weight[w], str(w), w) for w in adj[start]]
+    heapq.heapify(heap)
+    while heap and len(selected) < max_nodes:
+        _, _, node = heapq.heappop(heap)
+        if node in selected:
+            continue
+        selected.add(node)
+        for w in adj[node]:
+            if w not in selected:
+                heapq.heappush(heap, (-weight[w], str(w), w))
+    return selected
+
+
+def block_cut_view(graph, articulation_points, highlighted_nodes, edge_component=None,
+                   max_nodes=MAX_DRAWN_NODES):
+    """
+    Vue condensée en arbre blocs-points de coupure : un nœud "B<i>" par composante biconnexe
+    (taille proportionnelle à son nombre de sommets), relié aux points d'articulation qu'elle
+    contient. Un bloc contenant un sommet recalculé est mis en évidence.
+
+    Au-delà de max_nodes nœuds, les blocs feuilles (un seul point d'articulation) sont repliés
+    dans leur point d'articulation, puis seuls les max_nodes nœuds les plus lourds autour du
+    plus gros bloc sont gardés.
+
+    :param edge_component: Composantes biconnexes déjà calculées (biconnected_dfs ou
+                           dfs.edge_components_from_state), sinon calculées ici.
+    """
+    import networkx as nx
+    if edge_component is None:
+        edge_component = biconnected_dfs(graph)[5]
+    members = {}
+    for edge, block in edge_component.items():
+        members.setdefault(f"B{block}", set()).update(edge)
+    adj = {block: vertices & articulation_points for block, vertices in members.items()}
+    weight = {block: len(vertices) for block, vertices in members.items()}
+    for block, cuts in list(adj.items()):
+        for a in cuts:
+            adj.setdefault(a, set()).add(block)
+            weight[a] = 1
+
+    if len(adj) > max_nodes:
+        for block, vertices in members.items():
+            cuts = adj[block]
+            if len(cuts) == 1 and not vertices & highlighted_nodes:
+                a = next(iter(cuts))
+                weight[a] += len(vertices) - 1
+                adj[a].discard(block)
+                del adj[block]
+    if len(adj) > max_nodes:
+        start = max(adj, key=lambda node: (weight[node], str(node)))
+        kept = _best_first(adj, weight, start, max_nodes)
+    else:
+        kept = set(adj)
+
+    g = nx.Graph()
+    colors, sizes = {}, {}
+    for node in kept:
+        g.add_node(node)
+        if node in members:
+            colors[node] = COLORS["highlighted"] if members[node] & highlighted_nodes else COLORS["block"]
+            sizes[node] = 100 + 20 * min(weight[node], 50)
         else:
-            node_colors.append('lightblue')  # Autres sommets
+            colors[node] = _node_color(node, articulation_points, highlighted_nodes)
+            sizes[node] = 200 + 5 * min(weight[node] - 1, 100)
+        g.add_edges_from((node, w) for w in adj[node] if w in kept)
+    return g, colors, sizes
+
+
+def neighborhood_view(graph, articulation_points, highlighted_nodes, hops=1, max_nodes=MAX_DRAWN_NODES):
+    """
+    Vue condensée autour des sommets recalculés (ou, à défaut, des points d'articulation) :
+    le sous-graphe induit par les sommets à au plus 'hops' arêtes d'eux, limité à max_nodes
+    sommets (les plus proches d'abord).
+    """
+    import networkx as nx
+    centers = sorted(highlighted_nodes or articulation_points)[:max_nodes]
+    selected = set(centers)
+    frontier = centers
+    for _ in range(hops):
+        next_frontier = []
+        for u in frontier:
+            for w in graph.neighbors(u):
+                if w not in selected and len(selected) < max_nodes:
+                    selected.add(w)
+                    next_frontier.append(w)
+        frontier = next_frontier
+    g = nx.Graph()
+    g.add_nodes_from(selected)
+    g.add_edges_from((u, w) for u in selected for w in graph.neighbors(u) if w in selected and u < w)
+    colors = {v: _node_color(v, articulation_points, highlighted_nodes) for v in g}
+    return g, colors, dict.fromkeys(g, 200)
+
 
-    # Dessin du graphe
-    nx.draw(G_nx, pos, with_labels=True, node_color=node_colors, edge_color='gray', node_size=200, font_size=10)
+def choose_view(view, graph, highlighted_nodes):
+    """
+    Résout la vue "auto" : complète pour un petit graphe, sinon voisinage des sommets
+    recalculés s'il y en a, sinon arbre blocs-points de coupure.
+    """
+    if view != "auto":
+        return view
+    if len(graph.vertices()) <= FULL_VIEW_LIMIT:
+        return "full"
+    return "neighborhood" if highlighted_nodes else "block-cut"
+
+
+def render_graph(graph, articulation_points, highlighted_nodes=None, output=None, view="auto", hops=1,
+                 layout_cache=None, edge_component=None):
+    """
+    Dessine un graphe déjà chargé avec ses points d'articulation déjà calculés.
+
+    Avec output, le rendu est fait sans affichage (backend Agg) dans un fichier image
+    (.png, .svg, .pdf) et la fonction rend la main aussitôt ; sinon la fenêtre matplotlib
+    est affichée.
+
+    :param graph: Instance de Graph ou de CSRGraph.
+    :param articulation_points: Ensemble des points d'articulation.
+    :param highlighted_nodes: Sommets recalculés, mis en évidence.
+    :param output: Fichier image à écrire (affichage interactif si None).
+    :param view: "auto", "full", "block-cut" ou "neighborhood".
+    :param hops: Rayon du voisinage pour la vue "neighborhood".
+    :param layout_cache: Fichier de cache du placement (aucun cache si None).
+    :param edge_component: Composantes biconnexes déjà calculées, pour la vue "block-cut".
+    :return: Nom de la vue dessinée.
+    """
+    import networkx as nx
+    articulation_points = set(articulation_points)
+    highlighted_nodes = set(highlighted_nodes or ())
+    view = choose_view(view, graph, highlighted_nodes)
+    if view == "full":
+        g, colors, sizes = full_view(graph, articulation_points, highlighted_nodes)
+    elif view == "block-cut":
+        g, colors, sizes = block_cut_view(graph, articulation_points, highlighted_nodes, edge_component)
+    elif view == "neighborhood":
+        g, colors, sizes = neighborhood_view(graph, articulation_points, highlighted_nodes, hops)
+    else:
+        raise ValueError(f"Vue inconnue : {view} (attendu : {', '.join(VIEWS)})")
+    positions = compute_layout(g, layout_cache)
+
+    # Import tardif : matplotlib n'est chargé que pour dessiner, avec le backend sans affichage si besoin
+    import matplotlib
+    if output:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Patch
+
+    fig, ax = plt.subplots(figsize=(12, 9) if len(g) > LABEL_LIMIT else (8, 6))
+    nodes = list(g)
+    nx.draw(g, positions, ax=ax, nodelist=nodes, with_labels=len(g) <= LABEL_LIMIT,
+            node_color=[colors[v] for v in nodes], node_size=[sizes[v] for v in nodes],
+            edge_color='gray', font_size=10)
 
     # Légende
     legend_elements = [
-        Patch(facecolor='yellow', edgecolor='black', label='Sommets recalculés'),
-        Patch(facecolor='red', edgecolor='black', label='Point d\'articulation'),
-        Patch(facecolor='lightblue', edgecolor='black', label='Autre sommet')
+        Patch(facecolor=COLORS["highlighted"], edgecolor='black', label='Sommets recalculés'),
+        Patch(facecolor=COLORS["articulation"], edgecolor='black', label='Point d\'articulation'),
+        Patch(facecolor=COLORS["block"] if view == "block-cut" else COLORS["other"], edgecolor='black',
+              label='Composante biconnexe' if view == "block-cut" else 'Autre sommet'),
     ]
-    plt.legend(handles=legend_elements, loc='upper left')
+    ax.legend(handles=legend_elements, loc='upper left')
+    ax.set_title(f"Graphe mis à jour avec coloration (vue {view}, {len(g)} nœuds)")
+    fig.tight_layout()
+    if output:
+        fig.savefig(output)
+        plt.close(fig)
+    else:
+        plt.show()
+    return view
+
+
+def draw_graph(filepath, articulation_points=None, highlighted_nodes=None, **options):
+    """
+    Lit le graphe d'un fichier d'arêtes et le dessine (voir render_graph pour les options).
+    Les points d'articulation sont calculés s'ils ne sont pas fournis.
+    """
+    graph = load_graph(filepath)
+    if articulation_points is None:
+        articulation_points = find_articulation_points(graph)
+    return render_graph(graph, articulation_points, highlighted_nodes, **options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Visualisation du graphe et de ses points d'articulation.")
+    parser.add_argument("graph_file", help="Fichier d'arêtes à dessiner")
+    parser.add_argument("--output", metavar="IMAGE",
+                        help="Écrit le dessin dans un fichier (.png, .svg, .pdf) sans ouvrir de fenêtre")
+    parser.add_argument("--view", choices=VIEWS, default="auto",
+                        help="Vue complète ou condensée (arbre blocs-points de coupure, voisinage)")
+    parser.add_argument("--hops", type=int, default=1, help="Rayon du voisinage pour --view neighborhood")
+    parser.add_argument("--no-layout-cache", action="store_true", help="Ne lit ni n'écrit le cache de placement")
+    args = parser.parse_args()
 
-    plt.title("Graphe mis à jour avec coloration")
-    plt.tight_layout()
-    plt.show()
+    graph = load_graph(args.graph_file)
+    view = choose_view(args.view, graph, set())
+    cache = None if args.no_layout_cache else default_layout_cache(args.graph_file, view)
+    render_graph(graph, find_articulation_points(graph), output=args.output, view=view, hops=args.hops,
+                 layout_cache=cache)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python src/visualize.py <graph_file>")
-        sys.exit(1)
-    graph_file = sys.argv[1]
-    draw_graph(graph_file)
+    main()
@@ -0,0 +1,8 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# Les modules de src/ s'importent entre eux par leur nom court (ex: "from graph import Graph"),
+# comme lorsqu'ils sont lancés via "python src/main.py". On rend donc src/ importable.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,48 @@
+# tests/test_batch.py
+
+import csv
+import json
+import pytest
+from src.batch import collect_files, run_batch, write_report
+
+CHAIN = "4 3\n0 1\n1 2\n2 3\n"
+TRIANGLE = "3 3\n0 1\n1 2\n2 0\n"
+
+@pytest.fixture
+def region_dir(tmp_path):
+    (tmp_path / "nord.txt").write_text(CHAIN)
+    (tmp_path / "sud.txt").write_text(TRIANGLE)
+    (tmp_path / "notes.md").write_text("pas un graphe")
+    return tmp_path
+
+def test_collect_files(region_dir):
+    expected = [str(region_dir / "nord.txt"), str(region_dir / "sud.txt")]
+    assert collect_files([str(region_dir)]) == expected
+    assert collect_files([str(region_dir / "*.txt"), str(region_dir / "sud.txt")]) == expected
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch(region_dir, workers):
+    (region_dir / "faux.txt").write_text("3 1\n0 7\n")
+    results = run_batch(collect_files([str(region_dir)]), workers)
+    by_name = {r["file"].rsplit("/", 1)[-1]: r for r in results}
+    assert by_name["faux.txt"]["status"] == "error"
+    assert by_name["nord.txt"]["articulation_points"] == [1, 2]
+    assert by_name["nord.txt"]["vertices"] == 4 and by_name["nord.txt"]["edges"] == 3
+    assert by_name["sud.txt"]["articulation_points"] == []
+    # Second passage : états sauvegardés, fichiers inchangés
+    again = run_batch([str(region_dir / "nord.txt")], workers)
+    assert again[0]["status"] == "unchanged"
+    assert again[0]["articulation_points"] == [1, 2]
+
+def test_write_report_json_and_csv(region_dir):
+    results = run_batch(collect_files([str(region_dir)]))
+    json_path, csv_path = str(region_dir / "rapport.json"), str(region_dir / "rapport.csv")
+    write_report(results, json_path, 0.5, 1)
+    write_report(results, csv_path, 0.5, 1)
+    with open(json_path) as f:
+        report = json.load(f)
+    assert report["summary"]["files"] == 2 and report["summary"]["errors"] == 0
+    assert "dfs" in report["files"][0]["phases"]
+    with open(csv_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["articulation_points"] for row in rows] == ["1 2", ""]
@@ -0,0 +1,32 @@
+# tests/test_benchmarks.py
+
+import argparse
+import pytest
+from src.graph import CSRGraph
+from src.dfs import find_articulation_points
+from benchmarks.generators import GENERATORS, generate
+from benchmarks.run_benchmarks import benchmark_case
+
+@pytest.mark.parametrize("kind", sorted(GENERATORS))
+def test_generators_produce_valid_edge_arrays(kind):
+    n, src, dst = generate(kind, 2000, seed=1)
+    assert len(src) == len(dst)
+    assert 0.8 * 2000 <= len(src) <= 2000
+    assert min(min(src), min(dst)) >= 0 and max(max(src), max(dst)) < n
+
+def test_generators_are_reproducible():
+    first, second = generate("caida", 500, seed=3), generate("caida", 500, seed=3)
+    assert list(first[1]) == list(second[1]) and list(first[2]) == list(second[2])
+
+def test_generated_topologies_articulation_points():
+    n, src, dst = generate("grid", 200)
+    assert find_articulation_points(CSRGraph.from_edge_arrays(n, src, dst)) == set()
+    n, src, dst = generate("path", 100)
+    assert find_articulation_points(CSRGraph.from_edge_arrays(n, src, dst)) == set(range(1, n - 1))
+
+def test_batch_update_is_compared_with_edge_by_edge(tmp_path):
+    args = argparse.Namespace(seed=0, repeat=1, check_limit=1e6, incremental_limit=1e6, changes=5)
+    result = benchmark_case("ba", 500, args, str(tmp_path))
+    assert result["check"] and result["batch_check"]
+    assert set(result["batch_speedup"]) == {"add", "remove"}
+    assert {"incremental_add_each", "incremental_remove_each"} <= set(result["phases"])
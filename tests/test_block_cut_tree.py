@@ -0,0 +1,31 @@
+# tests/test_block_cut_tree.py
+
+from src.graph import Graph, CSRGraph
+from src.block_cut_tree import BlockCutTree
+
+def build_chain_of_cycles():
+    """
+    Construit une chaîne de triangles 0-1-2, 2-3-4, 4-5-6 (points d'articulation 2 et 4),
+    la feuille 7 sur 6 et le sommet isolé 8.
+    """
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 2), (4, 5), (5, 6), (6, 4), (6, 7)]:
+        g.add_edge(u, v)
+    g.add_vertex(8)
+    return g
+
+def test_separators():
+    tree = BlockCutTree.from_graph(build_chain_of_cycles())
+    assert tree.num_blocks == 4
+    assert tree.separators(0, 7) == [2, 4, 6]
+    assert tree.separators(3, 5) == [4]
+    assert tree.separators(0, 1) == []
+    assert tree.separators(2, 5) == [4]
+    assert tree.separators(0, 8) is None
+
+def test_separates():
+    tree = BlockCutTree.from_graph(CSRGraph.from_graph(build_chain_of_cycles()))
+    assert tree.separates(4, 0, 7)
+    assert not tree.separates(4, 0, 3)
+    assert not tree.separates(2, 2, 5)
+    assert not tree.separates(1, 0, 7)
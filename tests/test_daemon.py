@@ -0,0 +1,102 @@
+# tests/test_daemon.py
+
+import io
+import os
+import socket
+import threading
+import time
+from src.dfs import find_articulation_points
+from src.daemon import GraphDaemon
+
+def write_graph(path, n, edges):
+    with open(path, "w") as f:
+        f.write(f"{n} {len(edges)}\n")
+        for u, v in edges:
+            f.write(f"{u} {v}\n")
+
+PATH_EDGES = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)]
+
+def test_changes_are_applied_in_memory(tmp_path):
+    path = str(tmp_path / "g.txt")
+    write_graph(path, 6, PATH_EDGES)
+    daemon = GraphDaemon(path)
+    assert daemon.articulation_points() == [1, 2, 3, 4]
+    daemon.apply_changes(added=[(0, 3)])
+    assert set(daemon.articulation_points()) == find_articulation_points(daemon.graph) == {3, 4}
+    daemon.apply_changes(added=[(5, 6)], removed=[(0, 3)])
+    assert set(daemon.articulation_points()) == find_articulation_points(daemon.graph) == {1, 2, 3, 4, 5}
+    assert daemon.apply_changes(added=[(5, 6)]) == []
+
+def test_checkpoint_is_reloaded(tmp_path):
+    path = str(tmp_path / "g.txt")
+    write_graph(path, 6, PATH_EDGES)
+    daemon = GraphDaemon(path)
+    assert daemon.checkpoint()
+    assert not daemon.checkpoint()
+    daemon.apply_changes(added=[(0, 5)])
+    daemon.stop()
+    write_graph(path, 6, PATH_EDGES + [(0, 5)])
+    restarted = GraphDaemon(path)
+    assert restarted.version == 0
+    assert restarted.articulation_points() == []
+
+def test_reload_watched_file(tmp_path):
+    path = str(tmp_path / "g.txt")
+    write_graph(path, 6, PATH_EDGES)
+    daemon = GraphDaemon(path)
+    assert daemon.reload_file() is None
+    write_graph(path, 6, PATH_EDGES[:-1] + [(2, 5), (1, 4)])
+    os.utime(path, ns=(0, 1))
+    daemon.reload_file()
+    assert set(daemon.articulation_points()) == find_articulation_points(daemon.graph) == {1, 2}
+
+def test_text_protocol(tmp_path):
+    path = str(tmp_path / "g.txt")
+    write_graph(path, 6, PATH_EDGES)
+    daemon = GraphDaemon(path)
+    out = io.StringIO()
+    daemon.serve_stream(io.StringIO("ap 2\n+ 1 3\nap 2\nbridges\nfoo\nquit\nap\n"), out)
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "1" and lines[1].startswith("ok ") and lines[2] == "0"
+    assert lines[3:] == ["[[0, 1], [3, 4], [4, 5]]", "erreur commande inconnue : foo"]
+
+def test_socket_server(tmp_path):
+    path = str(tmp_path / "g.txt")
+    write_graph(path, 6, PATH_EDGES)
+    daemon = GraphDaemon(path)
+    with daemon.make_server() as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        with socket.create_connection(server.server_address) as conn:
+            conn.sendall(b"- 2 3\nap 2\nquit\n")
+            reply = conn.makefile().read()
+        server.shutdown()
+    lines = reply.splitlines()
+    assert lines[0].startswith("ok ") and lines[1:] == ["0"]
+
+def test_invalid_vertices_are_rejected(tmp_path):
+    path = str(tmp_path / "g.txt")
+    write_graph(path, 6, PATH_EDGES)
+    daemon = GraphDaemon(path)
+    version = daemon.version
+    assert daemon.handle_command("+ -1 5").startswith("erreur sommet négatif")
+    assert daemon.handle_command(f"+ 0 {2 ** 63}").startswith("erreur sommet hors")
+    assert daemon.version == version and -1 not in daemon.disc
+    json_daemon = GraphDaemon(path, state_file=str(tmp_path / "g.json"))
+    assert json_daemon.handle_command("+ -1 5").startswith("ok ")
+    assert json_daemon.checkpoint()
+
+def test_checkpoint_thread_survives_errors(tmp_path, capsys):
+    path = str(tmp_path / "g.txt")
+    write_graph(path, 6, PATH_EDGES)
+    state_dir = tmp_path / "state"
+    daemon = GraphDaemon(path, state_file=str(state_dir / "g.state"))
+    daemon.apply_changes(added=[(0, 5)])
+    daemon.start(checkpoint_interval=0.01)
+    time.sleep(0.1)
+    assert daemon.saved_version == 0 and "Erreur de la tâche d'arrière-plan checkpoint" in capsys.readouterr().err
+    state_dir.mkdir()
+    deadline = time.monotonic() + 5
+    while daemon.saved_version != daemon.version and time.monotonic() < deadline:
+        time.sleep(0.01)
+    daemon.stop()
+    assert os.path.exists(state_dir / "g.state")
@@ -1,8 +1,12 @@
 # tests/test_dfs.py
 
+import random
 import pytest
 from src.graph import Graph
-from src.dfs import find_articulation_points
+from src.dfs import articulation_dfs, find_articulation_points, biconnected_dfs, find_bridges, find_biconnected_components, bridges_from_state
+from src.dfs import count_children, classify_state_arrays, _classify_state_lists
+from src.dfs import edge_components_from_state, group_components, is_dfs_state
+from src.updater import incremental_update_batch
 
 def build_star_graph():
     """
@@ -64,3 +68,93 @@ def test_find_articulation_points_custom():
     articulation_points = find_articulation_points(g)
     # Pour le graphe personnalisé, les points d'articulation attendus sont 2 et 3.
     assert articulation_points == {1, 2, 3}
+
+def test_find_articulation_points_long_path():
+    # Un chemin bien plus long que la limite de récursion de Python ne doit pas lever RecursionError.
+    g = Graph()
+    n = 20000
+    for i in range(n - 1):
+        g.add_edge(i, i + 1)
+    articulation_points = find_articulation_points(g)
+    assert articulation_points == set(range(1, n - 1))
+
+def test_articulation_dfs_single_pass_state():
+    g = build_custom_graph()
+    disc, low, parent, ap = articulation_dfs(g)
+    assert set(disc) == set(low) == set(parent) == set(g.vertices())
+    assert sum(1 for p in parent.values() if p is None) == 1
+    assert ap == {1, 2, 3}
+
+def build_two_cycles_graph():
+    """
+    Construit deux triangles (0-1-2 et 3-4-5) reliés par le pont 2-3, plus la feuille 6 sur 5.
+    """
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 3), (5, 6)]:
+        g.add_edge(u, v)
+    return g
+
+def test_biconnected_dfs_single_pass():
+    g = build_two_cycles_graph()
+    disc, low, parent, ap, bridges, edge_component = biconnected_dfs(g)
+    assert ap == {2, 3, 5}
+    assert bridges == [(2, 3), (5, 6)]
+    assert set(edge_component) == set(g.edges())
+    assert bridges_from_state(disc, low, parent) == bridges
+
+def partition(edge_component):
+    # Composantes biconnexes indépendamment de leur numérotation
+    return sorted(group_components(edge_component))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_edge_components_from_state(seed):
+    rng = random.Random(seed)
+    g = Graph()
+    for _ in range(60):
+        u, v = rng.sample(range(30), 2)
+        g.add_edge(u, v)
+    disc, low, parent, ap = articulation_dfs(g)
+    assert partition(edge_components_from_state(g, disc, low, parent)) == partition(biconnected_dfs(g)[5])
+    # État actualisé incrémentalement : arbre DFS différent de celui d'un nouveau parcours
+    children = count_children(parent)
+    added = {tuple(sorted(rng.sample(sorted(g.vertices()), 2))) for _ in range(10)} - set(g.edges())
+    removed = set(rng.sample(g.edges(), 10)) - added
+    for u, v in added:
+        g.add_edge(u, v)
+    for u, v in removed:
+        g.remove_edge(u, v)
+    incremental_update_batch(g, added, removed, disc, low, parent, ap, children)
+    assert partition(edge_components_from_state(g, disc, low, parent)) == partition(biconnected_dfs(g)[5])
+
+def test_is_dfs_state():
+    g = build_two_cycles_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    assert is_dfs_state(g, disc, low, parent)
+    assert not is_dfs_state(g, disc, {**low, 6: 0}, parent)
+    # Arbre 0-1, 0-2 : l'arête 1-2 serait transverse
+    triangle = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 0)]:
+        triangle.add_edge(u, v)
+    assert not is_dfs_state(triangle, {0: 0, 1: 1, 2: 2}, {0: 0, 1: 0, 2: 0}, {0: None, 1: 0, 2: 0})
+
+def test_find_biconnected_components():
+    components = find_biconnected_components(build_two_cycles_graph())
+    assert sorted(components) == [[(0, 1), (0, 2), (1, 2)], [(2, 3)], [(3, 4), (3, 5), (4, 5)], [(5, 6)]]
+
+def test_find_bridges_cycle_and_path():
+    assert find_bridges(build_cycle_graph()) == []
+    assert find_bridges(build_custom_graph()) == [(0, 1), (1, 2), (2, 3), (3, 4), (3, 5)]
+
+@pytest.mark.parametrize("classify", [classify_state_arrays, _classify_state_lists])
+def test_classify_state_arrays_matches_dfs(classify):
+    g = build_custom_graph()
+    for u, v in [(2, 10), (10, 11), (11, 10)]:
+        g.add_edge(u, v)
+    disc, low, parent, ap = articulation_dfs(g)
+    vertices = sorted(disc)
+    position = {v: i for i, v in enumerate(vertices)}
+    ap_mask, bridges, children = classify([disc[v] for v in vertices], [low[v] for v in vertices],
+                                          [-1 if parent[v] is None else position[parent[v]] for v in vertices])
+    assert {v for v, flag in zip(vertices, ap_mask) if flag} == ap
+    assert sorted(tuple(sorted((vertices[p], vertices[c]))) for p, c in bridges) == bridges_from_state(disc, low, parent)
+    assert dict(zip(vertices, (int(c) for c in children))) == count_children(parent)
@@ -0,0 +1,68 @@
+# tests/test_dfs_state.py
+
+import json
+import pytest
+from src.graph import Graph
+from src.dfs import articulation_dfs, count_children, subtree_sizes
+from src.lca import AncestorIndex
+from src.dfs_state import DFSState, NO_PARENT
+from src.state_manager import save_graph_state, load_graph_state, get_dfs_state, get_articulation_state
+
+def build_graph(vertices=range(6)):
+    # Triangle 0-1-2, chaîne 2-3-4, arête isolée 5-6 (étiquettes prises dans 'vertices')
+    v = list(vertices) + [max(vertices) + 1]
+    g = Graph()
+    for a, b in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (5, 6)]:
+        g.add_edge(v[a], v[b])
+    return g
+
+def build_state(g):
+    disc, low, parent, ap = articulation_dfs(g)
+    index = AncestorIndex.build(parent)
+    state = DFSState.from_dicts(g.vertices(), disc, low, parent, ap, count_children(parent),
+                                index.depth, index.jump)
+    return state, (disc, low, parent, ap)
+
+@pytest.mark.parametrize("vertices", [range(6), [3, 10, 11, 40, 41, 90]])
+def test_views_match_dicts(vertices):
+    g = build_graph(vertices)
+    state, (disc, low, parent, ap) = build_state(g)
+    assert (state.positions is None) == (vertices == range(6))
+    assert state.disc == disc and state.low == low and state.parent == parent
+    assert state.ap == ap and sorted(state.ap) == sorted(ap)
+    assert state.columns["parent"].count(NO_PARENT) == 2
+    sizes = subtree_sizes(disc, parent)
+    assert dict(zip(state.vertex_list(), state.subtree_sizes())) == sizes
+
+def test_views_write_through_and_grow():
+    state, _ = build_state(build_graph())
+    state.low[4] = 0
+    assert state.columns["low"][4] == 0
+    state.parent[8] = None  # Sommet nouveau et non contigu : dictionnaire des positions
+    assert 8 in state.disc and 7 not in state.disc and state.positions[8] == 7
+    assert state.parent[8] is None and state.disc[8] == 0
+    state.ap.discard(2)
+    state.ap.add(8)
+    assert 8 in state.ap and 2 not in state.ap
+    copy = state.copy()
+    copy.disc[0] = 99
+    assert state.disc[0] != 99
+    with pytest.raises(TypeError):
+        del state.disc[0]
+    with pytest.raises(KeyError):
+        state.disc[100]
+
+@pytest.mark.parametrize("filename", ["state.state", "state.json"])
+def test_loaded_state_is_array_backed(tmp_path, filename):
+    g = build_graph()
+    disc, low, parent, ap = articulation_dfs(g)
+    path = str(tmp_path / filename)
+    save_graph_state(g, disc, low, parent, path, ap)
+    state = load_graph_state(path)
+    dfs_state = state["dfs_state"]["state"]
+    assert dfs_state.nbytes() == 49 * len(dfs_state) == 49 * 7
+    assert get_dfs_state(state) == (disc, low, parent)
+    assert get_articulation_state(state)[0] == ap
+    if filename.endswith(".json"):
+        with open(path) as f:
+            assert isinstance(json.load(f)["dfs_state"]["disc"], list)
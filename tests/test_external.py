@@ -0,0 +1,57 @@
+# tests/test_external.py
+
+import os
+import pytest
+from src.graph import CSRGraph
+from src.dfs import articulation_dfs, bridges_from_state
+from src.loader import write_binary_edges, iter_edge_chunks
+from src.external import convert_to_adjacency, external_articulation_points, articulation_points_out_of_core, adjacency_is_current
+from benchmarks.generators import generate
+
+def write_text(path, n, src, dst):
+    with open(path, "w") as f:
+        f.write(f"{n} {len(src)}\n")
+        f.writelines(f"{u} {v}\n" for u, v in zip(src, dst))
+    return str(path)
+
+@pytest.mark.parametrize("kind", ["caida", "tree", "grid"])
+def test_same_result_as_in_memory(tmp_path, kind):
+    n, src, dst = generate(kind, 3000, seed=5)
+    disc, low, parent, ap = articulation_dfs(CSRGraph.from_edge_arrays(n, src, dst))
+    text_path = write_text(tmp_path / "g.txt", n, src.tolist(), dst.tolist())
+    binary_path = str(tmp_path / "g.bin")
+    write_binary_edges(binary_path, n, src, dst)
+    for graph_file in (text_path, binary_path):
+        adjacency = convert_to_adjacency(graph_file, str(tmp_path / "g.adj"), chunk_size=512)
+        found, bridges, io = external_articulation_points(adjacency)
+        assert found == ap
+        assert bridges == bridges_from_state(disc, low, parent)
+        assert io["file_bytes"] == os.path.getsize(adjacency) and io["bytes_read"] > 0
+
+def test_loops_and_duplicates_are_harmless(tmp_path):
+    # Chemin 0-1-2-3 avec arête doublée 1-2, boucle sur 3 et sommet isolé 4
+    path = write_text(tmp_path / "g.txt", 5, [0, 1, 2, 2, 3], [1, 2, 1, 3, 3])
+    ap, bridges, _ = articulation_points_out_of_core(path)
+    assert ap == {1, 2}
+    assert bridges == [(0, 1), (1, 2), (2, 3)]
+
+def test_conversion_is_reused_until_the_source_changes(tmp_path):
+    path = write_text(tmp_path / "g.txt", 3, [0, 1], [1, 2])
+    assert articulation_points_out_of_core(path)[2]["converted"]
+    assert adjacency_is_current(str(tmp_path / "g.adj"), path)
+    assert not articulation_points_out_of_core(path)[2]["converted"]
+    write_text(tmp_path / "g.txt", 3, [0, 1, 2], [1, 2, 0])
+    os.utime(path, ns=(0, 0))
+    ap, _, io = articulation_points_out_of_core(path)
+    assert io["converted"] and ap == set()
+
+def test_iter_edge_chunks_validates_header(tmp_path):
+    path = write_text(tmp_path / "g.txt", 3, [0, 1], [1, 2])
+    assert sum(len(src) for src, _ in iter_edge_chunks(path, chunk_size=4)) == 2
+    bad = write_text(tmp_path / "bad.txt", 3, [0, 1], [1, 5])
+    with pytest.raises(ValueError):
+        list(iter_edge_chunks(bad))
+    with open(path, "a") as f:
+        f.write("0 2\n")
+    with pytest.raises(ValueError):
+        list(iter_edge_chunks(path))
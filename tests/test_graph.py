@@ -1,7 +1,8 @@
 # tests/test_graph.py
 
 import pytest
-from src.graph import Graph
+from src.graph import CSRGraph, Graph
+from src.dfs import find_articulation_points
 
 def test_add_vertex():
     g = Graph()
@@ -39,3 +40,38 @@ def test_str_representation():
     s = str(g)
     # Vérifie que la représentation en chaîne de caractères contient les informations attendues
     assert "1:" in s and ("2" in s or "3" in s)
+
+def test_csr_graph_from_graph():
+    g = Graph()
+    g.add_edge(0, 1)
+    g.add_edge(0, 2)
+    g.add_edge(2, 3)
+    csr = CSRGraph.from_graph(g)
+    assert list(csr.vertices()) == [0, 1, 2, 3]
+    assert list(csr.neighbors(0)) == [1, 2]
+    assert list(csr.neighbors(3)) == [2]
+    assert csr.num_edges == 3
+    assert csr.edges() == g.edges()
+
+def test_csr_graph_neighbors_zero_copy():
+    csr = CSRGraph.from_edges(3, [(0, 1), (1, 2), (1, 2), (2, 2)])
+    neighbors = csr.neighbors(1)
+    assert isinstance(neighbors, memoryview)
+    assert list(neighbors) == [0, 2]
+    # Les doublons et les boucles sont ignorés
+    assert csr.num_edges == 2
+
+def test_csr_graph_is_frozen():
+    csr = CSRGraph.from_edges(2, [(0, 1)])
+    with pytest.raises(AttributeError):
+        csr.indices = None
+    with pytest.raises(TypeError):
+        csr.neighbors(0)[0] = 1
+
+def test_csr_graph_from_edge_file(tmp_path):
+    path = tmp_path / "graph.txt"
+    path.write_text("4 3\n0 1\n1 2\n\n2 3\n")
+    csr = CSRGraph.from_edge_file(str(path))
+    assert csr.num_vertices == 4
+    assert csr.edges() == [(0, 1), (1, 2), (2, 3)]
+    assert find_articulation_points(csr) == {1, 2}
@@ -0,0 +1,83 @@
+# tests/test_history.py
+
+import pytest
+from src.graph import Graph
+from src.dfs import articulation_dfs, count_children
+from src.lca import AncestorIndex
+from src.dfs_state import DFSState
+from src.updater import incremental_update_batch, register_vertices
+from src.history import HistoryStore, run_command, CHECKPOINT, DELTA
+from src.daemon import GraphDaemon
+
+def path_state(n):
+    g = Graph()
+    for v in range(n - 1):
+        g.add_edge(v, v + 1)
+    disc, low, parent, ap = articulation_dfs(g)
+    index = AncestorIndex.build(parent)
+    return g, DFSState.from_dicts(g.vertices(), disc, low, parent, ap, count_children(parent),
+                                  index.depth, index.jump)
+
+def apply(g, state, added=(), removed=()):
+    index = AncestorIndex(state.parent, state.depth, state.jump)
+    register_vertices(g, [w for edge in added for w in edge], state.disc, state.low, state.parent,
+                      state.children, index)
+    for u, v in added:
+        g.add_edge(u, v)
+    for u, v in removed:
+        g.remove_edge(u, v)
+    incremental_update_batch(g, set(added), set(removed), state.disc, state.low, state.parent, state.ap,
+                             state.children, index)
+
+def test_versions_are_reconstructed_from_deltas(tmp_path):
+    g, state = path_state(8)
+    store = HistoryStore(str(tmp_path / "g.history"), checkpoint_interval=3)
+    expected = {store.commit(state, timestamp=10.0): (set(state.ap), state.columns["low"][:])}
+    assert store.commit(state) is None  # État inchangé : pas de nouvelle version
+    for step, change in enumerate([[(0, 3)], [(8, 9)], [(9, 10)], [(0, 7)]], 1):
+        apply(g, state, added=change)
+        expected[store.commit(state, timestamp=10.0 + step)] = (set(state.ap), state.columns["low"][:])
+    assert [r.kind for r in store.records()] == [CHECKPOINT, DELTA, DELTA, CHECKPOINT, DELTA]
+    reopened = HistoryStore(store.path)
+    for version in (5, 1, 3, 4, 2):
+        ap, low = expected[version]
+        assert reopened.articulation_points(version) == ap
+        assert reopened.state_at(version).columns["low"] == low
+    assert reopened.version_at(12.5) == 3 and reopened.version_at(5.0) is None
+    with pytest.raises(ValueError):
+        reopened.state_at(6)
+
+def test_ap_diff_and_timeline(tmp_path):
+    g, state = path_state(5)  # Chemin 0-1-2-3-4 : points d'articulation 1, 2, 3
+    store = HistoryStore(str(tmp_path / "g.history"))
+    store.commit(state)
+    apply(g, state, added=[(0, 2)])
+    store.commit(state)
+    apply(g, state, removed=[(0, 2)])
+    store.commit(state)
+    assert store.ap_diff(1, 2) == ([], [1])
+    assert store.ap_diff(2, 3) == ([1], [])
+    assert [(e["version"], e["ap"]) for e in store.ap_timeline(1)] == [(1, True), (2, False), (3, True)]
+    assert store.ap_timeline(4) == []
+    assert run_command(store, "diff", ["1", "2"]) == {"from": 1, "to": 2, "added": [], "removed": [1]}
+
+def test_torn_record_is_ignored_and_overwritten(tmp_path):
+    g, state = path_state(4)
+    store = HistoryStore(str(tmp_path / "g.history"))
+    store.commit(state)
+    with open(store.path, "ab") as f:
+        f.write(b"PXHR\x01partial")
+    apply(g, state, added=[(0, 3)])
+    reopened = HistoryStore(store.path)
+    assert reopened.latest() == 1
+    assert reopened.commit(state) == 2
+    assert HistoryStore(store.path).articulation_points(2) == set()
+
+def test_daemon_checkpoints_are_versioned(tmp_path):
+    path = tmp_path / "g.txt"
+    path.write_text("4 3\n0 1\n1 2\n2 3\n")
+    daemon = GraphDaemon(str(path), history_file=str(tmp_path / "g.history"))
+    daemon.checkpoint()
+    daemon.apply_changes(added=[(0, 3)])
+    daemon.checkpoint()
+    assert HistoryStore(str(tmp_path / "g.history")).ap_diff(1, 2) == ([], [1, 2])
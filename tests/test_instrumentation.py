@@ -0,0 +1,51 @@
+# tests/test_instrumentation.py
+
+import json
+from src.graph import Graph
+from src.dfs import articulation_dfs
+from src.updater import incremental_update_batch
+# Même nom de module que dans src/ (ajouté au chemin par conftest.py) : l'instance partagée
+# metrics est celle que consultent le moteur DFS et l'actualisation incrémentale.
+from instrumentation import Metrics, metrics
+
+def build_path(n):
+    g = Graph()
+    for i in range(n - 1):
+        g.add_edge(i, i + 1)
+    return g
+
+def test_disabled_metrics_record_nothing():
+    m = Metrics()
+    m.count("nodes_visited", 5)
+    with m.phase("dfs"):
+        pass
+    assert m.to_dict() == {"counters": {}, "phases": {}}
+
+def test_counters_and_phases(tmp_path):
+    metrics.configure(enabled=True)
+    metrics.reset()
+    try:
+        g = build_path(10)
+        with metrics.phase("dfs"):
+            disc, low, parent, ap = articulation_dfs(g)
+        assert metrics.counters == {"nodes_visited": 10, "edges_scanned": 18}
+        g.remove_edge(4, 5)
+        incremental_update_batch(g, [], [(4, 5)], disc, low, parent, ap)
+        assert metrics.counters["regions_recomputed"] == 1
+        assert metrics.counters["region_size"] >= 5
+        path = str(tmp_path / "metrics.json")
+        metrics.export_json(path)
+        with open(path) as f:
+            exported = json.load(f)
+        assert exported["counters"] == metrics.counters
+        assert exported["phases"]["dfs"] >= 0
+    finally:
+        metrics.configure(enabled=False)
+        metrics.reset()
+
+def test_verbose_traces_only_when_enabled(capsys):
+    m = Metrics()
+    m.trace("invisible")
+    m.configure(verbose=True)
+    m.trace("visible")
+    assert capsys.readouterr().out == "visible\n"
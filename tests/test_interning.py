@@ -0,0 +1,62 @@
+# tests/test_interning.py
+
+import pytest
+from src.interning import IdInterner
+from src.loader import read_labeled_edge_arrays, load_labeled_graph
+from src.dfs import articulation_dfs
+
+ASN_EDGES = "4200000000 13335\n13335 64512\n\n64512 4200000000\n64512 7\n"
+HOST_EDGES = "core-1 edge.paris\ncore-1 edge.lyon\nedge.lyon edge.nice\n"
+
+def test_from_values_sorted_codes():
+    interner, codes = IdInterner.from_values([4200000000, 7, 13335, 7])
+    assert interner.ids == [7, 13335, 4200000000]
+    assert list(codes) == [2, 0, 1, 0]
+
+@pytest.mark.parametrize("ids, numeric", [
+    (range(5), True),
+    ([7, 13335, 4200000000, -1], True),
+    (["core-1", "edge.lyon", "é"], False),
+])
+def test_save_load_round_trip(tmp_path, ids, numeric):
+    path = str(tmp_path / "graph.ids")
+    IdInterner(ids, numeric).save(path)
+    loaded = IdInterner.load(path)
+    assert loaded.ids == list(ids)
+    assert loaded.numeric == numeric
+
+def test_load_missing(tmp_path):
+    assert IdInterner.load(str(tmp_path / "absent.ids")) is None
+
+def test_intern_and_merge_keep_codes():
+    interner = IdInterner([10, 20])
+    assert interner.intern(20) == 1
+    assert interner.intern(5) == 2
+    assert interner.merge(IdInterner([5, 30])) == [2, 3]
+    assert interner.externals({0, 3}) == [10, 30]
+    with pytest.raises(ValueError):
+        interner.code(99)
+
+@pytest.mark.parametrize("content, numeric", [(ASN_EDGES, True), (HOST_EDGES, False)])
+def test_read_labeled_edge_arrays(tmp_path, content, numeric):
+    path = tmp_path / "graph.txt"
+    path.write_bytes(content.encode())
+    interner, src, dst = read_labeled_edge_arrays(str(path), chunk_size=8)
+    assert interner.numeric == numeric
+    expected = [tuple(line.split()) for line in content.splitlines() if line]
+    edges = [(str(interner.external(u)), str(interner.external(v))) for u, v in zip(src, dst)]
+    assert edges == expected
+
+def test_labeled_graph_articulation_points(tmp_path):
+    path = tmp_path / "graph.txt"
+    path.write_bytes(ASN_EDGES.encode())
+    g, interner = load_labeled_graph(str(path))
+    assert g.vertices() == [0, 1, 2, 3]
+    _, _, _, ap = articulation_dfs(g)
+    assert interner.externals(ap) == [64512]
+    # Avec la table existante, les indices déjà attribués sont conservés
+    before = list(interner.ids)
+    path.write_bytes(b"1 64512\n" + ASN_EDGES.encode())
+    g, merged = load_labeled_graph(str(path), interner)
+    assert merged.ids == before + [1]
+    assert (merged.code(64512), merged.code(1)) in g.edges()
@@ -0,0 +1,56 @@
+# tests/test_journal.py
+
+import networkx as nx
+import pytest
+from src.graph import Graph
+from src.dfs import articulation_dfs, count_children
+from src.updater import incremental_update_batch, register_vertices
+from src.journal import parse_journal_line, read_journal, append_journal, truncate_journal, net_changes
+
+def build_graph():
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4)]:
+        g.add_edge(u, v)
+    return g
+
+def test_parse_journal_line():
+    assert parse_journal_line("+ 1 2\n") == ("+", 1, 2)
+    assert parse_journal_line(b"- 3 4") == ("-", 3, 4)
+    assert parse_journal_line("   \n") is None
+    assert parse_journal_line("# commentaire") is None
+    with pytest.raises(ValueError, match="ligne 7"):
+        parse_journal_line("* 1 2", 7)
+
+def test_read_append_truncate(tmp_path):
+    path = str(tmp_path / "graph.journal")
+    assert read_journal(path) == []
+    append_journal(path, added=[(1, 5)], removed=[(0, 1)])
+    append_journal(path, added=[(5, 6)])
+    assert read_journal(path) == [("+", 1, 5), ("-", 0, 1), ("+", 5, 6)]
+    truncate_journal(path)
+    assert read_journal(path) == []
+
+def test_net_changes_keeps_last_effective_operation():
+    g = build_graph()
+    entries = [("+", 4, 0), ("-", 0, 4), ("+", 0, 4),   # ajout net de (0, 4)
+               ("-", 1, 2), ("+", 2, 1),                # sans effet
+               ("+", 3, 2), ("-", 9, 8), ("+", 5, 5)]   # déjà présente, absente, boucle
+    assert net_changes(entries, g) == ({(0, 4)}, set())
+    assert net_changes([("-", 2, 3)], g) == (set(), {(2, 3)})
+
+def test_journal_replay_matches_full_recompute(tmp_path):
+    g = build_graph()
+    disc, low, parent, ap = articulation_dfs(g)
+    children = count_children(parent)
+    path = str(tmp_path / "graph.journal")
+    append_journal(path, added=[(4, 5), (5, 3), (6, 0)], removed=[(2, 3)])
+    added, removed = net_changes(read_journal(path), g)
+    register_vertices(g, [w for edge in added for w in edge], disc, low, parent, children)
+    for u, v in added:
+        g.add_edge(u, v)
+    for u, v in removed:
+        g.remove_edge(u, v)
+    ap, _ = incremental_update_batch(g, added, removed, disc, low, parent, ap, children)
+    assert ap == set(nx.articulation_points(nx.Graph(g.edges())))
+    # Rejouer le même journal sur l'état actualisé est sans effet
+    assert net_changes(read_journal(path), g) == (set(), set())
@@ -0,0 +1,56 @@
+# tests/test_lca.py
+
+import random
+from src.graph import Graph
+from src.dfs import articulation_dfs
+from src.lca import AncestorIndex
+from src.updater import find_lca, incremental_update_batch
+
+def random_forest(n, seed):
+    """
+    Construit une forêt aléatoire : chaque nœud v > 0 est rattaché à un nœud précédent,
+    sauf quelques racines supplémentaires.
+    """
+    rng = random.Random(seed)
+    parent = {0: None}
+    for v in range(1, n):
+        parent[v] = None if rng.random() < 0.05 else rng.randrange(v)
+    return parent
+
+def naive_lca(x, y, parent):
+    ancestors = set()
+    while x is not None:
+        ancestors.add(x)
+        x = parent[x]
+    while y is not None and y not in ancestors:
+        y = parent[y]
+    return y
+
+def test_lca_matches_naive_on_random_forest():
+    parent = random_forest(300, seed=1)
+    index = AncestorIndex.build(parent)
+    rng = random.Random(2)
+    pairs = [(rng.randrange(300), rng.randrange(300)) for _ in range(500)]
+    assert index.lca_many(pairs) == [naive_lca(x, y, parent) for x, y in pairs]
+    for x, y in pairs:
+        assert index.is_ancestor(x, y) == (naive_lca(x, y, parent) == x)
+
+def test_lca_on_long_path():
+    n = 10000
+    parent = {0: None}
+    parent.update({v: v - 1 for v in range(1, n)})
+    index = AncestorIndex.build(parent)
+    assert index.depth[n - 1] == n - 1
+    assert index.lca(n - 1, 1234) == 1234
+    assert index.level_ancestor(n - 1, 17) == 17
+
+def test_index_is_repaired_by_batch_update():
+    g = Graph()
+    for v in range(1, 12):
+        g.add_edge(v - 1, v)
+    disc, low, parent, ap = articulation_dfs(g)
+    index = AncestorIndex.build(parent)
+    incremental_update_batch(g, [(2, 9), (0, 5)], [(6, 7)], disc, low, parent, ap, None, index)
+    rebuilt = AncestorIndex.build(parent)
+    assert index.depth == rebuilt.depth and index.jump == rebuilt.jump
+    assert index.lca(11, 3) == find_lca(11, 3, parent, disc)
@@ -0,0 +1,75 @@
+# tests/test_loader.py
+
+import gzip
+import pytest
+from src import loader
+from src.loader import read_edge_arrays, load_graph, load_csr_graph, write_binary_edges, convert_to_binary, detect_format, file_fingerprint
+
+CONTENT = "5 4\r\n0 1\r\n0 2\r\n\r\n1 3\r\n2 4\r\n"
+
+def write_text(tmp_path, content=CONTENT, name="graph.txt"):
+    path = tmp_path / name
+    path.write_bytes(content.encode())
+    return str(path)
+
+def test_read_edge_arrays_text(tmp_path):
+    num_vertices, src, dst = read_edge_arrays(write_text(tmp_path), chunk_size=4)
+    assert num_vertices == 5
+    assert list(zip(src.tolist(), dst.tolist())) == [(0, 1), (0, 2), (1, 3), (2, 4)]
+
+def test_load_graph_matches_file(tmp_path):
+    g = load_graph(write_text(tmp_path))
+    assert g.vertices() == [0, 1, 2, 3, 4]
+    assert g.edges() == [(0, 1), (0, 2), (1, 3), (2, 4)]
+
+def test_gzip_and_binary_formats(tmp_path):
+    gz_path = tmp_path / "graph.txt.gz"
+    with gzip.open(gz_path, "wb") as f:
+        f.write(CONTENT.encode())
+    assert detect_format(str(gz_path)) == "gzip"
+    bin_path = str(tmp_path / "graph.edges")
+    convert_to_binary(str(gz_path), bin_path)
+    assert detect_format(bin_path) == "binary"
+    expected = load_graph(write_text(tmp_path)).edges()
+    assert load_graph(str(gz_path)).edges() == expected
+    assert load_graph(bin_path).edges() == expected
+    assert load_csr_graph(bin_path).edges() == expected
+
+def test_write_binary_edges_empty(tmp_path):
+    path = str(tmp_path / "empty.edges")
+    write_binary_edges(path, 3, [], [])
+    assert load_graph(path).vertices() == [0, 1, 2]
+
+def test_header_validation(tmp_path):
+    with pytest.raises(ValueError):
+        read_edge_arrays(write_text(tmp_path, "5\n0 1\n"))
+    with pytest.raises(ValueError):
+        read_edge_arrays(write_text(tmp_path, "5 3\n0 1\n1 2\n"))
+    with pytest.raises(ValueError):
+        read_edge_arrays(write_text(tmp_path, "3 1\n0 3\n"))
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("content", ["2 2\n0 1 2\n1\n", "3 2\n0 1 2\n3\n", "2 1\n0\n1\n"])
+def test_malformed_edge_lines(tmp_path, monkeypatch, numpy, content):
+    # Le nombre total d'entiers est pair, mais une ligne n'en contient pas deux
+    if not numpy:
+        monkeypatch.setattr(loader, "np", None)
+    path = write_text(tmp_path, content)
+    with pytest.raises(ValueError, match="deux entiers"):
+        read_edge_arrays(path)
+    with pytest.raises(ValueError, match="deux entiers"):
+        load_graph(path)
+
+def test_blank_lines_only(tmp_path):
+    num_vertices, src, dst = read_edge_arrays(write_text(tmp_path, "2 0\n\n\r\n"), chunk_size=2)
+    assert num_vertices == 2 and len(src) == len(dst) == 0
+
+def test_empty_file(tmp_path):
+    assert load_graph(write_text(tmp_path, "")).vertices() == []
+
+def test_file_fingerprint(tmp_path):
+    path = write_text(tmp_path)
+    size, mtime_ns, digest = file_fingerprint(path, chunk_size=4)
+    assert size == len(CONTENT.encode())
+    assert file_fingerprint(path)[2] == digest
+    assert file_fingerprint(write_text(tmp_path, CONTENT.replace("1 3", "1 4"), "other.txt"))[2] != digest
@@ -0,0 +1,52 @@
+# tests/test_main.py
+
+import ast
+import os
+import shutil
+import subprocess
+import sys
+import pytest
+from src.dfs import articulation_dfs, find_articulation_points, find_bridges
+from src.loader import load_graph
+from src.state_manager import save_graph_state
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "data")
+
+def run_main(*args):
+    result = subprocess.run([sys.executable, os.path.join(ROOT, "src", "main.py"), *args],
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return result
+
+def results(stdout):
+    # Points d'articulation et ponts affichés (ligne qui suit chaque titre)
+    lines = stdout.splitlines()
+    ap = ast.literal_eval(lines[lines.index("Points d'articulation détectés :") + 1])
+    bridges = ast.literal_eval(lines[lines.index("Ponts détectés :") + 1])
+    return set(ap), sorted(bridges)
+
+@pytest.mark.parametrize("state_format", ["binary", "json"])
+def test_invalid_legacy_state_is_recomputed(tmp_path, state_format):
+    # L'état livré avec l'exemple contient l'arête transverse 14-21 : il n'est pas repris
+    shutil.copy(os.path.join(DATA_DIR, "example_graph.txt"), tmp_path / "g.txt")
+    shutil.copy(os.path.join(DATA_DIR, "example_graph.json"), tmp_path / "g.json")
+    graph_file = str(tmp_path / "g.txt")
+    g = load_graph(graph_file)
+    expected = (find_articulation_points(g), find_bridges(g))
+    for _ in range(2):
+        result = run_main(graph_file, "--state-format", state_format)
+        assert results(result.stdout) == expected
+
+def test_invalid_json_state_is_not_migrated(tmp_path):
+    # État JSON du format courant mais faux (valeur low) : recalculé au lieu d'être migré
+    shutil.copy(os.path.join(DATA_DIR, "example_graph.txt"), tmp_path / "g.txt")
+    graph_file = str(tmp_path / "g.txt")
+    g = load_graph(graph_file)
+    disc, low, parent, _ = articulation_dfs(g)
+    low[24] = 0
+    save_graph_state(g, disc, low, parent, str(tmp_path / "g.json"))
+    result = run_main(graph_file)
+    assert "ignoré" in result.stderr
+    assert results(result.stdout) == (find_articulation_points(g), find_bridges(g))
+    assert results(run_main(graph_file).stdout) == (find_articulation_points(g), find_bridges(g))
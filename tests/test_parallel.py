@@ -0,0 +1,32 @@
+# tests/test_parallel.py
+
+from src.graph import Graph, CSRGraph
+from src.dfs import articulation_dfs
+from src.parallel import connected_components, parallel_articulation_dfs
+
+def build_islands():
+    """
+    Construit trois îlots : un chemin 0-1-2-3, un triangle 4-5-6 avec la feuille 7,
+    et l'arête isolée 8-9.
+    """
+    edges = [(0, 1), (1, 2), (2, 3), (4, 5), (5, 6), (6, 4), (6, 7), (8, 9)]
+    return CSRGraph.from_edges(10, edges), edges
+
+def test_connected_components_union_find():
+    _, edges = build_islands()
+    label = connected_components(11, [u for u, _ in edges], [v for _, v in edges])
+    assert label == [0, 0, 0, 0, 4, 4, 4, 4, 8, 8, 10]
+
+def test_parallel_matches_sequential_numbering():
+    csr, _ = build_islands()
+    assert parallel_articulation_dfs(csr, workers=2, min_size=3) == articulation_dfs(csr)
+
+def test_parallel_on_graph_instance():
+    _, edges = build_islands()
+    g = Graph()
+    for u, v in edges:
+        g.add_edge(u, v)
+    disc, low, parent, ap = parallel_articulation_dfs(g, workers=2, min_size=2)
+    assert set(disc) == set(g.vertices())
+    assert sorted(disc.values()) == list(range(10))
+    assert ap == {1, 2, 6}
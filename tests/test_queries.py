@@ -0,0 +1,63 @@
+# tests/test_queries.py
+
+import io
+import json
+import networkx as nx
+import pytest
+from src.graph import Graph
+from src.dfs import articulation_dfs, subtree_sizes
+from src.queries import ImpactIndex, run_batch
+
+def build_graph():
+    # Triangle 0-1-2, chaîne 2-3-4 et 3-5, composante isolée 6-7
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (3, 5), (6, 7)]:
+        g.add_edge(u, v)
+    return g
+
+def build_index(g):
+    disc, low, parent, ap = articulation_dfs(g)
+    return ImpactIndex(disc, low, parent, ap)
+
+def test_subtree_sizes():
+    disc, _, parent, _ = articulation_dfs(build_graph())
+    size = subtree_sizes(disc, parent)
+    roots = [v for v, p in parent.items() if p is None]
+    assert sorted(size[r] for r in roots) == [2, 6]
+    assert size[4] == size[5] == 1
+
+def test_pieces_and_components():
+    index = build_index(build_graph())
+    assert index.is_articulation(3) and not index.is_articulation(0)
+    assert index.pieces(3) == [3, 1, 1]
+    assert index.components_after_removal(3) == 4
+    assert index.pieces(2) == [3, 2]
+    assert index.cut_off(2) == 2
+    assert index.pieces(0) == [5] and index.cut_off(0) == 0
+    assert index.components_after_removal(6) == 2
+
+def test_matches_networkx_after_removal():
+    g = build_graph()
+    index = build_index(g)
+    reference = nx.Graph(g.edges())
+    for v in g.vertices():
+        h = reference.copy()
+        h.remove_node(v)
+        assert index.components_after_removal(v) == nx.number_connected_components(h)
+
+def test_top_critical_and_unknown_vertex():
+    index = build_index(build_graph())
+    assert [r["vertex"] for r in index.top_critical(2)] == [3, 2]
+    with pytest.raises(ValueError):
+        index.pieces(42)
+
+def test_batch_queries():
+    index = build_index(build_graph())
+    out = io.StringIO()
+    errors = run_batch(index, io.StringIO("# requêtes\nis-ap 3\ncomponents 3\n\npieces 9\ntop 1\n"), out)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert errors == 1
+    assert lines[0] == {"query": "is-ap 3", "result": True}
+    assert lines[1]["result"] == 4
+    assert "error" in lines[2]
+    assert lines[3]["result"][0]["vertex"] == 3
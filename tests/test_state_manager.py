@@ -0,0 +1,176 @@
+# tests/test_state_manager.py
+
+import os
+import pytest
+from src.graph import Graph, CSRGraph
+from src.dfs import articulation_dfs, count_children
+from src.state_manager import save_graph_state, load_graph_state, get_dfs_state, get_articulation_state, get_ancestor_index, STATE_MAGIC
+from src.state_manager import read_state_fingerprint, update_state_fingerprint, graph_from_state
+from src.state_manager import load_state_arrays, state_arrays, articulation_state_from_arrays, StateCorruptedError, atomic_write
+from src.dfs import bridges_from_state
+from src.lca import AncestorIndex
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+def build_graph():
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4)]:
+        g.add_edge(u, v)
+    return g
+
+@pytest.mark.parametrize("filename", ["state.state", "state.json"])
+def test_save_and_load_round_trip(tmp_path, filename):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    path = str(tmp_path / filename)
+    save_graph_state(g, disc, low, parent, path)
+    state = load_graph_state(path)
+    assert state["format"] == ("json" if filename.endswith(".json") else "binary")
+    assert state["graph"]["edges"] == g.edges()
+    assert get_dfs_state(state) == (disc, low, parent)
+
+def test_binary_state_header_and_size(tmp_path):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    binary_path, json_path = str(tmp_path / "s.state"), str(tmp_path / "s.json")
+    save_graph_state(g, disc, low, parent, binary_path)
+    save_graph_state(g, disc, low, parent, json_path)
+    with open(binary_path, "rb") as f:
+        assert f.read(len(STATE_MAGIC)) == STATE_MAGIC
+    assert os.path.getsize(binary_path) < os.path.getsize(json_path)
+
+def test_binary_state_from_csr_graph(tmp_path):
+    csr = CSRGraph.from_graph(build_graph())
+    disc, low, parent, _ = articulation_dfs(csr)
+    path = str(tmp_path / "csr.state")
+    save_graph_state(csr, disc, low, parent, path)
+    assert get_dfs_state(load_graph_state(path)) == (disc, low, parent)
+
+def test_legacy_json_state_is_readable():
+    state = load_graph_state(os.path.join(DATA_DIR, "example_graph40.json"))
+    disc, low, parent = get_dfs_state(state)
+    assert set(disc) == set(state["graph"]["vertices"])
+    assert all(isinstance(k, int) for k in parent)
+    assert all(isinstance(edge, tuple) for edge in state["graph"]["edges"])
+
+@pytest.mark.parametrize("name", ["example_graph.json", "example_graph_BarabasiAlbert.json",
+                                  "example_graph_CAIDA.json", "example_graph_KarateClub.json"])
+def test_invalid_legacy_json_state_is_ignored(capsys, name):
+    # Arête transverse ou valeurs low fausses : l'état n'est pas celui d'un DFS de son graphe
+    assert load_graph_state(os.path.join(DATA_DIR, name)) is None
+    assert "pas celui d'un DFS" in capsys.readouterr().err
+
+def test_missing_state_returns_none(tmp_path):
+    assert load_graph_state(str(tmp_path / "absent.state")) is None
+
+@pytest.mark.parametrize("filename", ["state.state", "state.json"])
+def test_articulation_state_is_persisted(tmp_path, filename):
+    g = build_graph()
+    disc, low, parent, ap = articulation_dfs(g)
+    path = str(tmp_path / filename)
+    save_graph_state(g, disc, low, parent, path, ap, count_children(parent))
+    assert get_articulation_state(load_graph_state(path)) == ({2, 3}, count_children(parent))
+
+@pytest.mark.parametrize("filename", ["state.state", "state.json"])
+def test_ancestor_index_is_persisted(tmp_path, filename):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    path = str(tmp_path / filename)
+    save_graph_state(g, disc, low, parent, path)
+    index = get_ancestor_index(load_graph_state(path))
+    rebuilt = AncestorIndex.build(parent)
+    assert index.depth == rebuilt.depth and index.jump == rebuilt.jump
+    assert index.lca(4, 1) == 1
+
+def test_legacy_state_rebuilds_ancestor_index():
+    state = load_graph_state(os.path.join(DATA_DIR, "example_graph40.json"))
+    index = get_ancestor_index(state)
+    assert set(index.depth) == set(state["graph"]["vertices"])
+
+def test_fingerprint_round_trip(tmp_path):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    path = str(tmp_path / "state.state")
+    save_graph_state(g, disc, low, parent, path)
+    assert read_state_fingerprint(path) is None
+    fingerprint = (123, 456, bytes(range(16)))
+    save_graph_state(g, disc, low, parent, path, fingerprint=fingerprint)
+    assert read_state_fingerprint(path) == fingerprint
+    assert load_graph_state(path)["fingerprint"] == fingerprint
+    update_state_fingerprint(path, (123, 789, bytes(range(16))))
+    state = load_graph_state(path)
+    assert state["fingerprint"] == (123, 789, bytes(range(16)))
+    assert get_dfs_state(state) == (disc, low, parent)
+
+def test_json_state_keeps_fingerprint_but_has_no_fast_path(tmp_path):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    path = str(tmp_path / "state.json")
+    fingerprint = (1, 2, b"\x01" * 16)
+    save_graph_state(g, disc, low, parent, path, fingerprint=fingerprint)
+    assert load_graph_state(path)["fingerprint"] == fingerprint
+    assert read_state_fingerprint(path) is None
+
+def test_graph_from_state(tmp_path):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    path = str(tmp_path / "state.state")
+    save_graph_state(g, disc, low, parent, path)
+    restored = graph_from_state(load_graph_state(path))
+    assert restored.vertices() == g.vertices()
+    assert restored.edges() == g.edges()
+
+@pytest.mark.parametrize("filename", ["state.state", "state.json"])
+def test_articulation_state_from_arrays(tmp_path, filename):
+    # Identifiants non contigus et dans le désordre : les parents sont ramenés à des positions
+    g = Graph()
+    for u, v in [(40, 7), (7, 12), (12, 40), (12, 3), (3, 99), (5, 6)]:
+        g.add_edge(u, v)
+    disc, low, parent, ap = articulation_dfs(g)
+    path = str(tmp_path / filename)
+    save_graph_state(g, disc, low, parent, path, ap)
+    state = load_graph_state(path)
+    assert articulation_state_from_arrays(state_arrays(state)) == (ap, bridges_from_state(disc, low, parent))
+    if filename.endswith(".state"):
+        arrays = load_state_arrays(path)
+        assert (arrays["num_vertices"], arrays["num_edges"]) == (7, 6)
+        assert articulation_state_from_arrays(arrays) == (ap, bridges_from_state(disc, low, parent))
+
+@pytest.mark.parametrize("filename", ["state.state", "state.json"])
+def test_corrupted_state_is_ignored(tmp_path, filename, capsys):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    path = tmp_path / filename
+    save_graph_state(g, disc, low, parent, str(path))
+    data = bytearray(path.read_bytes())
+    data[-3] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert load_graph_state(str(path)) is None
+    assert "ignoré" in capsys.readouterr().err
+    path.write_bytes(bytes(data[:len(data) // 2]))
+    assert load_graph_state(str(path)) is None
+
+def test_load_state_arrays_reads_only_requested_sections(tmp_path):
+    g = build_graph()
+    disc, low, parent, _ = articulation_dfs(g)
+    path = tmp_path / "state.state"
+    save_graph_state(g, disc, low, parent, str(path))
+    # Une arête corrompue n'empêche pas de lire les sections des sommets
+    data = bytearray(path.read_bytes())
+    data[-len(g.vertices()) - 1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    arrays = load_state_arrays(str(path), ("vertices", "disc", "low", "parent"))
+    assert "edges" not in arrays
+    assert articulation_state_from_arrays(arrays) == ({2, 3}, [(2, 3), (3, 4)])
+    with pytest.raises(StateCorruptedError):
+        load_state_arrays(str(path))
+
+def test_atomic_write_keeps_previous_version(tmp_path):
+    path = tmp_path / "state.state"
+    path.write_bytes(b"ancien")
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path)) as f:
+            f.write(b"nouv")
+            raise RuntimeError("interruption")
+    assert path.read_bytes() == b"ancien"
+    assert os.listdir(tmp_path) == ["state.state"]
@@ -0,0 +1,133 @@
+# tests/test_updater.py
+
+from src.graph import CSRGraph, Graph
+from src.dfs import articulation_dfs, find_articulation_points, count_children
+from src.updater import advanced_incremental_update_edge_addition, incremental_update_edge_removal, incremental_update_batch
+
+def ap_from_state(disc, low, parent):
+    """
+    Dérive les points d'articulation à partir de l'état DFS (disc, low, parent).
+    """
+    ap = set()
+    root_children = {}
+    for v, p in parent.items():
+        if p is None:
+            continue
+        if parent[p] is None:
+            root_children[p] = root_children.get(p, 0) + 1
+        elif low[v] >= disc[p]:
+            ap.add(p)
+    ap.update(r for r, count in root_children.items() if count > 1)
+    return ap
+
+def build_two_branch_tree():
+    """
+    Construit un arbre : 0 - 1 - 2 - 3 et 1 - 4 - 5.
+    """
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 3), (1, 4), (4, 5)]:
+        g.add_edge(u, v)
+    return g
+
+def test_incremental_addition_between_branches():
+    g = build_two_branch_tree()
+    disc, low, parent, _ = articulation_dfs(g, roots=[0])
+    g.add_edge(3, 5)
+    ap, updated_nodes = advanced_incremental_update_edge_addition(g, 3, 5, disc, low, parent)
+    assert set(ap) == find_articulation_points(g) == {1}
+    assert ap_from_state(disc, low, parent) == {1}
+    assert set(updated_nodes) == {1, 2, 3, 4, 5}
+
+def test_incremental_addition_deep_path():
+    g = Graph()
+    n = 5000
+    for i in range(n - 1):
+        g.add_edge(i, i + 1)
+    disc, low, parent, _ = articulation_dfs(g, roots=[0])
+    g.add_edge(10, n - 1)
+    ap, _ = advanced_incremental_update_edge_addition(g, 10, n - 1, disc, low, parent)
+    assert ap_from_state(disc, low, parent) == find_articulation_points(g) == set(range(1, 11))
+
+def test_incremental_addition_on_csr_graph():
+    g = build_two_branch_tree()
+    disc, low, parent, _ = articulation_dfs(CSRGraph.from_graph(g), roots=[0])
+    g.add_edge(3, 5)
+    csr = CSRGraph.from_graph(g)
+    ap, _ = advanced_incremental_update_edge_addition(csr, 3, 5, disc, low, parent)
+    assert ap_from_state(disc, low, parent) == set(ap) == {1}
+
+def build_cycle_with_tail():
+    """
+    Construit un cycle 0-1-2-3-0 prolongé par la queue 3-4.
+    """
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 3), (3, 0), (3, 4)]:
+        g.add_edge(u, v)
+    return g
+
+def test_incremental_removal_back_edge():
+    g = build_cycle_with_tail()
+    disc, low, parent, _ = articulation_dfs(g, roots=[0])
+    back_edge = next((u, v) for u, v in g.edges() if parent[u] != v and parent[v] != u)
+    g.remove_edge(*back_edge)
+    ap, updated_nodes = incremental_update_edge_removal(g, back_edge[0], back_edge[1], disc, low, parent)
+    assert ap_from_state(disc, low, parent) == find_articulation_points(g) == set(ap)
+    assert len(updated_nodes) < len(g.vertices())
+
+def test_incremental_removal_tree_edge_reroots_subtree():
+    g = build_cycle_with_tail()
+    disc, low, parent, _ = articulation_dfs(g, roots=[0])
+    child = next(v for v in g.neighbors(0) if parent[v] == 0)
+    g.remove_edge(0, child)
+    ap, updated_nodes = incremental_update_edge_removal(g, 0, child, disc, low, parent)
+    assert ap_from_state(disc, low, parent) == find_articulation_points(g) == set(ap)
+    assert len(set(disc.values())) == len(disc)
+
+def test_incremental_removal_disconnects_component():
+    g = build_two_branch_tree()
+    disc, low, parent, _ = articulation_dfs(g, roots=[0])
+    g.remove_edge(1, 4)
+    ap, updated_nodes = incremental_update_edge_removal(g, 1, 4, disc, low, parent)
+    assert parent[4] is None
+    assert ap_from_state(disc, low, parent) == find_articulation_points(g) == {1, 2}
+
+def test_incremental_batch_mixed_changes():
+    g = Graph()
+    n = 12
+    for i in range(n - 1):
+        g.add_edge(i, i + 1)
+    g.add_edge(0, 5)
+    g.add_edge(20, 21)
+    disc, low, parent, _ = articulation_dfs(g)
+    added = [(3, 9), (11, 20), (6, 8)]
+    removed = [(0, 5), (9, 10)]
+    for u, v in added:
+        g.add_edge(u, v)
+    for u, v in removed:
+        g.remove_edge(u, v)
+    ap, updated_nodes = incremental_update_batch(g, added, removed, disc, low, parent)
+    assert ap_from_state(disc, low, parent) == find_articulation_points(g) == set(ap)
+    assert len(set(disc.values())) == len(disc)
+
+def test_incremental_batch_back_edges_only_touch_paths():
+    g = Graph()
+    n = 1000
+    for i in range(n - 1):
+        g.add_edge(i, i + 1)
+    disc, low, parent, _ = articulation_dfs(g, roots=[0])
+    added = [(n - 10, n - 1), (n - 30, n - 20)]
+    for u, v in added:
+        g.add_edge(u, v)
+    ap, updated_nodes = incremental_update_batch(g, added, [], disc, low, parent)
+    assert ap_from_state(disc, low, parent) == find_articulation_points(g)
+    assert len(updated_nodes) < 50
+
+def test_incremental_batch_updates_persisted_ap_in_place():
+    g = build_two_branch_tree()
+    disc, low, parent, ap = articulation_dfs(g, roots=[0])
+    children = count_children(parent)
+    g.add_edge(0, 5)
+    result, updated_nodes = incremental_update_batch(g, [(0, 5)], [], disc, low, parent, ap, children)
+    assert result is ap
+    assert ap == find_articulation_points(g) == {1, 2}
+    assert children == count_children(parent)
@@ -0,0 +1,121 @@
+# tests/test_verification.py
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+from src.graph import Graph
+from src.dfs import articulation_dfs, count_children, low_from_tree
+from src.dfs_state import DFSState
+from src.verification import ShadowVerifier, take_snapshot, check_snapshot
+from src.daemon import GraphDaemon
+from src.loader import load_graph
+from src.state_manager import save_graph_state
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def path_graph(n):
+    g = Graph()
+    for v in range(n - 1):
+        g.add_edge(v, v + 1)
+    return g
+
+def state_of(g):
+    disc, low, parent, ap = articulation_dfs(g)
+    return DFSState.from_dicts(g.vertices(), disc, low, parent, ap, count_children(parent))
+
+def test_low_from_tree_matches_full_dfs():
+    g = path_graph(6)
+    g.add_edge(0, 3)
+    disc, low, parent, _ = articulation_dfs(g)
+    assert low_from_tree(g, disc, parent) == low
+
+def test_check_snapshot_reports_divergences():
+    g = path_graph(5)
+    state = state_of(g)
+    assert check_snapshot(take_snapshot(g, state))["ok"]
+    state.ap.discard(2)
+    state.low[3] = 0
+    report = check_snapshot(take_snapshot(g, state))
+    assert not report["ok"] and report["missing_ap"] == [2] and report["extra_ap"] == []
+    assert report["low_mismatches"] == 1 and report["low_sample"] == [[3, 0, 3]]
+    assert report["fresh"][3] == {1, 2, 3}
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_divergence_is_recorded_with_triggering_edges(tmp_path, mode):
+    g = path_graph(5)
+    state = state_of(g)
+    repairs = []
+    log_file = str(tmp_path / "divergences.jsonl")
+    verifier = ShadowVerifier(every=2, mode=mode, log_file=log_file,
+                              repair=lambda version, fresh: repairs.append((version, fresh[3])))
+    assert not verifier.observe(g, state, added=[(0, 1)], version=1)
+    state.ap.add(0)  # État volontairement faux
+    assert verifier.observe(g, state, removed=[(3, 4)], version=2)
+    verifier.close()
+    assert repairs == [(2, {1, 2, 3})]
+    with open(log_file) as f:
+        record = json.loads(f.readline())
+    assert record["extra_ap"] == [0] and record["version"] == 2 and record["repaired"]
+    assert [c["added"] for c in record["changes"]] == [[[0, 1]], []]
+    assert verifier.stats() == {"updates": 2, "checks": 1, "skipped": 0, "errors": 0,
+                                "divergences": 1, "pending": 0}
+
+def test_daemon_repairs_diverging_state(tmp_path):
+    path = tmp_path / "g.txt"
+    path.write_text("6 5\n0 1\n1 2\n2 3\n3 4\n4 5\n")
+    verifier = ShadowVerifier(every=1)
+    daemon = GraphDaemon(str(path), verifier=verifier)
+    daemon.apply_changes(added=[(0, 2)])
+    verifier.wait()
+    assert verifier.stats()["divergences"] == 0
+    daemon.state.ap_flags[0] = 1  # Corruption de l'état résident
+    daemon.apply_changes(added=[(3, 5)])
+    verifier.wait()
+    assert verifier.stats()["divergences"] == 1
+    assert daemon.articulation_points() == [2, 3]
+    assert daemon.stats()["verification"]["checks"] == 2
+    daemon.stop()
+
+def edited_edge_file(tmp_path):
+    # Fichier d'arêtes d'exemple auquel une arête a été ajoutée
+    with open(os.path.join(ROOT, "data", "example_graph.txt")) as f:
+        lines = f.read().splitlines()
+    n, m = map(int, lines[0].split())
+    path = tmp_path / "g.txt"
+    path.write_text("\n".join([f"{n} {m + 1}"] + lines[1:] + ["19 20"]) + "\n")
+    return str(path)
+
+def run_main(*args):
+    result = subprocess.run([sys.executable, os.path.join(ROOT, "src", "main.py"), *args],
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+@pytest.mark.parametrize("state_format", ["binary", "json"])
+def test_cli_verifies_legacy_json_state(tmp_path, state_format):
+    # État JSON de l'ancien format : dictionnaires indexés par sommet, sans points d'articulation
+    g = load_graph(os.path.join(ROOT, "data", "example_graph.txt"))
+    disc, low, parent, _ = articulation_dfs(g)
+    legacy = {"graph": {"vertices": g.vertices(), "edges": g.edges()},
+              "dfs_state": {"disc": disc, "low": low, "parent": parent}}
+    (tmp_path / "g.json").write_text(json.dumps(legacy))
+    graph_file = edited_edge_file(tmp_path)
+    out = run_main(graph_file, "--verify-rate", "1", "--state-format", state_format)
+    assert "état incrémental conforme" in out
+    assert str(sorted(articulation_dfs(load_graph(graph_file))[3])) in out
+
+def test_cli_repaired_state_keeps_fingerprint(tmp_path):
+    # État binaire corrompu (valeur low fausse loin de l'arête ajoutée) : divergence
+    g = load_graph(os.path.join(ROOT, "data", "example_graph.txt"))
+    disc, low, parent, _ = articulation_dfs(g)
+    low[24] = 0
+    save_graph_state(g, disc, low, parent, str(tmp_path / "g.state"))
+    graph_file = edited_edge_file(tmp_path)
+    out = run_main(graph_file, "--verify-rate", "1")
+    assert "état réparé par un DFS complet" in out
+    expected = str(sorted(articulation_dfs(load_graph(graph_file))[3]))
+    assert expected in out.split("Points d'articulation corrects :")[1]
+    out = run_main(graph_file)
+    assert "inchangé depuis la dernière sauvegarde" in out and expected in out
@@ -0,0 +1,54 @@
+# tests/test_visualize.py
+
+from src.graph import Graph
+from src.dfs import find_articulation_points, biconnected_dfs
+from src.visualize import (compute_layout, load_layout, full_view, block_cut_view, neighborhood_view,
+                           choose_view, render_graph)
+
+def build_graph():
+    g = Graph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 3), (5, 6)]:
+        g.add_edge(u, v)
+    return g
+
+def test_layout_cache_is_reused_and_extended(tmp_path):
+    cache = str(tmp_path / "g.layout.json")
+    g, _, _ = full_view(build_graph(), set(), set())
+    first = compute_layout(g, cache)
+    fingerprint, cached = load_layout(cache)
+    assert cached == first
+    assert compute_layout(g, cache) == first
+    # Graphe modifié : nouvelle empreinte, positions reprises pour les nœuds connus
+    g.add_edge(6, 7)
+    second = compute_layout(g, cache)
+    assert set(second) == set(g)
+    assert load_layout(cache)[0] != fingerprint
+
+def test_block_cut_view_condenses_blocks():
+    graph = build_graph()
+    ap = find_articulation_points(graph)
+    g, colors, _ = block_cut_view(graph, ap, {4})
+    blocks = [v for v in g if isinstance(v, str)]
+    assert len(blocks) == 4
+    assert set(g) - set(blocks) == ap
+    assert sum(colors[b] == "yellow" for b in blocks) == 1
+    # Points d'articulation de l'appelant gardés, composantes fournies
+    edge_component = biconnected_dfs(graph)[5]
+    g, colors, _ = block_cut_view(graph, {3}, set(), edge_component)
+    assert set(g) - {v for v in g if isinstance(v, str)} == {3}
+
+def test_neighborhood_view_and_auto_choice():
+    graph = build_graph()
+    g, _, _ = neighborhood_view(graph, set(), {6}, hops=1)
+    assert set(g) == {5, 6}
+    g, _, _ = neighborhood_view(graph, set(), {6}, hops=2)
+    assert set(g) == {3, 4, 5, 6}
+    assert choose_view("auto", graph, set()) == "full"
+    assert choose_view("block-cut", graph, set()) == "block-cut"
+
+def test_headless_render(tmp_path):
+    graph = build_graph()
+    output = tmp_path / "graph.png"
+    view = render_graph(graph, find_articulation_points(graph), [4], output=str(output), view="block-cut")
+    assert view == "block-cut"
+    assert output.stat().st_size > 0